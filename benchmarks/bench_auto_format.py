@@ -0,0 +1,127 @@
+"""Compare ``auto_format_text`` with the previous multi-pass implementation.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_auto_format [--mb 2] [--pdf Data/paper/report.pdf]
+
+Without ``--pdf`` a synthetic Korean/English report is generated. Both
+implementations must produce identical output; time and peak traced memory
+are reported for each.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import time
+import tracemalloc
+from typing import Callable, Iterable, List
+
+from src.markdown_utils import auto_format_text
+
+
+def _legacy_clean_lines(raw_text: str) -> List[str]:
+    text = raw_text.replace("\r", "\n")
+    text = re.sub(r"\u00a0", " ", text)
+    lines = [line.strip() for line in text.splitlines()]
+    return [line for line in lines if line]
+
+
+def _legacy_chunk_sentences(sentences: Iterable[str], chunk_size: int = 3) -> List[str]:
+    paragraphs: List[str] = []
+    current: List[str] = []
+    for sentence in sentences:
+        if not sentence:
+            continue
+        current.append(sentence.strip())
+        if len(current) >= chunk_size:
+            paragraphs.append(" ".join(current))
+            current = []
+    if current:
+        paragraphs.append(" ".join(current))
+    return paragraphs
+
+
+def legacy_auto_format_text(raw_text: str) -> str:
+    lines = _legacy_clean_lines(raw_text)
+    if not lines:
+        return ""
+    bullet_lines = [line.lstrip("▪").strip() for line in lines if line.startswith("▪")]
+    other_lines = [line for line in lines if not line.startswith("▪")]
+    joined = " ".join(other_lines)
+    joined = re.sub(r"\s+", " ", joined)
+    joined = re.sub(r"(\d)\s+(\d)", r"\1\2", joined)
+    sentences = re.split(r"(?<=[.!?])\s+(?=[A-Za-z가-힣0-9])", joined)
+    paragraphs = _legacy_chunk_sentences(sentences, chunk_size=3)
+    parts: List[str] = []
+    if bullet_lines:
+        parts.append("## 핵심 요약")
+        for bullet in bullet_lines[:8]:
+            parts.append(f"- {bullet}")
+        parts.append("")
+    if paragraphs:
+        parts.append("## 상세 내용")
+        for paragraph in paragraphs:
+            parts.append(paragraph)
+    formatted = "\n\n".join(part.strip() for part in parts if part.strip())
+    return formatted.strip()
+
+
+WORDS = ["한국", "사회", "데이터", "분석", "결과", "정책", "2021", "3 4", "증가", "감소", "trend", "OECD", "1 2 3"]
+
+
+def synthetic_text(size: int, seed: int = 7) -> str:
+    rng = random.Random(seed)
+    lines: List[str] = []
+    total = 0
+    while total < size:
+        if rng.random() < 0.03:
+            line = "▪ " + " ".join(rng.choices(WORDS, k=6))
+        else:
+            words = rng.choices(WORDS, k=rng.randint(4, 14))
+            line = "  ".join(words) + rng.choice([".", "", "", "!", "?", ". 12"])
+        lines.append(line)
+        total += len(line.encode("utf-8")) + 1
+    return "\n".join(lines)
+
+
+def measure(func: Callable[[str], str], text: str, repeat: int = 3) -> tuple[str, float, int]:
+    """Output, best wall time of ``repeat`` runs, and peak traced memory of one more run."""
+    elapsed = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(text)
+        elapsed = min(elapsed, time.perf_counter() - started)
+    tracemalloc.start()
+    func(text)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mb", type=float, default=2.0, help="synthetic input size in MB")
+    parser.add_argument("--pdf", help="use the text of this PDF (repeated up to --mb)")
+    args = parser.parse_args()
+
+    size = int(args.mb * 1024 * 1024)
+    if args.pdf:
+        from src.workspace_data import extract_pdf_text
+
+        base = extract_pdf_text(args.pdf)
+        text = "\n".join([base] * max(1, size // max(len(base.encode("utf-8")), 1) + 1))
+    else:
+        text = synthetic_text(size)
+    print(f"input: {len(text.encode('utf-8')) / 1024 / 1024:.2f} MB, {text.count(chr(10)) + 1} lines")
+
+    legacy, legacy_time, legacy_peak = measure(legacy_auto_format_text, text)
+    current, current_time, current_peak = measure(auto_format_text, text)
+    if legacy != current:
+        raise SystemExit("outputs differ")
+    for label, elapsed, peak in (("legacy", legacy_time, legacy_peak), ("streaming", current_time, current_peak)):
+        print(f"{label:>9}: {elapsed * 1000:8.1f} ms, peak {peak / 1024 / 1024:7.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
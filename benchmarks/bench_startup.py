@@ -0,0 +1,109 @@
+"""Import cost of each Streamlit entry point.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_startup [--repeat 5] [--top 8]
+
+Only an app's top-level imports run, in a fresh interpreter per repeat, so
+the timing is what a new server process pays before the script's first
+Streamlit call. ``-X importtime`` supplies the modules with the largest
+cumulative import time, which usually names the culprit behind a regression.
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import statistics
+import subprocess
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+APPS = ("app.py", "admin_app.py", "visual_app.py", "embed_app.py")
+
+_PROBE = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+exec(compile({source!r}, {name!r}, "exec"), {{"__name__": "__bench__"}})
+print(json.dumps({{"seconds": time.perf_counter() - start, "modules": len(sys.modules)}}))
+"""
+
+
+def import_block(path: Path) -> str:
+    """Source of the module-level import statements of ``path``, in order."""
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    imports = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    return "\n".join(ast.unparse(node) for node in imports)
+
+
+def _run(name: str, source: str, *, importtime: bool = False) -> subprocess.CompletedProcess:
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += ["-c", _PROBE.format(root=str(ROOT), source=source, name=name)]
+    return subprocess.run(command, check=True, capture_output=True, text=True, cwd=ROOT)
+
+
+def _importtimes(stderr: str) -> Dict[str, float]:
+    # Lines look like "import time:  self [us] | cumulative | imported package",
+    # with the package name indented two more spaces per nesting level.
+    cumulative: Dict[str, float] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:") :].split("|")
+        # Outermost imports only: their cumulative time covers what they pull in.
+        if name.startswith("  "):
+            continue
+        cumulative[name.strip()] = int(cumulative_us) / 1000
+    return cumulative
+
+
+@lru_cache(maxsize=1)
+def _interpreter_modules() -> frozenset:
+    # Imported by the interpreter itself (site, encodings, ...) before any app code.
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", "pass"], check=True, capture_output=True, text=True).stderr
+    return frozenset(_importtimes(stderr))
+
+
+def _slowest(stderr: str, top: int) -> List[Tuple[str, float]]:
+    baseline = _interpreter_modules()
+    cumulative = {name: ms for name, ms in _importtimes(stderr).items() if name not in baseline}
+    return sorted(cumulative.items(), key=lambda item: -item[1])[:top]
+
+
+def measure(app: str, repeat: int, top: int) -> Dict[str, object]:
+    source = import_block(ROOT / app)
+    timings: List[float] = []
+    modules = 0
+    for _ in range(repeat):
+        result = json.loads(_run(app, source).stdout.strip().splitlines()[-1])
+        timings.append(result["seconds"])
+        modules = result["modules"]
+    slowest = _slowest(_run(app, source, importtime=True).stderr, top)
+    return {"median": statistics.median(timings), "best": min(timings), "modules": modules, "slowest": slowest}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8, help="slowest top-level imports to list per app")
+    parser.add_argument("apps", nargs="*", default=list(APPS))
+    args = parser.parse_args()
+
+    for app in args.apps:
+        result = measure(app, args.repeat, args.top)
+        print(
+            f"{app:<16} median {result['median'] * 1000:7.1f} ms  best {result['best'] * 1000:7.1f} ms"
+            f"  modules {result['modules']}"
+        )
+        for name, ms in result["slowest"]:
+            print(f"    {name:<40} {ms:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
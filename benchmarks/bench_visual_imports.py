@@ -0,0 +1,73 @@
+"""Cold-start cost of the story renderer registry.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_visual_imports [--repeat 5]
+
+Every scenario runs in a fresh interpreter, so each timing includes the
+imports it triggers. Heavy modules loaded by the scenario are listed so a
+regression (say, ``visual_registry`` pulling in plotly) is easy to spot.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+HEAVY_MODULES = ("numpy", "pandas", "plotly.graph_objects", "plotly.subplots", "openpyxl", "PIL", "streamlit")
+
+SCENARIOS: Dict[str, str] = {
+    "list renderer names": "from src.visual_registry import renderer_names; renderer_names()",
+    "import visual_runtime": "import src.visual_runtime",
+    "one education figure": (
+        "from src.visual_registry import get_renderer; get_renderer('education_care_fig01')"
+    ),
+    "one politics figure": (
+        "from src.visual_registry import get_renderer; get_renderer('politics_civic_fig01')"
+    ),
+    "custom_visuals (all modules)": "import src.custom_visuals",
+}
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "loaded": [name for name in {heavy!r} if name in sys.modules]}}))
+"""
+
+
+def measure(statement: str, repeat: int) -> Dict[str, object]:
+    timings: List[float] = []
+    loaded: List[str] = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(statement=statement, heavy=HEAVY_MODULES)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        timings.append(result["seconds"])
+        loaded = result["loaded"]
+    return {"median": statistics.median(timings), "best": min(timings), "loaded": loaded}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for label, statement in SCENARIOS.items():
+        result = measure(statement, args.repeat)
+        print(
+            f"{label:<30} median {result['median'] * 1000:7.1f} ms  best {result['best'] * 1000:7.1f} ms"
+            f"  loads: {', '.join(result['loaded']) or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@ from __future__ import annotations
 import streamlit as st
 from plotly.io import to_html
 
-from src.custom_visuals import covid_section2_chart, covid_section3_chart
+from src.visuals_covid import covid_section2_chart, covid_section3_chart
 from src.styles import global_css
 
 st.set_page_config(
@@ -0,0 +1,129 @@
+"""Seed stories from every ``StoryTemplate`` whose PDF and workbook are present.
+
+Run from the repository root::
+
+    python -m src.batch_generate [--curated] [--dry-run]
+
+PDFs are extracted one after another, each fanning its uncached pages out to
+the page-extraction process pool (``EDA_PDF_WORKERS``), so the machine never
+runs more than one pool at a time. Texts are formatted with ``auto_format_text``,
+and every template's chart is built once through ``chart_runtime`` so a
+broken ``chart_meta`` is reported before anything is written. All stories
+are then saved in a single store transaction.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+from .chart_runtime import build_figure_from_meta
+from .generated_content import save_stories
+from .markdown_utils import auto_format_text
+from .story_templates import StoryTemplate, available_templates
+from .workspace_data import available_papers, available_workbooks, extract_pdf_text
+
+
+@dataclass
+class _Job:
+    template: StoryTemplate
+    pdf_path: Any
+    text: str = ""
+    markdown: str = ""
+    chart_error: Optional[str] = None
+    error: Optional[str] = None
+
+
+@contextmanager
+def _stage(timings: Dict[str, float], name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = time.perf_counter() - start
+
+
+def _discover() -> List[_Job]:
+    try:
+        pdfs = available_papers()
+        workbooks = available_workbooks()
+    except FileNotFoundError as exc:
+        print(f"데이터 폴더를 찾을 수 없습니다: {exc}", file=sys.stderr)
+        return []
+    return [_Job(template, template.find_pdf_path(pdfs)) for template in available_templates(pdfs, workbooks)]
+
+
+def _extract(job: _Job) -> None:
+    try:
+        job.text = extract_pdf_text(str(job.pdf_path))
+    except Exception as exc:  # pragma: no cover - runtime diagnostics
+        job.error = f"PDF 추출 실패: {exc}"
+
+
+def _payload(job: _Job, *, curated: bool) -> Dict[str, Any]:
+    template = job.template
+    return {
+        "title": template.default_title,
+        "markdown": template.markdown if curated or not job.markdown else job.markdown,
+        "format": "markdown",
+        "pdf_source": template.pdf_filename,
+        "chart": dict(template.chart_meta),
+        "template": template.template_id,
+    }
+
+
+def run(*, curated: bool = False, dry_run: bool = False) -> int:
+    timings: Dict[str, float] = {}
+    total_start = time.perf_counter()
+
+    with _stage(timings, "discover"):
+        jobs = _discover()
+    if not jobs:
+        print("생성할 템플릿이 없습니다. Data/paper 와 Data/excel_data 를 확인하세요.")
+        return 1
+
+    with _stage(timings, "extract"):
+        for job in jobs:
+            _extract(job)
+
+    with _stage(timings, "format"):
+        for job in jobs:
+            if job.error is None:
+                job.markdown = auto_format_text(job.text)
+
+    with _stage(timings, "charts"):
+        for job in jobs:
+            _, job.chart_error = build_figure_from_meta(dict(job.template.chart_meta))
+
+    ready = [job for job in jobs if job.error is None]
+    with _stage(timings, "write"):
+        if ready and not dry_run:
+            save_stories({job.template.template_id: _payload(job, curated=curated) for job in ready})
+    timings["total"] = time.perf_counter() - total_start
+
+    for job in jobs:
+        if job.error:
+            status = job.error
+        elif job.chart_error:
+            status = f"저장 (차트 오류: {job.chart_error})"
+        else:
+            status = "저장" if not dry_run else "확인"
+        print(f"- {job.template.template_id}: {len(job.text):,}자 · {status}")
+    for name, seconds in timings.items():
+        print(f"{name:>9}: {seconds * 1000:8.1f} ms")
+    return 0 if ready else 1
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--curated", action="store_true", help="use the template's curated markdown as the body")
+    parser.add_argument("--dry-run", action="store_true", help="run every stage except the final write")
+    args = parser.parse_args(argv)
+    return run(curated=args.curated, dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,97 +1,489 @@
 import json
-import re
-from functools import lru_cache
+import os
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from .data import LABELS_BY_KEY
+from .fuzzy import Corrector
+from .search_index import NgramIndex, SentenceIndex, bigram_terms, file_signature, ngram_terms, query_pattern
+from .search_rank import BM25FRanker, query_rank_terms, rank_terms
+from .typeahead import PrefixIndex, Suggestion
 
 BASE = Path("content")
 INDEX = BASE / "index.json"
+SEARCH_INDEX_PATH = BASE / ".search_index.json"
+SEARCH_RANK_PATH = BASE / ".search_rank.npz"
+SEARCH_SENTENCES_PATH = BASE / ".search_sentences.json"
+SEARCH_FIELDS = ("title", "summary", "body")
+SEARCH_FIELD_WEIGHTS = {"title": 3.0, "summary": 2.0, "body": 1.0}
+SEARCH_FIELD_B = {"title": 0.5, "summary": 0.6, "body": 0.75}
+# Jamo bigrams let partially typed syllables ("교ㅇ") match "교육".
+SEARCH_JAMO = os.environ.get("EDA_SEARCH_JAMO", "1").strip() != "0"
+# How often (seconds) the search index re-stats index.json and body files.
+SEARCH_INDEX_CHECK_INTERVAL = 2.0
+BODY_CACHE_SIZE = 64
+# Below this many exact hits, search_contents also tries a typo-corrected query.
+FUZZY_MIN_HITS = 2
+SNIPPET_WIDTH = 150
+
+_search_lock = threading.Lock()
+_search_index: Optional[NgramIndex] = None
+_search_ranker: Optional[BM25FRanker] = None
+_search_sentences: Optional[SentenceIndex] = None
+_typeahead: Optional[Tuple[Any, PrefixIndex]] = None
+_corrector: Optional[Tuple[Any, Corrector]] = None
+_search_checked_at = 0.0
+
+
+class ContentItem(Mapping[str, Any]):
+    """Read-only view of one index.json entry.
+
+    ``body_text`` is not stored: it is read through the bounded body cache
+    the first time it is looked up.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        self._data = data
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "body_text" and "body_text" not in self._data and self._data.get("body"):
+            return _read_body_cached(self._data["body"])
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._data
+        if "body_text" not in self._data and self._data.get("body"):
+            yield "body_text"
+
+    def __len__(self) -> int:
+        return len(self._data) + ("body_text" not in self._data and bool(self._data.get("body")))
+
+    def __repr__(self) -> str:
+        return f"ContentItem({self._data!r})"
+
+
+@dataclass(frozen=True)
+class _Catalog:
+    version: int
+    signature: Any
+    raw: List[Dict]
+    items: Tuple[ContentItem, ...]
+    by_id: Dict[str, ContentItem]
+    by_category: Dict[str, Tuple[ContentItem, ...]]
+
+    @classmethod
+    def build(cls, version: int, signature: Any, raw: List[Dict]) -> "_Catalog":
+        items = tuple(ContentItem(item) for item in raw)
+        by_category: Dict[str, List[ContentItem]] = {}
+        for item in items:
+            by_category.setdefault(item.get("category"), []).append(item)
+        return cls(
+            version,
+            signature,
+            raw,
+            items,
+            {item.get("id"): item for item in items},
+            {key: tuple(group) for key, group in by_category.items()},
+        )
+
+
+_EMPTY_CATALOG = _Catalog.build(0, None, [])
+_catalog: _Catalog = _EMPTY_CATALOG
+_catalog_lock = threading.Lock()
+
+
+def get_catalog() -> _Catalog:
+    """index.json parsed once per file version, with id and category lookups."""
+    global _catalog
+    try:
+        stat = INDEX.stat()
+    except FileNotFoundError:
+        return _EMPTY_CATALOG
+    signature = (stat.st_mtime_ns, stat.st_size)
+    catalog = _catalog
+    if catalog.signature != signature:
+        with _catalog_lock:
+            catalog = _catalog
+            if catalog.signature != signature:
+                raw = json.loads(INDEX.read_text(encoding="utf-8"))
+                catalog = _catalog = _Catalog.build(catalog.version + 1, signature, raw)
+    return catalog
+
+
+def _load_index_cached() -> List[Dict]:
+    return get_catalog().raw
+
 
 def load_index() -> List[Dict]:
-    if INDEX.exists():
-        return json.loads(INDEX.read_text(encoding="utf-8"))
-    return []
+    """Mutable copies of the index.json entries, for editing."""
+    return [dict(item) for item in _load_index_cached()]
 
-def get_contents(category_key: str | None = None) -> List[Dict]:
-    items = load_index()
+
+def get_contents(category_key: str | None = None) -> List[ContentItem]:
+    catalog = get_catalog()
     if category_key and category_key != "all":
-        items = [i for i in items if i.get("category") == category_key]
-    return items
+        return list(catalog.by_category.get(category_key, ()))
+    return list(catalog.items)
 
-def get_content(content_id: str) -> Optional[Dict]:
-    for item in load_index():
-        if item.get("id") == content_id:
-            body_path = item.get("body")
-            if body_path:
-                p = BASE / body_path
-                if p.exists():
-                    item["body_text"] = p.read_text(encoding="utf-8")
-            return item
-    return None
 
+def get_content(content_id: str) -> Optional[ContentItem]:
+    return get_catalog().by_id.get(content_id)
 
-_NON_WORD = re.compile(r"[^0-9a-zA-Z가-힣]+")
 
+def _extract_ngrams(text: str) -> set[str]:
+    return set(ngram_terms(text))
 
-def _normalize_for_ngrams(text: str) -> str:
-    cleaned = _NON_WORD.sub("", text.lower())
-    return cleaned
 
+def _rank_terms(text: str) -> List[str]:
+    return rank_terms(text, jamo=SEARCH_JAMO)
 
-def _extract_ngrams(text: str) -> set[str]:
-    normalized = _normalize_for_ngrams(text)
-    if not normalized:
-        return set()
-    grams: set[str] = set(normalized)
-    if len(normalized) >= 2:
-        grams.update(normalized[i : i + 2] for i in range(len(normalized) - 1))
-    return grams
+
+class _BodyCache:
+    """Bounded LRU of body texts keyed by path, invalidated explicitly on save."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, body_path: str | None) -> str:
+        if not body_path:
+            return ""
+        with self._lock:
+            text = self._entries.get(body_path)
+            if text is not None:
+                self._entries.move_to_end(body_path)
+                return text
+        path = BASE / body_path
+        text = path.read_text(encoding="utf-8") if path.exists() else ""
+        with self._lock:
+            self._entries[body_path] = text
+            self._entries.move_to_end(body_path)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return text
+
+    def peek(self, body_path: str | None) -> Optional[str]:
+        with self._lock:
+            return self._entries.get(body_path) if body_path else ""
+
+    def invalidate(self, body_path: str | None) -> None:
+        if body_path:
+            with self._lock:
+                self._entries.pop(body_path, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_body_cache = _BodyCache(BODY_CACHE_SIZE)
 
 
-@lru_cache(maxsize=None)
 def _read_body_cached(body_path: str | None) -> str:
-    if not body_path:
-        return ""
-    path = BASE / body_path
-    if not path.exists():
-        return ""
-    return path.read_text(encoding="utf-8")
-
-
-def _item_field_ngrams(item: Dict) -> Dict[str, set[str]]:
-    title_ngrams = _extract_ngrams(item.get("title", ""))
-    summary_ngrams = _extract_ngrams(item.get("summary", ""))
-    body_ngrams = _extract_ngrams(_read_body_cached(item.get("body")))
+    return _body_cache.get(body_path)
+
+
+def _search_signature(items: List[Dict]) -> List[List[Any]]:
+    paths = [INDEX] + [BASE / item["body"] for item in items if item.get("body")]
+    return file_signature(paths)
+
+
+def _item_search_fields(item: Dict) -> Dict[str, str]:
     return {
-        "title": title_ngrams,
-        "summary": summary_ngrams,
-        "body": body_ngrams,
+        "title": item.get("title", ""),
+        "summary": item.get("summary", ""),
+        "body": _read_body_cached(item.get("body")),
     }
 
 
-def search_contents(query: str, category_key: str | None = None) -> List[Dict]:
-    query = (query or "").strip()
-    if not query:
-        return get_contents(category_key)
+def _build_or_load(path: Path, loader, builder):
+    loaded = loader(path)
+    if loaded is not None:
+        return loaded
+    built = builder()
+    try:
+        built.save(path)
+    except OSError:  # pragma: no cover - read-only deployments
+        pass
+    return built
+
+
+def _refresh_search_state() -> None:
+    """Reload or rebuild the search structures when a source file changed."""
+    global _search_index, _search_ranker, _search_sentences, _search_checked_at
+    now = time.monotonic()
+    if _search_index is not None and now - _search_checked_at < SEARCH_INDEX_CHECK_INTERVAL:
+        return
+    with _search_lock:
+        items = _load_index_cached()
+        signature = _search_signature(items)
+        if _search_index is None or _search_index.signature != signature:
+            _body_cache.clear()
+            documents = [(item.get("id", ""), _item_search_fields(item)) for item in items]
+            _search_index = _build_or_load(
+                SEARCH_INDEX_PATH,
+                lambda path: NgramIndex.load(path, signature),
+                lambda: NgramIndex.build(SEARCH_FIELDS, documents, ngram_terms, signature=signature),
+            )
+        rank_signature = [signature, SEARCH_JAMO]
+        if _search_ranker is None or _search_ranker.signature != rank_signature:
+            _search_ranker = _build_or_load(
+                SEARCH_RANK_PATH,
+                lambda path: BM25FRanker.load(path, rank_signature),
+                lambda: BM25FRanker.build(
+                    SEARCH_FIELDS,
+                    ((item.get("id", ""), _item_search_fields(item)) for item in items),
+                    _rank_terms,
+                    weights=SEARCH_FIELD_WEIGHTS,
+                    b=SEARCH_FIELD_B,
+                    signature=rank_signature,
+                ),
+            )
+        if _search_sentences is None or _search_sentences.signature != signature:
+            _search_sentences = _build_or_load(
+                SEARCH_SENTENCES_PATH,
+                lambda path: SentenceIndex.load(path, signature),
+                lambda: SentenceIndex.build(
+                    (_read_body_cached(item.get("body")) for item in items), bigram_terms, signature=signature
+                ),
+            )
+        _search_checked_at = now
 
-    query_ngrams = _extract_ngrams(query)
-    if not query_ngrams:
-        return get_contents(category_key)
 
-    items = get_contents(category_key)
-    ranked: list[tuple[int, int, Dict]] = []
+def get_search_index() -> NgramIndex:
+    """Inverted index over index.json items, rebuilt only when a source file changes."""
+    _refresh_search_state()
+    return _search_index
+
+
+def get_search_ranker() -> BM25FRanker:
+    """BM25F statistics over index.json items, kept in step with the search index."""
+    _refresh_search_state()
+    return _search_ranker
+
+
+def get_sentence_index() -> SentenceIndex:
+    """Sentence offsets of every body, kept in step with the search index."""
+    _refresh_search_state()
+    return _search_sentences
+
+
+@dataclass(frozen=True)
+class SearchSnippet:
+    text: str
+    spans: Tuple[Tuple[int, int], ...]  # query matches within ``text``
+
+
+def search_snippets(query: str, items: List[ContentItem], *, width: int = SNIPPET_WIDTH) -> Dict[str, SearchSnippet]:
+    """Best-matching passage of each item's body, keyed by item id.
+
+    The passage starts at the sentence sharing most bigrams with ``query``
+    and grows by whole sentences up to ``width`` characters; only that
+    window is scanned for highlight spans. Items whose body does not match
+    are left out.
+    """
+    index = get_search_index()
+    sentences = get_sentence_index()
+    positions = {item.get("id"): index.position(item.get("id")) for item in items}
+    best = sentences.best_sentences(bigram_terms(query), (p for p in positions.values() if p is not None))
+    snippets: Dict[str, SearchSnippet] = {}
     for item in items:
-        field_ngrams = _item_field_ngrams(item)
-        title_score = len(query_ngrams & field_ngrams["title"])
-        summary_score = len(query_ngrams & field_ngrams["summary"])
-        body_score = len(query_ngrams & field_ngrams["body"])
+        doc_index = positions.get(item.get("id"))
+        if doc_index not in best:
+            continue  # matched on title or summary only
+        body = _read_body_cached(item.get("body"))
+        parts: List[str] = []
+        length = 0
+        sentence = best[doc_index][0]
+        while length < width and sentence < sentences.sentence_count(doc_index):
+            start, end = sentences.span(doc_index, sentence)
+            parts.append(body[start:end])
+            length += end - start + 1
+            sentence += 1
+        text = " ".join(parts)
+        if len(text) > width:
+            text = text[: width - 1].rstrip() + "…"
+        pattern = query_pattern(text, query)
+        spans = tuple(match.span() for match in pattern.finditer(text)) if pattern else ()
+        snippets[item.get("id")] = SearchSnippet(text, spans)
+    return snippets
+
+
+def get_typeahead_index() -> PrefixIndex:
+    """Prefix index over titles, category labels and frequent body terms."""
+    global _typeahead
+    index = get_search_index()
+    cached = _typeahead
+    if cached is None or cached[0] != index.signature:
+        items = _load_index_cached()
+        bodies = {item.get("id", ""): _read_body_cached(item.get("body")) for item in items}
+        cached = (index.signature, PrefixIndex.build(items, bodies, LABELS_BY_KEY))
+        _typeahead = cached
+    return cached[1]
+
+
+def suggest_contents(prefix: str, k: int = 8) -> List[Suggestion]:
+    return get_typeahead_index().complete(prefix, k)
+
+
+def typeahead_contents(prefix: str, category_key: str | None = None, k: int = 8) -> List[ContentItem]:
+    """Items behind the top ``k`` completions of ``prefix``; a cheap preview before the full search."""
+    by_id = get_catalog().by_id
+    items = (by_id.get(item_id) for item_id in get_typeahead_index().matching_items(prefix, k))
+    return [
+        item
+        for item in items
+        if item is not None and (not category_key or category_key == "all" or item.get("category") == category_key)
+    ]
+
+
+def get_corrector() -> Corrector:
+    """Jamo-level spelling corrector over the title/summary/body vocabulary."""
+    global _corrector
+    index = get_search_index()
+    cached = _corrector
+    if cached is None or cached[0] != index.signature:
+        texts = []
+        for item in _load_index_cached():
+            fields = _item_search_fields(item)
+            texts.extend(fields[field] for field in SEARCH_FIELDS)
+        cached = (index.signature, Corrector(texts))
+        _corrector = cached
+    return cached[1]
+
+
+def correct_query(query: str) -> Optional[str]:
+    """A spelling-corrected ``query``, or ``None`` when nothing was changed."""
+    query = (query or "").strip()
+    corrected = get_corrector().correct(query) if query else query
+    return corrected if corrected != query.lower() and corrected != query else None
+
+
+def reindex_content(content_id: str, previous: Optional[Dict] = None) -> None:
+    """Push one saved item into the live search structures.
+
+    Call after index.json and the body file were written. ``previous`` is the
+    item as it was before the save; its cached body lets the n-gram index drop
+    exactly the old postings.
+    """
+    global _search_index, _search_ranker, _search_sentences, _search_checked_at
+    old_fields: Optional[Dict[str, str]] = None
+    if previous is not None:
+        old_body = _body_cache.peek(previous.get("body"))
+        if old_body is not None:
+            old_fields = {"title": previous.get("title", ""), "summary": previous.get("summary", ""), "body": old_body}
+        _body_cache.invalidate(previous.get("body"))
+
+    with _search_lock:
+        items = _load_index_cached()
+        position = next((i for i, item in enumerate(items) if item.get("id") == content_id), None)
+        if position is not None:
+            _body_cache.invalidate(items[position].get("body"))
+        index, ranker, sentences = _search_index, _search_ranker, _search_sentences
+        if index is None or ranker is None or sentences is None:
+            return  # built lazily on the next search
+        if position is None or index.position(content_id) != position or len(index.doc_ids) != len(items):
+            # Items were added, removed or reordered: fall back to a rebuild.
+            _search_index = _search_ranker = _search_sentences = None
+            return
+        fields = _item_search_fields(items[position])
+        index.replace(position, fields, ngram_terms, previous=old_fields)
+        ranker.replace(position, SEARCH_FIELDS, fields, _rank_terms)
+        sentences.replace(position, fields["body"], bigram_terms)
+        signature = _search_signature(items)
+        index.signature = sentences.signature = signature
+        ranker.signature = [signature, SEARCH_JAMO]
+        _search_checked_at = time.monotonic()
+
+
+def _tiered_matches(query_ngrams: set[str], items: List[Dict], category_key: str | None) -> List[int]:
+    index = get_search_index()
+    ranked: list[tuple[int, int, int]] = []
+    for doc_index, (title_score, summary_score, body_score) in index.match(query_ngrams).items():
+        if doc_index >= len(items):
+            continue
+        item = items[doc_index]
+        if category_key and category_key != "all" and item.get("category") != category_key:
+            continue
 
         if title_score:
-            ranked.append((0, -title_score, item))
+            ranked.append((0, -title_score, doc_index))
         elif summary_score:
-            ranked.append((1, -summary_score, item))
+            ranked.append((1, -summary_score, doc_index))
         elif body_score:
-            ranked.append((2, -body_score, item))
+            ranked.append((2, -body_score, doc_index))
+
+    ranked.sort()
+    return [doc_index for _, _, doc_index in ranked]
+
+
+class SearchResults(list):
+    """Hits of ``search_contents``.
+
+    ``corrected`` is the typo-corrected query whose hits were appended, or
+    ``None`` when the results come from the query as typed.
+    """
+
+    corrected: Optional[str] = None
+
+
+def search_contents(
+    query: str,
+    category_key: str | None = None,
+    *,
+    ranking: str = "bm25",
+    fuzzy: bool = True,
+) -> SearchResults:
+    """Search index.json items; ``ranking`` is ``"bm25"`` (BM25F) or ``"tiers"`` (title > summary > body).
+
+    With ``fuzzy``, fewer than ``FUZZY_MIN_HITS`` exact hits are topped up
+    with the hits of the typo-corrected query.
+    """
+    query = (query or "").strip()
+    if not query:
+        return SearchResults(get_contents(category_key))
+
+    query_ngrams = _extract_ngrams(query)
+    if not query_ngrams:
+        return SearchResults(get_contents(category_key))
+
+    catalog = get_catalog()
+    items = catalog.raw
+    matches = _ranked_matches(query, query_ngrams, items, category_key, ranking)
+    applied = None
+    if fuzzy and len(matches) < FUZZY_MIN_HITS:
+        corrected = correct_query(query)
+        if corrected:
+            seen = set(matches)
+            for doc_index in _ranked_matches(corrected, _extract_ngrams(corrected), items, category_key, ranking):
+                if doc_index not in seen:
+                    seen.add(doc_index)
+                    matches.append(doc_index)
+                    applied = corrected
+    results = SearchResults(catalog.items[doc_index] for doc_index in matches)
+    results.corrected = applied
+    return results
+
 
-    ranked.sort(key=lambda entry: (entry[0], entry[1]))
-    return [item for _, _, item in ranked]
+def _ranked_matches(
+    query: str,
+    query_ngrams: set[str],
+    items: List[Dict],
+    category_key: str | None,
+    ranking: str,
+) -> List[int]:
+    if ranking == "tiers":
+        return _tiered_matches(query_ngrams, items, category_key)
+    return [
+        doc_index
+        for doc_index, _ in get_search_ranker().rank(query_rank_terms(query, jamo=SEARCH_JAMO))
+        if doc_index < len(items)
+        and (not category_key or category_key == "all" or items[doc_index].get("category") == category_key)
+    ]
@@ -0,0 +1,178 @@
+"""Story figures described as data (``figure_specs.json``) and drawn by one engine.
+
+A spec names a workbook sheet, an ordered list of reshaping ``steps`` and
+either a Plotly Express chart (``px``) or an explicit ``traces`` list, plus
+layout updates. Reshaped tables are cached per sheet version and step list,
+so figures that share a reshape (and reruns of the same figure) skip it.
+
+Steps::
+
+    {"op": "dropna_rows"}                              drop all-empty rows
+    {"op": "rename", "columns": {"old": "new"}}
+    {"op": "rename_first", "to": "category"}          "Unnamed: 0", else the first column
+    {"op": "name_columns", "names": ["year", "score"]} rename leading columns by position
+    {"op": "strip_columns"}                            str() and strip every label
+    {"op": "header_row", "row": 1, "first": "year"}   take labels from a data row
+    {"op": "ffill", "columns": [...]}
+    {"op": "sort", "by": "col", "ascending": true}
+    {"op": "melt", "id": [...], "values": [...] | "years" | null, "var": "연도", "value": "값"}
+    {"op": "parse_year", "column": "연도", "as_int": false}
+    {"op": "to_year", "column": "year"}               numeric, non-year rows dropped, int
+    {"op": "numeric", "columns": [...]}
+"""
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from .visual_registry import figure_specs
+from .visuals_common import (
+    _apply_common_layout,
+    _file_version,
+    _parsed_sheet,
+    excel_data_path,
+    parse_year,
+    reads_sheets,
+    year_columns,
+)
+
+TABLE_CACHE_SIZE = 64
+
+Spec = Dict[str, Any]
+
+
+# -- reshaping ------------------------------------------------------------
+def _rename_first(df: pd.DataFrame, step: Spec) -> pd.DataFrame:
+    source = "Unnamed: 0" if "Unnamed: 0" in df.columns else df.columns[0]
+    return df.rename(columns={source: step["to"]})
+
+
+def _name_columns(df: pd.DataFrame, step: Spec) -> pd.DataFrame:
+    names = step["names"]
+    return df.rename(columns=dict(zip(df.columns[: len(names)], names)))
+
+
+def _header_row(df: pd.DataFrame, step: Spec) -> pd.DataFrame:
+    header = df.iloc[step["row"]].tolist()
+    body = df.iloc[step["row"] + 1 :].copy()
+    body.columns = [step["first"]] + [str(label).strip() for label in header[1:]]
+    return body
+
+
+def _melt(df: pd.DataFrame, step: Spec) -> pd.DataFrame:
+    values = step.get("values")
+    if values == "years":
+        values = year_columns(df.columns)
+    return df.melt(id_vars=step["id"], value_vars=values, var_name=step["var"], value_name=step["value"])
+
+
+def _parse_years(df: pd.DataFrame, step: Spec) -> pd.DataFrame:
+    column = step["column"]
+    # A melted year column repeats a handful of header labels; parse each once.
+    parsed = {label: parse_year(label) for label in pd.unique(df[column])}
+    df = df.assign(**{column: df[column].map(parsed)}).dropna(subset=[column])
+    if step.get("as_int"):
+        df[column] = df[column].astype(int)
+    return df
+
+
+def _to_year(df: pd.DataFrame, step: Spec) -> pd.DataFrame:
+    column = step["column"]
+    df = df.assign(**{column: pd.to_numeric(df[column], errors="coerce")}).dropna(subset=[column])
+    df[column] = df[column].astype(int)
+    return df
+
+
+_STEPS: Dict[str, Callable[[pd.DataFrame, Spec], pd.DataFrame]] = {
+    "dropna_rows": lambda df, step: df.dropna(how="all"),
+    "rename": lambda df, step: df.rename(columns=step["columns"]),
+    "rename_first": _rename_first,
+    "name_columns": _name_columns,
+    "strip_columns": lambda df, step: df.set_axis([str(label).strip() for label in df.columns], axis=1),
+    "header_row": _header_row,
+    "ffill": lambda df, step: df.assign(**{column: df[column].ffill() for column in step["columns"]}),
+    "sort": lambda df, step: df.sort_values(step["by"], ascending=step.get("ascending", True)),
+    "melt": _melt,
+    "parse_year": _parse_years,
+    "to_year": _to_year,
+    "numeric": lambda df, step: df.assign(
+        **{column: pd.to_numeric(df[column], errors="coerce") for column in step["columns"]}
+    ),
+}
+
+
+@lru_cache(maxsize=TABLE_CACHE_SIZE)
+def _table(path: Path, version: Tuple[int, int], sheet: str, steps: str) -> pd.DataFrame:
+    df = _parsed_sheet(path, version, sheet)
+    for step in json.loads(steps):
+        df = _STEPS[step["op"]](df, step)
+    return df
+
+
+def spec_table(spec: Spec) -> pd.DataFrame:
+    """Reshaped table for ``spec``; shared between callers, so treat it as read-only."""
+    path = excel_data_path(spec["workbook"])
+    version = _file_version(path)
+    if version is None:
+        raise FileNotFoundError(f"데이터 파일을 찾을 수 없습니다: {path}")
+    steps = json.dumps(spec.get("steps", []), ensure_ascii=False, sort_keys=True)
+    return _table(path, version, spec["sheet"], steps)
+
+
+# -- drawing --------------------------------------------------------------
+_TRACE_TYPES = {"bar": go.Bar, "scatter": go.Scatter}
+_TRACE_KEYS = ("type", "where", "x", "y", "secondary_y")
+
+
+def _trace(df: pd.DataFrame, trace: Spec) -> Tuple[Any, Optional[bool]]:
+    where = trace.get("where")
+    if where:
+        mask = pd.Series(True, index=df.index)
+        for column, value in where.items():
+            mask &= df[column] == value
+        df = df[mask]
+    options = {key: value for key, value in trace.items() if key not in _TRACE_KEYS}
+    return _TRACE_TYPES[trace["type"]](x=df[trace["x"]], y=df[trace["y"]], **options), trace.get("secondary_y")
+
+
+def build_figure(spec: Spec) -> go.Figure:
+    df = spec_table(spec)
+    if "px" in spec:
+        chart = spec["px"]
+        fig = getattr(px, chart["kind"])(df, **{key: value for key, value in chart.items() if key != "kind"})
+    elif spec.get("secondary_y"):
+        fig = make_subplots(specs=[[{"secondary_y": True}]])
+        for trace in spec["traces"]:
+            built, secondary = _trace(df, trace)
+            fig.add_trace(built, secondary_y=bool(secondary))
+    else:
+        fig = go.Figure()
+        for trace in spec["traces"]:
+            fig.add_trace(_trace(df, trace)[0])
+
+    if spec.get("update_traces"):
+        fig.update_traces(**spec["update_traces"])
+    if spec.get("layout"):
+        fig.update_layout(**spec["layout"])
+    for axes in spec.get("yaxes", []):
+        fig.update_yaxes(**axes)
+    return _apply_common_layout(fig, spec["title"])
+
+
+def spec_renderer(name: str) -> Callable[[str, str], go.Figure]:
+    """Renderer callable for the spec ``name``, with its sheet declared for the render cache."""
+    spec = figure_specs()[name]
+
+    @reads_sheets(spec["workbook"], spec["sheet"])
+    def render(story_slug: str, slot_id: str) -> go.Figure:
+        return build_figure(spec)
+
+    render.__name__ = name
+    return render
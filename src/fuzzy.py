@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .hangul import decompose
+
+# Jamo edits tolerated per word: one for short words, two otherwise.
+SHORT_WORD_JAMO = 4
+MAX_DISTANCE = 2
+
+_WORD = re.compile(r"[0-9A-Za-z가-힣]{2,}")
+
+
+def bounded_levenshtein(a: str, b: str, limit: int) -> int:
+    """Edit distance of ``a`` and ``b``, or ``limit + 1`` once it must exceed ``limit``."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        row_min = i
+        for j, char_b in enumerate(b, 1):
+            cost = previous[j - 1] + (char_a != char_b)
+            cost = min(cost, previous[j] + 1, current[j - 1] + 1)
+            current.append(cost)
+            row_min = min(row_min, cost)
+        if row_min > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class BKTree:
+    """Burkhard-Keller tree over jamo strings under Levenshtein distance.
+
+    A lookup within distance ``d`` only descends into children whose edge
+    label lies in ``[dist - d, dist + d]``, so small radii visit a small
+    fraction of the vocabulary.
+    """
+
+    def __init__(self) -> None:
+        self._root: Optional[Tuple[str, Dict[int, tuple]]] = None
+        self.size = 0
+
+    def add(self, word: str) -> None:
+        if self._root is None:
+            self._root = (word, {})
+            self.size = 1
+            return
+        node = self._root
+        while True:
+            distance = bounded_levenshtein(word, node[0], len(word) + len(node[0]))
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = (word, {})
+                self.size += 1
+                return
+            node = child
+
+    def search(self, word: str, max_distance: int) -> List[Tuple[int, str]]:
+        """``(distance, word)`` pairs within ``max_distance``, nearest first."""
+        if self._root is None:
+            return []
+        found: List[Tuple[int, str]] = []
+        stack = [self._root]
+        while stack:
+            candidate, children = stack.pop()
+            # Exact distance is needed to pick the children to visit.
+            distance = bounded_levenshtein(word, candidate, len(word) + len(candidate))
+            if distance <= max_distance:
+                found.append((distance, candidate))
+            for edge in range(distance - max_distance, distance + max_distance + 1):
+                child = children.get(edge)
+                if child is not None:
+                    stack.append(child)
+        found.sort()
+        return found
+
+
+class Corrector:
+    """Maps mistyped words to vocabulary words via a jamo-level BK-tree."""
+
+    def __init__(self, texts: Iterable[str]) -> None:
+        counts: Counter = Counter()
+        for text in texts:
+            counts.update(_WORD.findall(text.lower()))
+        self.counts = counts
+        self._by_jamo: Dict[str, str] = {}
+        self.tree = BKTree()
+        for word, _ in counts.most_common():
+            jamo = decompose(word)
+            if jamo not in self._by_jamo:
+                self._by_jamo[jamo] = word
+                self.tree.add(jamo)
+
+    def candidates(self, word: str, limit: int = 3) -> List[str]:
+        """Vocabulary words within the allowed jamo distance, nearest and most frequent first."""
+        word = word.lower()
+        if word in self.counts:
+            return [word]
+        jamo = decompose(word)
+        radius = 1 if len(jamo) <= SHORT_WORD_JAMO else MAX_DISTANCE
+        matches = [(distance, self._by_jamo[found]) for distance, found in self.tree.search(jamo, radius)]
+        matches.sort(key=lambda match: (match[0], -self.counts[match[1]]))
+        return [found for _, found in matches[:limit]]
+
+    def correct(self, query: str) -> str:
+        """``query`` with each unknown word replaced by its best candidate."""
+        words = []
+        for word in query.split():
+            if len(word) < 2 or not _WORD.fullmatch(word):
+                words.append(word)
+                continue
+            found = self.candidates(word, limit=1)
+            words.append(found[0] if found else word)
+        return " ".join(words)
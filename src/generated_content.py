@@ -1,16 +1,40 @@
 from __future__ import annotations
 
+import copy
 import json
+import os
 import re
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable, Tuple
+from textwrap import shorten
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .story_revisions import JsonlRevisionLog, build_record, reconstruct, summarize, unified_diff
+from .story_store import JournaledArchive, SqliteStoryStore, write_json_atomic
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 OUTPUT_PATH = BASE_DIR / "content" / "generated_content.json"
+JOURNAL_PATH = BASE_DIR / "content" / "generated_content.journal.jsonl"
+SQLITE_PATH = BASE_DIR / "content" / "generated_content.sqlite3"
+REVISIONS_DIR = BASE_DIR / "content" / "revisions"
+MANIFEST_PATH = BASE_DIR / "content" / "generated_content.manifest.json"
+EXCERPT_WIDTH = 120
 
+# "json" keeps the snapshot + journal archive; "sqlite" stores one row per story.
+STORY_BACKEND = os.environ.get("EDA_STORY_BACKEND", "json").strip().lower()
+JOURNAL_COMPACT_BYTES = int(os.environ.get("EDA_STORY_JOURNAL_COMPACT_BYTES", 256 * 1024))
 
-def _load_raw() -> Dict[str, Any]:
+_sqlite_store: Optional[SqliteStoryStore] = None
+_sqlite_lock = threading.Lock()
+_revision_lock = threading.Lock()
+_revision_log = JsonlRevisionLog(REVISIONS_DIR)
+# Re-entrant: updating a missing manifest rebuilds it while the lock is held.
+_manifest_lock = threading.RLock()
+_manifest_cache: Optional[Tuple[Any, Any, Dict[str, Dict[str, Any]]]] = None
+
+
+def _read_snapshot() -> Dict[str, Any]:
     if not OUTPUT_PATH.exists():
         return {"stories": {}}
     with OUTPUT_PATH.open("r", encoding="utf-8") as handle:
@@ -36,9 +60,37 @@ def _load_raw() -> Dict[str, Any]:
 
 
 def _write_raw(payload: Dict[str, Any]) -> None:
-    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with OUTPUT_PATH.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, ensure_ascii=False, indent=2)
+    write_json_atomic(OUTPUT_PATH, payload, indent=2)
+
+
+_archive = JournaledArchive(
+    OUTPUT_PATH,
+    JOURNAL_PATH,
+    read_snapshot=_read_snapshot,
+    write_snapshot=_write_raw,
+    compact_bytes=JOURNAL_COMPACT_BYTES,
+)
+
+
+def _load_raw() -> Dict[str, Any]:
+    return _archive.state()
+
+
+def _get_sqlite_store() -> Optional[SqliteStoryStore]:
+    global _sqlite_store
+    if STORY_BACKEND != "sqlite":
+        return None
+    if _sqlite_store is not None:
+        return _sqlite_store
+    with _sqlite_lock:
+        if _sqlite_store is None:
+            store = SqliteStoryStore(SQLITE_PATH)
+            if store.needs_migration():
+                # One-shot import of the JSON archive (legacy format included)
+                store.import_archive(_load_raw(), source=OUTPUT_PATH.name, summarize=_manifest_entry)
+            store.backfill_manifest(_manifest_entry)
+            _sqlite_store = store
+    return _sqlite_store
 
 
 def _suggest_slug(value: str) -> str:
@@ -47,44 +99,195 @@ def _suggest_slug(value: str) -> str:
     return base
 
 
+def story_excerpt(markdown_text: str, default: str = "") -> str:
+    if not markdown_text:
+        return default
+    text = re.sub(r"<[^>]+>", " ", markdown_text)
+    text = re.sub(r"\s+", " ", text).strip()
+    return shorten(text, width=EXCERPT_WIDTH, placeholder="…") if text else default
+
+
+def _manifest_entry(payload: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "title": payload.get("title"),
+        "updated_at": payload.get("updated_at"),
+        "excerpt": story_excerpt(payload.get("markdown") or ""),
+        "topic": payload.get("topic"),
+    }
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _source_signature() -> List[Optional[List[int]]]:
+    # What the manifest was derived from; JSON-shaped so it round-trips through the file.
+    signatures = (_file_signature(_archive.snapshot_path), _file_signature(_archive.journal_path))
+    return [list(signature) if signature is not None else None for signature in signatures]
+
+
+def _write_manifest(source: List[Optional[List[int]]], manifest: Dict[str, Dict[str, Any]]) -> None:
+    global _manifest_cache
+    write_json_atomic(MANIFEST_PATH, {"source": source, "stories": manifest}, indent=None)
+    _manifest_cache = (_file_signature(MANIFEST_PATH), source, manifest)
+
+
+def rebuild_manifest() -> Dict[str, Dict[str, Any]]:
+    with _manifest_lock:
+        # Taken before reading, so a change made meanwhile still triggers the next rebuild.
+        source = _source_signature()
+        stories = _load_raw().get("stories", {})
+        manifest = {slug: _manifest_entry(payload) for slug, payload in stories.items()}
+        _write_manifest(source, manifest)
+        return manifest
+
+
+def _read_manifest() -> Dict[str, Dict[str, Any]]:
+    """Manifest of the JSON archive, rebuilt when the snapshot or journal changed behind it.
+
+    That covers edits made outside this process (a pull, deploy or restore
+    replacing ``generated_content.json``); saves here keep it current.
+    """
+    global _manifest_cache
+    signature = _file_signature(MANIFEST_PATH)
+    if signature is None:
+        return rebuild_manifest()
+    source = _source_signature()
+    cached = _manifest_cache
+    if cached is not None and cached[0] == signature and cached[1] == source:
+        return cached[2]
+    try:
+        with MANIFEST_PATH.open("r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except ValueError:
+        data = None
+    if not isinstance(data, dict) or data.get("source") != source or not isinstance(data.get("stories"), dict):
+        return rebuild_manifest()
+    manifest = data["stories"]
+    _manifest_cache = (signature, source, manifest)
+    return manifest
+
+
+def _update_manifest(slug: str, payload: Dict[str, Any]) -> None:
+    _update_manifest_many({slug: payload})
+
+
+def _update_manifest_many(stories: Dict[str, Dict[str, Any]]) -> None:
+    """Record saves the caller has already appended to the archive."""
+    with _manifest_lock:
+        manifest = dict(_read_manifest())
+        for slug, payload in stories.items():
+            manifest[slug] = _manifest_entry(payload)
+        _write_manifest(_source_signature(), manifest)
+
+
+def story_manifest() -> Dict[str, Dict[str, Any]]:
+    """Title, updated_at, excerpt and topic per story, without loading bodies."""
+    store = _get_sqlite_store()
+    manifest = store.manifest() if store is not None else _read_manifest()
+    return {slug: dict(entry) for slug, entry in manifest.items()}
+
+
 def list_stories() -> Dict[str, str]:
-    data = _load_raw()
-    stories = data.get("stories", {})
     return {
-        slug: (payload.get("title") or slug)
-        for slug, payload in stories.items()
+        slug: (entry.get("title") or slug)
+        for slug, entry in story_manifest().items()
     }
 
 
 def load_story(slug: str) -> Dict[str, Any] | None:
+    store = _get_sqlite_store()
+    if store is not None:
+        return store.load(slug)
     data = _load_raw()
     stories = data.get("stories", {})
-    return stories.get(slug)
+    story = stories.get(slug)
+    return copy.deepcopy(story) if story is not None else None
 
 
 def save_story(slug: str, payload: Dict[str, Any]) -> None:
-    data = _load_raw()
-    stories = data.setdefault("stories", {})
-    story_payload = dict(payload)
-    story_payload["updated_at"] = datetime.utcnow().isoformat()
-    stories[slug] = story_payload
-    data["updated_at"] = story_payload["updated_at"]
-    _write_raw(data)
+    # One story through the batch path: on SQLite the row and its revision
+    # commit together, so a crash cannot leave a save without its revision.
+    save_stories({slug: payload})
+
+
+def save_stories(stories: Dict[str, Dict[str, Any]]) -> None:
+    """Save many stories at once: one store transaction (or journal write) for all of them."""
+    if not stories:
+        return
+    updated_at = datetime.utcnow().isoformat()
+    payloads = {slug: {**payload, "updated_at": updated_at} for slug, payload in stories.items()}
+    with _revision_lock:
+        revisions = {slug: _next_revision(slug, payload) for slug, payload in payloads.items()}
+        store = _get_sqlite_store()
+        if store is not None:
+            store.save_many(
+                (slug, payload, _manifest_entry(payload), revisions[slug]) for slug, payload in payloads.items()
+            )
+            return
+        _archive.append_many(payloads.items())
+        _update_manifest_many(payloads)
+        for slug, record in revisions.items():
+            _revision_log.append(slug, record)
 
 
 def ensure_unique_slug(candidate: str) -> str:
     base = _suggest_slug(candidate)
-    data = _load_raw()
-    stories = data.get("stories", {})
-    if base not in stories:
+    store = _get_sqlite_store()
+    if store is not None:
+        taken = store.exists
+    else:
+        taken = _read_manifest().__contains__
+    if not taken(base):
         return base
     suffix = 2
-    while f"{base}-{suffix}" in stories:
+    while taken(f"{base}-{suffix}"):
         suffix += 1
     return f"{base}-{suffix}"
 
 
 def all_story_items() -> Iterable[Tuple[str, Dict[str, Any]]]:
+    store = _get_sqlite_store()
+    if store is not None:
+        yield from store.items()
+        return
     data = _load_raw()
-    for slug, payload in data.get("stories", {}).items():
-        yield slug, payload.copy()
+    for slug, payload in list(data.get("stories", {}).items()):
+        yield slug, copy.deepcopy(payload)
+
+
+def _revision_chain(slug: str, rev: Optional[int] = None) -> List[Dict[str, Any]]:
+    store = _get_sqlite_store()
+    if store is not None:
+        return store.revision_chain(slug, rev)
+    return _revision_log.chain(slug, rev)
+
+
+def _next_revision(slug: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    chain = _revision_chain(slug)
+    previous = reconstruct(chain)
+    rev = chain[-1]["rev"] + 1 if chain else 1
+    return build_record(rev, payload, previous.get("markdown") if previous else None)
+
+
+def list_revisions(slug: str) -> List[Dict[str, Any]]:
+    store = _get_sqlite_store()
+    records = store.revision_records(slug) if store is not None else _revision_log.records(slug)
+    return [summarize(record) for record in records]
+
+
+def load_revision(slug: str, rev: int) -> Dict[str, Any] | None:
+    return reconstruct(_revision_chain(slug, rev))
+
+
+def diff_revisions(slug: str, old_rev: int, new_rev: int) -> str:
+    old = load_revision(slug, old_rev)
+    new = load_revision(slug, new_rev)
+    if old is None or new is None:
+        missing = old_rev if old is None else new_rev
+        raise KeyError(f"스토리 `{slug}`의 리비전 {missing}을(를) 찾을 수 없습니다.")
+    return unified_diff(old, new, old_label=f"{slug}@{old_rev}", new_label=f"{slug}@{new_rev}")
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import List
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ("", *"ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ")
+
+
+def is_syllable(char: str) -> bool:
+    return HANGUL_BASE <= ord(char) <= HANGUL_LAST
+
+
+def decompose_syllable(char: str) -> str:
+    """Split one precomposed Hangul syllable into compatibility jamo (가 -> ㄱㅏ)."""
+    code = ord(char) - HANGUL_BASE
+    if not 0 <= code <= HANGUL_LAST - HANGUL_BASE:
+        return char
+    lead, rest = divmod(code, 21 * 28)
+    vowel, tail = divmod(rest, 28)
+    return CHOSEONG[lead] + JUNGSEONG[vowel] + JONGSEONG[tail]
+
+
+def decompose(text: str) -> str:
+    """Jamo sequence for ``text``; non-Hangul characters pass through unchanged."""
+    return "".join(decompose_syllable(char) if is_syllable(char) else char for char in text)
+
+
+def jamo_bigrams(text: str) -> List[str]:
+    jamo = decompose(text)
+    return [jamo[i : i + 2] for i in range(len(jamo) - 1)]
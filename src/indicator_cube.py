@@ -0,0 +1,90 @@
+"""Indicator time series held as one ``indicator × region × year`` array.
+
+Missing observations are NaN. Label lookups go through dicts built once, so
+slicing a comparison is a single fancy-indexing read instead of rebuilding
+DataFrames from per-region record lists.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class IndicatorCube:
+    values: np.ndarray
+    indicators: Tuple[str, ...]
+    regions: Tuple[str, ...]
+    years: Tuple[int, ...]
+    indicator_index: Dict[str, int] = field(init=False, repr=False, compare=False)
+    region_index: Dict[str, int] = field(init=False, repr=False, compare=False)
+    year_index: Dict[int, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        expected = (len(self.indicators), len(self.regions), len(self.years))
+        if self.values.shape != expected:
+            raise ValueError(f"값 배열 크기 {self.values.shape}가 레이블 수 {expected}와 다릅니다.")
+        self.values.setflags(write=False)
+        object.__setattr__(self, "indicator_index", {label: i for i, label in enumerate(self.indicators)})
+        object.__setattr__(self, "region_index", {label: i for i, label in enumerate(self.regions)})
+        object.__setattr__(self, "year_index", {year: i for i, year in enumerate(self.years)})
+
+    # -- slicing ----------------------------------------------------------
+    def series(self, indicator: str, region: str) -> np.ndarray:
+        return self.values[self.indicator_index[indicator], self.region_index[region]]
+
+    def compare(self, indicator: str, regions: Sequence[str]) -> np.ndarray:
+        """``len(regions) × years`` block for one indicator."""
+        rows = np.fromiter((self.region_index[region] for region in regions), dtype=np.intp, count=len(regions))
+        return self.values[self.indicator_index[indicator], rows]
+
+    def compare_frame(self, indicator: str, regions: Sequence[str]) -> pd.DataFrame:
+        """Wide ``year`` + one column per region, ready for ``px.line(y=regions)``."""
+        block = self.compare(indicator, regions)
+        return pd.DataFrame({"year": self.years, **dict(zip(regions, block))})
+
+    def overlay(
+        self,
+        indicator: str,
+        national: str,
+        reference: str,
+        *,
+        labels: Tuple[str, str] = ("한국", "OECD 평균"),
+    ) -> pd.DataFrame:
+        """National series against a reference region (e.g. an OECD average row)."""
+        block = self.compare(indicator, (national, reference))
+        return pd.DataFrame({"year": self.years, labels[0]: block[0], labels[1]: block[1]})
+
+    def to_csv(self, indicator: str, regions: Sequence[str]) -> bytes:
+        return self.compare_frame(indicator, regions).to_csv(index=False).encode("utf-8")
+
+    # -- construction -----------------------------------------------------
+    @classmethod
+    def from_long(
+        cls,
+        frame: pd.DataFrame,
+        *,
+        indicator: str = "indicator",
+        region: str = "region",
+        year: str = "year",
+        value: str = "value",
+    ) -> "IndicatorCube":
+        """Cube from a long table; later rows win when a cell appears twice."""
+        frame = frame.dropna(subset=[indicator, region, year])
+        indicator_codes, indicator_labels = pd.factorize(frame[indicator], sort=False)
+        region_codes, region_labels = pd.factorize(frame[region], sort=False)
+        year_values = frame[year].astype(int).to_numpy()
+        years = np.unique(year_values)
+        values = np.full((len(indicator_labels), len(region_labels), len(years)), np.nan)
+        values[indicator_codes, region_codes, np.searchsorted(years, year_values)] = pd.to_numeric(
+            frame[value], errors="coerce"
+        ).to_numpy(dtype=float)
+        return cls(
+            values=values,
+            indicators=tuple(indicator_labels),
+            regions=tuple(region_labels),
+            years=tuple(int(y) for y in years),
+        )
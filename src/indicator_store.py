@@ -0,0 +1,241 @@
+"""Indicator time series from the KOSSDA workbooks, ingested once.
+
+Every catalogued sheet is flattened into one long columnar table
+(indicator, entity, year, value) sorted by that key. Each row's key is also
+packed into a single int64, so any ``(indicator, entity, year range)`` query
+is two ``np.searchsorted`` calls plus a slice. The store is rebuilt only when
+a workbook file changes.
+"""
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .indicator_cube import IndicatorCube
+from .visuals_common import _file_version, excel_data_path, parse_year, workbook_sheet, year_columns
+
+EDUCATION_CARE_WORKBOOK = "(0204)교육돌봄 데이터_v1.0.xlsx"
+POLITICS_CIVIC_WORKBOOK = "(0204)정치사회 데이터_v1.0.xlsx"
+
+_ENTITY_BITS = 16
+_YEAR_BITS = 16
+
+
+@dataclass(frozen=True)
+class IndicatorDef:
+    id: str
+    topic: str
+    label: str
+    unit: str
+    workbook: str
+    sheet: str
+    # "entity_rows": first column names the entity, one column per year.
+    # "year_rows": first column holds the year, one column per entity.
+    layout: str = "entity_rows"
+    headline: Optional[str] = None
+
+
+INDICATOR_CATALOG: Tuple[IndicatorDef, ...] = (
+    IndicatorDef("private_tutoring", "welfare", "학생 1인당 월평균 사교육비", "만 원", EDUCATION_CARE_WORKBOOK, "그림7", headline="전체"),
+    IndicatorDef("school_age_population", "welfare", "학교급별 학령인구", "천 명", EDUCATION_CARE_WORKBOOK, "그림1", headline="전체"),
+    IndicatorDef("parent_satisfaction", "welfare", "학부모의 학교교육 만족도", "점", EDUCATION_CARE_WORKBOOK, "그림11", headline="한국"),
+    IndicatorDef("major_job_match", "welfare", "교육수준별 전공-직업 일치도", "%", EDUCATION_CARE_WORKBOOK, "그림12"),
+    IndicatorDef("care_satisfaction", "welfare", "보육·유아교육 기관 만족도", "점", EDUCATION_CARE_WORKBOOK, "그림13", layout="year_rows", headline="전체"),
+    IndicatorDef("political_efficacy", "politics", "이념 성향별 정치 효능감", "점", POLITICS_CIVIC_WORKBOOK, "그림8", headline="전체"),
+    IndicatorDef("election_turnout", "politics", "선거 투표율", "%", POLITICS_CIVIC_WORKBOOK, "그림9", layout="year_rows", headline="대통령선거"),
+    IndicatorDef("government_trust", "politics", "중앙정부에 대한 신뢰", "%", POLITICS_CIVIC_WORKBOOK, "그림4"),
+    IndicatorDef("fairness", "politics", "공정성에 대한 인식", "%", POLITICS_CIVIC_WORKBOOK, "그림3"),
+    IndicatorDef("polarization", "politics", "주요국의 정치 양극화 수준", "지표", POLITICS_CIVIC_WORKBOOK, "그림14", layout="year_rows", headline="한국"),
+)
+
+
+def _clean_labels(values: pd.Series) -> pd.Series:
+    # Sheet labels carry stray non-breaking spaces ("OECD\xa0평균").
+    return values.astype(str).str.replace("\xa0", " ").str.strip()
+
+
+def _sheet_long(definition: IndicatorDef, df: pd.DataFrame) -> pd.DataFrame:
+    first = df.columns[0]
+    if definition.layout == "year_rows":
+        entities = [col for col in df.columns[1:] if not str(col).startswith("Unnamed")]
+        long = df.melt(id_vars=[first], value_vars=entities, var_name="entity", value_name="value")
+        long = long.rename(columns={first: "year"})
+    else:
+        long = df.dropna(subset=[first]).melt(
+            id_vars=[first], value_vars=year_columns(df.columns), var_name="year", value_name="value"
+        )
+        long = long.rename(columns={first: "entity"})
+    parsed = {label: parse_year(label) for label in pd.unique(long["year"])}
+    long["year"] = long["year"].map(parsed)
+    long["value"] = pd.to_numeric(long["value"], errors="coerce")
+    long = long.dropna(subset=["year", "value"])
+    return pd.DataFrame(
+        {
+            "indicator": definition.id,
+            "entity": _clean_labels(long["entity"]),
+            "year": long["year"].astype(int),
+            "value": long["value"].astype(float),
+        }
+    )
+
+
+class IndicatorStore:
+    def __init__(self, table: pd.DataFrame, catalog: Sequence[IndicatorDef] = ()) -> None:
+        self.catalog: Dict[str, IndicatorDef] = {definition.id: definition for definition in catalog}
+        indicator_codes, self.indicator_labels = pd.factorize(table["indicator"], sort=False)
+        entity_codes, self.entity_labels = pd.factorize(table["entity"], sort=False)
+        if len(self.entity_labels) >= 1 << _ENTITY_BITS:
+            raise ValueError("개체 수가 너무 많습니다.")
+        years = table["year"].to_numpy(dtype=np.int64)
+        keys = (
+            (indicator_codes.astype(np.int64) << (_ENTITY_BITS + _YEAR_BITS))
+            | (entity_codes.astype(np.int64) << _YEAR_BITS)
+            | years
+        )
+        order = np.argsort(keys, kind="stable")
+        self.keys = keys[order]
+        self.indicator = indicator_codes[order]
+        self.entity = entity_codes[order]
+        self.year = years[order]
+        self.value = table["value"].to_numpy(dtype=float)[order]
+        for column in (self.keys, self.indicator, self.entity, self.year, self.value):
+            column.setflags(write=False)
+        self._indicator_index = {label: code for code, label in enumerate(self.indicator_labels)}
+        self._entity_index = {label: code for code, label in enumerate(self.entity_labels)}
+        seen = table.drop_duplicates(["indicator", "entity"])
+        self._entities: Dict[str, List[str]] = {
+            indicator: group.tolist() for indicator, group in seen.groupby("indicator", sort=False)["entity"]
+        }
+        self._cubes: Dict[Tuple[str, ...], IndicatorCube] = {}
+        self._cubes_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @classmethod
+    def from_workbooks(cls, catalog: Sequence[IndicatorDef] = INDICATOR_CATALOG) -> "IndicatorStore":
+        frames = []
+        available = []
+        for definition in catalog:
+            path = excel_data_path(definition.workbook)
+            if not path.exists():
+                continue
+            try:
+                long = _sheet_long(definition, workbook_sheet(path, definition.sheet))
+            except (OSError, KeyError, ValueError):
+                continue
+            # A sheet without numeric observations would list an indicator with no entities.
+            if long.empty:
+                continue
+            frames.append(long)
+            available.append(definition)
+        if not frames:
+            return cls(pd.DataFrame({"indicator": [], "entity": [], "year": [], "value": []}))
+        return cls(pd.concat(frames, ignore_index=True), available)
+
+    # -- queries ----------------------------------------------------------
+    def _bounds(self, low: int, high: int) -> slice:
+        return slice(
+            int(np.searchsorted(self.keys, low, side="left")),
+            int(np.searchsorted(self.keys, high, side="right")),
+        )
+
+    def _indicator_slice(self, indicator: str) -> slice:
+        code = self._indicator_index.get(indicator)
+        if code is None:
+            return slice(0, 0)
+        shift = _ENTITY_BITS + _YEAR_BITS
+        return self._bounds(code << shift, ((code + 1) << shift) - 1)
+
+    def range(
+        self,
+        indicator: str,
+        entity: str,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """``(years, values)`` of one series within ``[start, end]``, as read-only views."""
+        indicator_code = self._indicator_index.get(indicator)
+        entity_code = self._entity_index.get(entity)
+        if indicator_code is None or entity_code is None:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        prefix = (indicator_code << (_ENTITY_BITS + _YEAR_BITS)) | (entity_code << _YEAR_BITS)
+        low = prefix | (max(start, 0) if start is not None else 0)
+        high = prefix | (min(end, (1 << _YEAR_BITS) - 1) if end is not None else (1 << _YEAR_BITS) - 1)
+        window = self._bounds(low, high)
+        return self.year[window], self.value[window]
+
+    def series(self, indicator: str, entity: str) -> pd.DataFrame:
+        years, values = self.range(indicator, entity)
+        return pd.DataFrame({"year": years, "value": values})
+
+    def indicators(self, topic: Optional[str] = None) -> List[IndicatorDef]:
+        return [definition for definition in self.catalog.values() if topic is None or definition.topic == topic]
+
+    def entities(self, indicator: str) -> List[str]:
+        """Entities of ``indicator`` in sheet order."""
+        return list(self._entities.get(indicator, ()))
+
+    def year_bounds(self, indicator: str) -> Optional[Tuple[int, int]]:
+        years = self.year[self._indicator_slice(indicator)]
+        if not len(years):
+            return None
+        return int(years.min()), int(years.max())
+
+    def frame(
+        self,
+        indicator: str,
+        entities: Optional[Sequence[str]] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """Long rows of ``indicator`` for ``entities`` (all when omitted) within the year range."""
+        names = list(entities) if entities is not None else self.entities(indicator)
+        parts = [(name, *self.range(indicator, name, start, end)) for name in names]
+        return pd.DataFrame(
+            {
+                "entity": np.repeat([name for name, _, _ in parts], [len(years) for _, years, _ in parts]),
+                "year": np.concatenate([years for _, years, _ in parts]) if parts else np.empty(0, dtype=np.int64),
+                "value": np.concatenate([values for _, _, values in parts]) if parts else np.empty(0),
+            }
+        )
+
+    def cube(self, indicators: Sequence[str]) -> IndicatorCube:
+        """Dense cube over ``indicators`` (entities as regions), built once per indicator set."""
+        key = tuple(indicators)
+        cube = self._cubes.get(key)
+        if cube is None:
+            with self._cubes_lock:
+                cube = self._cubes.get(key)
+                if cube is None:
+                    frames = [self.frame(indicator).assign(indicator=indicator) for indicator in key]
+                    cube = IndicatorCube.from_long(pd.concat(frames, ignore_index=True), region="entity")
+                    self._cubes[key] = cube
+        return cube
+
+
+_store: Optional[IndicatorStore] = None
+_store_versions: Optional[Tuple] = None
+_store_lock = threading.Lock()
+
+
+def _workbook_versions() -> Tuple:
+    paths: List[Path] = sorted({excel_data_path(definition.workbook) for definition in INDICATOR_CATALOG})
+    return tuple((path, _file_version(path)) for path in paths)
+
+
+def get_indicator_store() -> IndicatorStore:
+    """Shared store, rebuilt when one of the catalogued workbooks changes on disk."""
+    global _store, _store_versions
+    versions = _workbook_versions()
+    if _store is None or versions != _store_versions:
+        with _store_lock:
+            if _store is None or versions != _store_versions:
+                _store = IndicatorStore.from_workbooks()
+                _store_versions = versions
+    return _store
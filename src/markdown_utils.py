@@ -1,30 +1,19 @@
 from __future__ import annotations
 
 import re
-from textwrap import wrap
-from typing import Iterable, List
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List
 
+MAX_SUMMARY_BULLETS = 8
+SENTENCES_PER_PARAGRAPH = 3
+# Non-bullet lines are handed to the sentence splitter in batches of this size.
+LINE_BATCH = 128
 
-def _clean_lines(raw_text: str) -> List[str]:
-    text = raw_text.replace("\r", "\n")
-    text = re.sub(r"\u00a0", " ", text)
-    lines = [line.strip() for line in text.splitlines()]
-    return [line for line in lines if line]
-
-
-def _chunk_sentences(sentences: Iterable[str], chunk_size: int = 3) -> List[str]:
-    paragraphs: List[str] = []
-    current: List[str] = []
-    for sentence in sentences:
-        if not sentence:
-            continue
-        current.append(sentence.strip())
-        if len(current) >= chunk_size:
-            paragraphs.append(" ".join(current))
-            current = []
-    if current:
-        paragraphs.append(" ".join(current))
-    return paragraphs
+# Same separators as str.splitlines(); "\r" counts on its own.
+_LINE = re.compile(r"[^\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]+")
+_SPACES = re.compile(r"\s+")
+_DIGIT_GAP = re.compile(r"(\d)\s+(\d)")
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+(?=[A-Za-z가-힣0-9])")
 
 
 def auto_format_text(raw_text: str) -> str:
@@ -35,34 +24,127 @@ def auto_format_text(raw_text: str) -> str:
       * normalises spacing
       * converts ▪ markers into bullet points
       * groups remaining sentences into short paragraphs
+
+    The text is processed in a single streaming pass (see
+    ``iter_formatted_blocks``) rather than through whole-string copies.
+    """
+    return assemble_markdown(iter_formatted_blocks((raw_text,)))
+
+
+@dataclass(frozen=True)
+class FormattedBlock:
+    kind: str  # "bullet" | "paragraph"
+    text: str
+
+
+def _iter_clean_lines(text: str) -> Iterator[str]:
+    for match in _LINE.finditer(text):
+        line = match.group().replace("\u00a0", " ").strip()
+        if line:
+            yield line
+
+
+class _SentenceStream:
+    """Incremental equivalent of joining lines with spaces, collapsing
+    whitespace, closing digit gaps and splitting sentences.
+
+    Text is only normalised up to the last character that is neither a digit
+    nor whitespace: no whitespace run or digit gap can straddle that point,
+    so chunked regex passes give the same result as one pass over the whole
+    string. Only the unfinished sentence and that short tail are buffered.
     """
 
-    lines = _clean_lines(raw_text)
-    if not lines:
-        return ""
+    def __init__(self) -> None:
+        self._tail = ""
+        self._started = False
+        self._parts: List[str] = []
+        self._last = ""
+
+    def feed(self, line: str) -> List[str]:
+        raw = f"{self._tail} {line}" if self._started else line
+        self._started = True
+        cut = len(raw)
+        while cut and (raw[cut - 1].isspace() or raw[cut - 1].isdecimal()):
+            cut -= 1
+        self._tail = raw[cut:]
+        return self._push(raw[:cut]) if cut else []
+
+    def finish(self) -> List[str]:
+        sentences = self._push(self._tail) if self._tail else []
+        self._tail = ""
+        rest = "".join(self._parts)
+        self._parts = []
+        if rest:
+            sentences.append(rest)
+        return sentences
+
+    def _push(self, text: str) -> List[str]:
+        text = _DIGIT_GAP.sub(r"\1\2", _SPACES.sub(" ", text))
+        # Prefix the previous character so the look-behind sees across chunks.
+        probe = self._last + text
+        start = len(self._last)
+        sentences: List[str] = []
+        for match in _SENTENCE_BOUNDARY.finditer(probe, start):
+            self._parts.append(probe[start : match.start()])
+            sentences.append("".join(self._parts))
+            self._parts = []
+            start = match.end()
+        self._parts.append(probe[start:])
+        self._last = probe[-1:]
+        return sentences
 
-    bullet_lines = [line.lstrip("▪").strip() for line in lines if line.startswith("▪")]
-    other_lines = [line for line in lines if not line.startswith("▪")]
 
-    joined = " ".join(other_lines)
-    # Collapse multiple spaces and fix stray hyphenated numbers
-    joined = re.sub(r"\s+", " ", joined)
-    joined = re.sub(r"(\d)\s+(\d)", r"\1\2", joined)
+def iter_formatted_blocks(chunks: Iterable[str]) -> Iterator[FormattedBlock]:
+    """Stream ``auto_format_text`` output blocks from text chunks such as PDF pages.
+
+    Summary bullets and paragraphs are yielded as soon as they are complete;
+    ``assemble_markdown`` turns the blocks into the same document
+    ``auto_format_text`` returns for the joined text.
+    """
+    stream = _SentenceStream()
+    bullets = 0
+    current: List[str] = []
 
-    sentences = re.split(r"(?<=[.!?])\s+(?=[A-Za-z가-힣0-9])", joined)
-    paragraphs = _chunk_sentences(sentences, chunk_size=3)
+    def _paragraphs(sentences: List[str]) -> Iterator[FormattedBlock]:
+        for sentence in sentences:
+            if not sentence:
+                continue
+            current.append(sentence.strip())
+            if len(current) >= SENTENCES_PER_PARAGRAPH:
+                yield FormattedBlock("paragraph", " ".join(current))
+                current.clear()
 
+    batch: List[str] = []
+    for chunk in chunks:
+        for line in _iter_clean_lines(chunk):
+            if line.startswith("▪"):
+                bullets += 1
+                if bullets <= MAX_SUMMARY_BULLETS:
+                    yield FormattedBlock("bullet", line.lstrip("▪").strip())
+                continue
+            batch.append(line)
+            if len(batch) >= LINE_BATCH:
+                # Feeding "a b" is the same as feeding "a" then "b".
+                yield from _paragraphs(stream.feed(" ".join(batch)))
+                batch.clear()
+        if batch:
+            yield from _paragraphs(stream.feed(" ".join(batch)))
+            batch.clear()
+    yield from _paragraphs(stream.finish())
+    if current:
+        yield FormattedBlock("paragraph", " ".join(current))
+
+
+def assemble_markdown(blocks: Iterable[FormattedBlock]) -> str:
+    bullets: List[str] = []
+    paragraphs: List[str] = []
+    for block in blocks:
+        (bullets if block.kind == "bullet" else paragraphs).append(block.text)
     parts: List[str] = []
-    if bullet_lines:
+    if bullets:
         parts.append("## 핵심 요약")
-        for bullet in bullet_lines[:8]:
-            parts.append(f"- {bullet}")
-        parts.append("")
-
+        parts.extend(f"- {bullet}" for bullet in bullets)
     if paragraphs:
         parts.append("## 상세 내용")
-        for paragraph in paragraphs:
-            parts.append(paragraph)
-
-    formatted = "\n\n".join(part.strip() for part in parts if part.strip())
-    return formatted.strip()
+        parts.extend(paragraphs)
+    return "\n\n".join(part.strip() for part in parts if part.strip()).strip()
@@ -1,6 +1,7 @@
-from .registry import PageDefinition, all_pages, ensure_loaded, get, page, register
+from .registry import PAGE_MANIFEST, PageDefinition, all_pages, ensure_loaded, get, page, register
 
 __all__ = [
+    "PAGE_MANIFEST",
     "PageDefinition",
     "all_pages",
     "ensure_loaded",
@@ -7,7 +7,7 @@ from typing import Dict, List
 
 import streamlit as st
 
-from ..content_loader import load_index
+from ..content_loader import load_index, reindex_content
 from ..data import CATEGORIES
 from .registry import page
 
@@ -134,8 +134,10 @@ def _save_changes(
     updates: Dict[str, str],
     body_text: str,
 ) -> None:
+    previous = None
     for item in items:
         if item.get("id") == target_id:
+            previous = dict(item)
             item.update(updates)
             break
     INDEX_PATH.write_text(
@@ -145,6 +147,7 @@ def _save_changes(
     body_path = updates.get("body")
     if body_path:
         (CONTENT_DIR / body_path).write_text(body_text, encoding="utf-8")
+    reindex_content(target_id, previous)
 
 
 def _trigger_rerun() -> None:
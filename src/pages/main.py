@@ -2,7 +2,14 @@ import html
 
 import streamlit as st
 from ..ui import top_blue_bar, category_bar, year_list
-from ..content_loader import get_contents, search_contents
+from ..content_loader import (
+    SearchSnippet,
+    get_contents,
+    search_contents,
+    search_snippets,
+    suggest_contents,
+    typeahead_contents,
+)
 from ..data import CATEGORIES
 from .registry import page
 
@@ -37,6 +44,8 @@ def render(context: dict | None = None):
                 st.experimental_rerun()
 
     search_query = st.session_state.get("content_search_query", "").strip()
+    if search_query:
+        _render_suggestions(search_query)
 
     left, right = st.columns([3, 1])
     with right:
@@ -67,9 +76,14 @@ def render(context: dict | None = None):
 
         # 필터링된 콘텐츠
         cat = st.session_state.get("selected_category", "all")
+        snippets = {}
         if search_query:
             items = search_contents(search_query, category_key=cat)
             st.caption(f"검색 결과 {len(items)}건")
+            if items.corrected:
+                st.caption(f"'{items.corrected}'(으)로 교정한 검색 결과를 함께 표시합니다.")
+            _render_typeahead_links(search_query, cat, items)
+            snippets = search_snippets(search_query, items)
         else:
             items = get_contents(cat)
         if not items:
@@ -89,10 +103,15 @@ def render(context: dict | None = None):
 
                 label_text = labels_lookup.get(item.get("category", ""), item.get("category", ""))
                 title_text = item.get("title", "제목 미정")
-                summary_text = item.get("summary") or "자세히 보기에서 주요 내용을 확인하세요."
-                summary_text = " ".join(summary_text.split())
-                if len(summary_text) > 120:
-                    summary_text = summary_text[:117] + "..."
+                snippet = snippets.get(item.get("id"))
+                if snippet is not None:
+                    summary_html = _snippet_html(snippet)
+                else:
+                    summary_text = item.get("summary") or "자세히 보기에서 주요 내용을 확인하세요."
+                    summary_text = " ".join(summary_text.split())
+                    if len(summary_text) > 120:
+                        summary_text = summary_text[:117] + "..."
+                    summary_html = html.escape(summary_text)
 
                 detail_url = f"?page=detail&content_id={item.get('id')}"
                 image_url = item.get("img")
@@ -108,7 +127,7 @@ def render(context: dict | None = None):
                     <span class="badge">{html.escape(label_text or '')}</span>
                     {media_block}
                     <h4>{html.escape(title_text)}</h4>
-                    <p>{html.escape(summary_text)}</p>
+                    <p>{summary_html}</p>
                     <a class="cta" href="{html.escape(detail_url)}" target="_self">자세히 보기</a>
                   </div>
                 </div>
@@ -116,3 +135,50 @@ def render(context: dict | None = None):
 
                 with col:
                     st.markdown(card_html, unsafe_allow_html=True)
+
+
+def _snippet_html(snippet: SearchSnippet) -> str:
+    parts = []
+    last = 0
+    for start, end in snippet.spans:
+        parts.append(html.escape(snippet.text[last:start]))
+        parts.append(f"<mark>{html.escape(snippet.text[start:end])}</mark>")
+        last = end
+    parts.append(html.escape(snippet.text[last:]))
+    return "".join(parts)
+
+
+def _apply_suggestion(text: str) -> None:
+    st.session_state.content_search_query = text
+
+
+def _render_typeahead_links(search_query: str, category_key: str, results: list) -> None:
+    # 자동완성 인덱스로 찾은 콘텐츠 중 검색 결과에 없는 것만 바로가기로 덧붙인다.
+    shown = {item.get("id") for item in results}
+    extra = [item for item in typeahead_contents(search_query, category_key=category_key) if item.get("id") not in shown]
+    if not extra:
+        return
+    links = " · ".join(
+        f'<a href="?page=detail&content_id={html.escape(str(item.get("id")))}" target="_self">'
+        f'{html.escape(item.get("title", "제목 미정"))}</a>'
+        for item in extra[:4]
+    )
+    st.markdown(f'<div class="search-typeahead">자동완성 바로가기: {links}</div>', unsafe_allow_html=True)
+
+
+def _render_suggestions(search_query: str) -> None:
+    # 접두어 인덱스만 조회하므로 전체 검색 랭킹을 다시 돌리지 않는다.
+    suggestions = [s for s in suggest_contents(search_query, k=6) if s.text != search_query]
+    if not suggestions:
+        return
+    st.caption("추천 검색어")
+    cols = st.columns(len(suggestions))
+    for index, (col, suggestion) in enumerate(zip(cols, suggestions)):
+        with col:
+            st.button(
+                suggestion.text,
+                key=f"search_suggestion_{index}",
+                on_click=_apply_suggestion,
+                args=(suggestion.text,),
+                help="제목" if suggestion.kind == "title" else None,
+            )
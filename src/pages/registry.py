@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 from importlib import import_module
 from pkgutil import iter_modules
@@ -13,10 +14,23 @@ class PageDefinition:
     description: Optional[str] = None
     icon: Optional[str] = None
     render: Callable[..., None] | None = None
+    module: Optional[str] = None
 
 
+# Known pages and the module that renders each one, so navigation can list
+# them without importing their (pandas/plotly-heavy) modules. Entries must
+# match the ``@page`` declaration in the module.
+PAGE_MANIFEST: Dict[str, PageDefinition] = {
+    "landing": PageDefinition("landing", title="랜딩", description="랜딩 화면", module="landing"),
+    "main": PageDefinition("main", title="메인", description="카테고리별 개요", module="main"),
+    "detail": PageDefinition("detail", title="콘텐츠 상세", description="선택된 콘텐츠 상세 시각화", module="detail"),
+    "admin": PageDefinition("admin", title="콘텐츠 관리", description="콘텐츠 수정 및 저장", icon="🛠️", module="admin"),
+}
+
 _registry: Dict[str, PageDefinition] = {}
 _modules_loaded = False
+_load_lock = threading.RLock()
+_PACKAGE = __name__.rsplit(".", 1)[0]
 
 
 def register(page: PageDefinition) -> None:
@@ -24,6 +38,9 @@ def register(page: PageDefinition) -> None:
         raise ValueError(f"Page with slug '{page.slug}' already registered")
     if page.render is None:
         raise ValueError("Page definition requires a render callable")
+    listed = PAGE_MANIFEST.get(page.slug)
+    if listed is not None and (listed.title, listed.description, listed.icon) != (page.title, page.description, page.icon):
+        raise ValueError(f"Page '{page.slug}' does not match its PAGE_MANIFEST entry")
     _registry[page.slug] = page
 
 
@@ -38,6 +55,7 @@ def page(slug: str, *, title: str, description: str | None = None, icon: str | N
                 description=description,
                 icon=icon,
                 render=func,
+                module=func.__module__.rsplit(".", 1)[-1],
             )
         )
         return func
@@ -46,28 +64,41 @@ def page(slug: str, *, title: str, description: str | None = None, icon: str | N
 
 
 def ensure_loaded() -> None:
+    """Import every page module, including ones missing from ``PAGE_MANIFEST``."""
     global _modules_loaded
     if _modules_loaded:
         return
 
-    package = __name__.rsplit(".", 1)[0]
-    package_module = import_module(package)
+    package_module = import_module(_PACKAGE)
     package_path = getattr(package_module, "__path__", None)
     if not package_path:
         return
 
-    for module_info in iter_modules(package_path):
-        name = module_info.name
-        if name.startswith("_") or name == "registry":
-            continue
-        import_module(f"{package}.{name}")
-
-    _modules_loaded = True
+    with _load_lock:
+        for module_info in iter_modules(package_path):
+            name = module_info.name
+            if name.startswith("_") or name == "registry":
+                continue
+            import_module(f"{_PACKAGE}.{name}")
+        _modules_loaded = True
 
 
 def get(slug: str) -> Optional[PageDefinition]:
+    """Page ``slug`` with its render function, importing only that page's module."""
+    loaded = _registry.get(slug)
+    if loaded is not None:
+        return loaded
+    listed = PAGE_MANIFEST.get(slug)
+    if listed is None or listed.module is None:
+        return None
+    with _load_lock:
+        import_module(f"{_PACKAGE}.{listed.module}")
     return _registry.get(slug)
 
 
 def all_pages() -> Iterable[PageDefinition]:
-    return _registry.values()
+    """Every known page; manifest entries not imported yet have ``render=None``."""
+    pages = {slug: _registry.get(slug, listed) for slug, listed in PAGE_MANIFEST.items()}
+    for slug, loaded in _registry.items():
+        pages.setdefault(slug, loaded)
+    return pages.values()
@@ -0,0 +1,190 @@
+"""Rolling per-renderer timings for story figures and interactive panels.
+
+Wall and CPU time are recorded for every call; they cost two clock reads.
+A sampled fraction of calls (``EDA_RENDER_PROFILE_SAMPLE``, default off)
+also records peak traced allocation and the serialized figure size, which
+are too expensive to measure on every rerun.
+"""
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import random
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+SAMPLE_RATE = float(os.environ.get("EDA_RENDER_PROFILE_SAMPLE", 0) or 0)
+WINDOW = 256
+# Upper bucket edges in milliseconds; the last bucket is open-ended.
+WALL_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+@dataclass(frozen=True)
+class RenderSample:
+    at: float
+    wall_ms: float
+    cpu_ms: float
+    cached: bool = False
+    error: bool = False
+    traces: Optional[int] = None
+    peak_kib: Optional[float] = None
+    json_kib: Optional[float] = None
+
+
+class RenderProbe:
+    """Filled in by the instrumented call: the figure it produced and whether it came from cache."""
+
+    __slots__ = ("figure", "cached", "error")
+
+    def __init__(self) -> None:
+        self.figure: Any = None
+        self.cached = False
+        self.error = False
+
+
+class RenderMetrics:
+    def __init__(self, window: int = WINDOW) -> None:
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples: Dict[str, Deque[RenderSample]] = {}
+        self._totals: Dict[str, int] = {}
+        # tracemalloc is process-wide, so only one call is traced at a time.
+        self._tracing = threading.Lock()
+
+    def record(self, name: str, sample: RenderSample) -> None:
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self.window)
+            samples.append(sample)
+            self._totals[name] = self._totals.get(name, 0) + 1
+
+    @contextmanager
+    def track(self, name: str, *, sample_rate: Optional[float] = None) -> Iterator[RenderProbe]:
+        rate = SAMPLE_RATE if sample_rate is None else sample_rate
+        traced = rate > 0 and random.random() < rate and self._tracing.acquire(blocking=False)
+        started_tracing = False
+        if traced:
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                started_tracing = True
+        probe = RenderProbe()
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield probe
+        except BaseException:
+            probe.error = True
+            raise
+        finally:
+            wall_ms = (time.perf_counter() - wall_start) * 1000
+            cpu_ms = (time.thread_time() - cpu_start) * 1000
+            peak_kib = json_kib = None
+            if traced:
+                peak_kib = tracemalloc.get_traced_memory()[1] / 1024
+                if started_tracing:
+                    tracemalloc.stop()
+                self._tracing.release()
+            figure = probe.figure
+            traces = len(figure.data) if figure is not None else None
+            if traced and figure is not None:
+                json_kib = len(figure.to_json()) / 1024
+            self.record(
+                name,
+                RenderSample(
+                    at=time.time(),
+                    wall_ms=wall_ms,
+                    cpu_ms=cpu_ms,
+                    cached=probe.cached,
+                    error=probe.error,
+                    traces=traces,
+                    peak_kib=peak_kib,
+                    json_kib=json_kib,
+                ),
+            )
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Summary per renderer over its last ``window`` calls, slowest p95 first."""
+        with self._lock:
+            windows = {name: list(samples) for name, samples in self._samples.items()}
+            totals = dict(self._totals)
+        summary = {name: _summarize(samples, totals[name]) for name, samples in windows.items()}
+        return dict(sorted(summary.items(), key=lambda item: -item[1]["wall_ms"]["p95"]))
+
+    def samples(self, name: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [asdict(sample) for sample in self._samples.get(name, ())]
+
+    def to_json(self) -> str:
+        payload = {
+            "generated_at": time.time(),
+            "sample_rate": SAMPLE_RATE,
+            "window": self.window,
+            "wall_buckets_ms": list(WALL_BUCKETS_MS),
+            "renderers": self.snapshot(),
+        }
+        return json.dumps(payload, ensure_ascii=False, indent=2)
+
+    def dump(self, path: Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.to_json(), encoding="utf-8")
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self._totals.clear()
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def _stats(values: List[float]) -> Dict[str, float]:
+    return {
+        "p50": round(_percentile(values, 0.5), 3),
+        "p95": round(_percentile(values, 0.95), 3),
+        "max": round(max(values), 3) if values else 0.0,
+    }
+
+
+def _histogram(values: List[float]) -> List[int]:
+    counts = [0] * (len(WALL_BUCKETS_MS) + 1)
+    for value in values:
+        counts[bisect.bisect_left(WALL_BUCKETS_MS, value)] += 1
+    return counts
+
+
+def _summarize(samples: List[RenderSample], total: int) -> Dict[str, Any]:
+    wall = [sample.wall_ms for sample in samples]
+    rendered = [sample.wall_ms for sample in samples if not sample.cached and not sample.error]
+    peaks = [sample.peak_kib for sample in samples if sample.peak_kib is not None]
+    sizes = [sample.json_kib for sample in samples if sample.json_kib is not None]
+    traces = [sample.traces for sample in samples if sample.traces is not None]
+    return {
+        "calls": total,
+        "window": len(samples),
+        "errors": sum(sample.error for sample in samples),
+        "cache_hits": sum(sample.cached for sample in samples),
+        "wall_ms": {**_stats(wall), "histogram": _histogram(wall)},
+        "render_wall_ms": _stats(rendered),
+        "cpu_ms": _stats([sample.cpu_ms for sample in samples]),
+        "peak_kib": _stats(peaks) if peaks else None,
+        "json_kib": _stats(sizes) if sizes else None,
+        "traces": traces[-1] if traces else None,
+    }
+
+
+METRICS = RenderMetrics()
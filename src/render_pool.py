@@ -0,0 +1,184 @@
+"""Run story renderers in warm worker processes with a per-call timeout.
+
+Enabled with ``EDA_RENDER_WORKERS`` (number of workers, default 0 = render
+in-process). Each worker imports the renderer modules once and answers
+``(renderer, slug, slot)`` requests with figure JSON. A call that runs past
+``EDA_RENDER_TIMEOUT`` seconds has its worker killed and replaced, and the
+caller gets the last figure that renderer produced successfully (if any).
+Workers whose resident memory grows past ``EDA_RENDER_WORKER_MAX_MB`` are
+recycled after answering.
+"""
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+RENDER_WORKERS = int(os.environ.get("EDA_RENDER_WORKERS", 0) or 0)
+RENDER_TIMEOUT = float(os.environ.get("EDA_RENDER_TIMEOUT", 10) or 10)
+WORKER_MAX_MB = float(os.environ.get("EDA_RENDER_WORKER_MAX_MB", 1024) or 1024)
+LAST_GOOD_SIZE = 256
+
+FigureDict = Dict[str, Any]
+
+
+def _resident_mb() -> float:
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as handle:
+            pages = int(handle.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        import resource
+
+        # Peak rather than current RSS; kilobytes on Linux, bytes on macOS.
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if peak > 1 << 32 else peak / 1024
+
+
+def _worker_main(conn) -> None:
+    # Warm the heavy imports before the first request arrives.
+    import plotly.graph_objects as go
+
+    from .visual_registry import get_renderer
+
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+        renderer_name, story_slug, slot_id = request
+        try:
+            func = get_renderer(renderer_name)
+            if func is None:
+                raise LookupError(f"렌더러 '{renderer_name}'를 찾을 수 없습니다.")
+            fig = func(story_slug, slot_id)
+            if fig is None:
+                raise ValueError("렌더러가 Plotly Figure를 반환하지 않았습니다.")
+            if not isinstance(fig, go.Figure):
+                fig = go.Figure(fig)
+            conn.send(("ok", fig.to_json(), _resident_mb()))
+        except Exception as exc:  # pragma: no cover - reported to the caller
+            conn.send(("error", str(exc), _resident_mb()))
+
+
+class _Worker:
+    def __init__(self, context) -> None:
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn,), daemon=True, name="story-renderer")
+        self.process.start()
+        child_conn.close()
+
+    def kill(self) -> None:
+        try:
+            self.conn.close()
+        finally:
+            if self.process.is_alive():
+                self.process.kill()
+            self.process.join(timeout=1)
+
+
+class RenderPool:
+    def __init__(self, workers: int, *, timeout: float = RENDER_TIMEOUT, max_mb: float = WORKER_MAX_MB) -> None:
+        self.size = workers
+        self.timeout = timeout
+        self.max_mb = max_mb
+        # spawn: forking a process that runs Streamlit's threads is unsafe.
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: List[_Worker] = [_Worker(self._context) for _ in range(workers)]
+        self._available = threading.Condition()
+        # Guards _last_good and the counters; render() runs on Streamlit's session threads.
+        self._stats_lock = threading.Lock()
+        self._last_good: "OrderedDict[Tuple[str, str, str], FigureDict]" = OrderedDict()
+        self.recycled = 0
+        self.timeouts = 0
+
+    def _acquire(self, deadline: float) -> Optional[_Worker]:
+        with self._available:
+            while not self._idle:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._available.wait(remaining):
+                    return None
+            return self._idle.pop()
+
+    def _release(self, worker: Optional[_Worker], *, recycle: bool = False) -> None:
+        if worker is not None and (recycle or not worker.process.is_alive()):
+            worker.kill()
+            with self._stats_lock:
+                self.recycled += 1
+            worker = _Worker(self._context)
+        with self._available:
+            if worker is not None:
+                self._idle.append(worker)
+            self._available.notify()
+
+    def _fallback(self, key: Tuple[str, str, str], message: str) -> Tuple[Optional[FigureDict], Optional[str], bool]:
+        with self._stats_lock:
+            last = self._last_good.get(key)
+        if last is not None:
+            return last, None, True
+        return None, message, True
+
+    def render(self, renderer_name: str, story_slug: str, slot_id: str) -> Tuple[Optional[FigureDict], Optional[str], bool]:
+        """``(figure_dict, error, stale)``; ``stale`` marks a last-good figure served after a failure."""
+        key = (renderer_name, story_slug, slot_id)
+        deadline = time.monotonic() + self.timeout
+        worker = self._acquire(deadline)
+        if worker is None:
+            return self._fallback(key, "렌더러 작업자가 모두 사용 중입니다.")
+        recycle = False
+        try:
+            worker.conn.send(key)
+            if not worker.conn.poll(max(deadline - time.monotonic(), 0)):
+                with self._stats_lock:
+                    self.timeouts += 1
+                recycle = True
+                return self._fallback(key, f"렌더러 '{renderer_name}'가 {self.timeout:g}초 안에 끝나지 않았습니다.")
+            status, body, resident_mb = worker.conn.recv()
+            recycle = resident_mb > self.max_mb
+        except (EOFError, OSError, BrokenPipeError):
+            recycle = True
+            return self._fallback(key, f"렌더러 '{renderer_name}' 작업자가 비정상 종료되었습니다.")
+        finally:
+            self._release(worker, recycle=recycle)
+
+        if status != "ok":
+            return None, body, False
+        figure = json.loads(body)
+        with self._stats_lock:
+            self._last_good[key] = figure
+            self._last_good.move_to_end(key)
+            if len(self._last_good) > LAST_GOOD_SIZE:
+                self._last_good.popitem(last=False)
+        return figure, None, False
+
+    def close(self) -> None:
+        with self._available:
+            workers, self._idle = self._idle, []
+        for worker in workers:
+            try:
+                worker.conn.send(None)
+            except (OSError, BrokenPipeError):
+                pass
+            worker.kill()
+
+
+_pool: Optional[RenderPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_render_pool() -> Optional[RenderPool]:
+    """Shared pool, started on first use; ``None`` when out-of-process rendering is off."""
+    global _pool
+    if RENDER_WORKERS <= 0:
+        return None
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = RenderPool(RENDER_WORKERS)
+    return _pool
@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+FORMAT_VERSION = 1
+# Bumped when postings became per-document maps.
+SENTENCE_FORMAT_VERSION = 2
+
+Tokenizer = Callable[[str], List[str]]
+
+_NON_WORD = re.compile(r"[^0-9a-zA-Z가-힣ㄱ-ㅣ]+")
+
+
+def normalize(text: str) -> str:
+    """Lower-case and drop everything but letters, digits and Hangul."""
+    return _NON_WORD.sub("", text.lower())
+
+
+def ngram_terms(text: str) -> List[str]:
+    """Characters and character bigrams of the normalised text."""
+    normalized = normalize(text)
+    grams = list(normalized)
+    grams.extend(normalized[i : i + 2] for i in range(len(normalized) - 1))
+    return grams
+
+
+def bigram_terms(text: str) -> List[str]:
+    normalized = normalize(text)
+    return [normalized[i : i + 2] for i in range(len(normalized) - 1)]
+
+
+class NgramIndex:
+    """Inverted index from n-grams to per-field term frequencies.
+
+    ``postings[gram]`` is a list of ``[doc_index, tf_field0, tf_field1, ...]``
+    rows sorted by document index, so a query only touches the postings of
+    its own n-grams.
+    """
+
+    def __init__(
+        self,
+        fields: Sequence[str],
+        doc_ids: List[str],
+        postings: Dict[str, List[List[int]]],
+        *,
+        signature: Any = None,
+    ) -> None:
+        self.fields = tuple(fields)
+        self.doc_ids = doc_ids
+        self.postings = postings
+        self.signature = signature
+        self._positions = {doc_id: index for index, doc_id in enumerate(doc_ids)}
+
+    @classmethod
+    def build(
+        cls,
+        fields: Sequence[str],
+        documents: Iterable[Tuple[str, Dict[str, str]]],
+        tokenize: Tokenizer,
+        *,
+        signature: Any = None,
+    ) -> "NgramIndex":
+        doc_ids: List[str] = []
+        postings: Dict[str, List[List[int]]] = {}
+        for doc_index, (doc_id, texts) in enumerate(documents):
+            doc_ids.append(doc_id)
+            for gram, row in _doc_rows(fields, texts, tokenize).items():
+                postings.setdefault(gram, []).append([doc_index, *row])
+        return cls(fields, doc_ids, postings, signature=signature)
+
+    def match(self, grams: Iterable[str]) -> Dict[int, List[int]]:
+        """Per document, how many of ``grams`` occur in each field."""
+        hits: Dict[int, List[int]] = {}
+        width = len(self.fields)
+        for gram in set(grams):
+            for row in self.postings.get(gram, ()):
+                counts = hits.get(row[0])
+                if counts is None:
+                    counts = hits[row[0]] = [0] * width
+                for field_index in range(width):
+                    if row[field_index + 1]:
+                        counts[field_index] += 1
+        return hits
+
+    def replace(
+        self,
+        doc_index: int,
+        texts: Dict[str, str],
+        tokenize: Tokenizer,
+        *,
+        previous: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Swap one document's postings for those of ``texts``.
+
+        With ``previous`` (the texts that were indexed) only their n-grams are
+        visited; otherwise every posting list is checked for the document.
+        """
+        stale = _doc_rows(self.fields, previous, tokenize) if previous is not None else self.postings
+        for gram in list(stale):
+            rows = self.postings.get(gram)
+            if not rows:
+                continue
+            at = _row_position(rows, doc_index)
+            if at < len(rows) and rows[at][0] == doc_index:
+                del rows[at]
+                if not rows:
+                    del self.postings[gram]
+        for gram, row in _doc_rows(self.fields, texts, tokenize).items():
+            rows = self.postings.setdefault(gram, [])
+            rows.insert(_row_position(rows, doc_index), [doc_index, *row])
+
+    def position(self, doc_id: str) -> Optional[int]:
+        return self._positions.get(doc_id)
+
+    # -- persistence ----------------------------------------------------
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "version": FORMAT_VERSION,
+            "signature": self.signature,
+            "fields": list(self.fields),
+            "docs": self.doc_ids,
+            "postings": self.postings,
+        }
+
+    @classmethod
+    def from_json(cls, payload: Dict[str, Any]) -> Optional["NgramIndex"]:
+        if payload.get("version") != FORMAT_VERSION:
+            return None
+        return cls(payload["fields"], payload["docs"], payload["postings"], signature=payload.get("signature"))
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(self.to_json(), ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path, signature: Any) -> Optional["NgramIndex"]:
+        """Load a persisted index if it was built for ``signature``."""
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if payload.get("signature") != signature:
+            return None
+        return cls.from_json(payload)
+
+
+_SENTENCE_END = re.compile(r"(?<=[.!?。])\s+|\n+")
+_LINE_MARKUP = re.compile(r"[#>*\-+\s]+|\d+\.\s+")
+
+
+def sentence_spans(text: str) -> List[Tuple[int, int]]:
+    """``(start, end)`` offsets of the sentences in ``text``, leading markdown markup skipped."""
+    spans: List[Tuple[int, int]] = []
+    start = 0
+    for boundary in [*_SENTENCE_END.finditer(text), None]:
+        end = boundary.start() if boundary else len(text)
+        markup = _LINE_MARKUP.match(text, start, end)
+        begin = markup.end() if markup else start
+        if begin < end:
+            spans.append((begin, end))
+        if boundary:
+            start = boundary.end()
+    return spans
+
+
+class SentenceIndex:
+    """Sentence offsets plus a bigram → sentences map, both per document.
+
+    ``offsets[doc]`` is a flat ``[start0, end0, start1, end1, ...]`` list and
+    ``postings[doc][gram]`` the sentences of ``doc`` containing ``gram``, so
+    locating the best passage of a hit touches only that hit's postings and
+    never rescans the document text; replacing a document swaps its entry.
+    """
+
+    def __init__(
+        self,
+        offsets: List[List[int]],
+        postings: List[Dict[str, List[int]]],
+        *,
+        signature: Any = None,
+    ) -> None:
+        self.offsets = offsets
+        self.postings = postings
+        self.signature = signature
+
+    @classmethod
+    def build(cls, texts: Iterable[str], tokenize: Tokenizer, *, signature: Any = None) -> "SentenceIndex":
+        index = cls([], [], signature=signature)
+        for text in texts:
+            offsets, postings = _sentence_rows(text, tokenize)
+            index.offsets.append(offsets)
+            index.postings.append(postings)
+        return index
+
+    def replace(self, doc_index: int, text: str, tokenize: Tokenizer) -> None:
+        self.offsets[doc_index], self.postings[doc_index] = _sentence_rows(text, tokenize)
+
+    def best_sentences(self, grams: Iterable[str], docs: Iterable[int]) -> Dict[int, Tuple[int, int]]:
+        """Per document in ``docs``, the sentence holding most of ``grams`` as ``(sentence, count)``."""
+        grams = set(grams)
+        best: Dict[int, Tuple[int, int]] = {}
+        for doc_index in set(docs):
+            if not 0 <= doc_index < len(self.postings):
+                continue
+            postings = self.postings[doc_index]
+            counts: Counter = Counter()
+            for gram in grams:
+                counts.update(postings.get(gram, ()))
+            if counts:
+                # Most grams first, the earliest sentence on ties.
+                best[doc_index] = min(counts.items(), key=lambda pair: (-pair[1], pair[0]))
+        return best
+
+    def span(self, doc_index: int, sentence: int) -> Optional[Tuple[int, int]]:
+        flat = self.offsets[doc_index] if doc_index < len(self.offsets) else []
+        if 2 * sentence + 1 >= len(flat):
+            return None
+        return flat[2 * sentence], flat[2 * sentence + 1]
+
+    def sentence_count(self, doc_index: int) -> int:
+        return len(self.offsets[doc_index]) // 2 if doc_index < len(self.offsets) else 0
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": SENTENCE_FORMAT_VERSION,
+            "signature": self.signature,
+            "offsets": self.offsets,
+            "postings": self.postings,
+        }
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path, signature: Any) -> Optional["SentenceIndex"]:
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if payload.get("version") != SENTENCE_FORMAT_VERSION or payload.get("signature") != signature:
+            return None
+        return cls(payload["offsets"], payload["postings"], signature=signature)
+
+
+def query_pattern(text: str, query: str) -> Optional[re.Pattern[str]]:
+    """Regex over the query words found in ``text``, else over its bigrams; ``None`` if neither occurs."""
+    words = sorted({word for word in query.split() if word}, key=len, reverse=True)
+    if words:
+        pattern = re.compile("|".join(re.escape(word) for word in words), re.IGNORECASE)
+        if pattern.search(text):
+            return pattern
+    normalized = normalize(query)
+    grams = sorted({normalized[i : i + 2] for i in range(len(normalized) - 1)} or set(normalized))
+    if not grams:
+        return None
+    pattern = re.compile("|".join(re.escape(gram) for gram in grams), re.IGNORECASE)
+    return pattern if pattern.search(text) else None
+
+
+def _sentence_rows(text: str, tokenize: Tokenizer) -> Tuple[List[int], Dict[str, List[int]]]:
+    offsets: List[int] = []
+    postings: Dict[str, List[int]] = {}
+    for sentence, (start, end) in enumerate(sentence_spans(text)):
+        offsets.extend((start, end))
+        for gram in set(tokenize(text[start:end])):
+            postings.setdefault(gram, []).append(sentence)
+    return offsets, postings
+
+
+def _doc_rows(fields: Sequence[str], texts: Dict[str, str], tokenize: Tokenizer) -> Dict[str, List[int]]:
+    rows: Dict[str, List[int]] = {}
+    for field_index, field in enumerate(fields):
+        for gram, count in Counter(tokenize(texts.get(field) or "")).items():
+            row = rows.get(gram)
+            if row is None:
+                row = rows[gram] = [0] * len(fields)
+            row[field_index] = count
+    return rows
+
+
+def _row_position(rows: List[List[int]], doc_index: int) -> int:
+    return bisect.bisect_left(rows, doc_index, key=lambda row: row[0])
+
+
+def file_signature(paths: Iterable[Path]) -> List[List[Any]]:
+    """``[name, mtime_ns, size]`` per path; missing files are recorded as such."""
+    signature: List[List[Any]] = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            signature.append([str(path), None, None])
+            continue
+        signature.append([str(path), stat.st_mtime_ns, stat.st_size])
+    return signature
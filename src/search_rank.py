@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .hangul import jamo_bigrams
+from .search_index import ngram_terms, normalize
+
+FORMAT_VERSION = 2
+K1 = 1.2
+
+Tokenizer = Callable[[str], List[str]]
+
+_BARE_JAMO = re.compile(r"[ㄱ-ㅣ]")
+
+
+def _jamo_terms(normalized: str) -> List[str]:
+    return ["~" + gram for gram in jamo_bigrams(normalized)]
+
+
+def rank_terms(text: str, *, jamo: bool = True) -> List[str]:
+    """Document terms: characters, character bigrams and (optionally) jamo bigrams."""
+    normalized = normalize(text)
+    terms = ngram_terms(normalized)
+    if jamo:
+        terms.extend(_jamo_terms(normalized))
+    return terms
+
+
+def query_rank_terms(query: str, *, jamo: bool = True) -> List[str]:
+    normalized = normalize(query)
+    if len(normalized) == 1:
+        terms = [normalized]
+    else:
+        terms = [normalized[i : i + 2] for i in range(len(normalized) - 1)]
+    # Only a half-typed syllable goes through jamo; whole-word jamo bigrams
+    # are too common to add anything but noise.
+    partial = _BARE_JAMO.search(normalized) if jamo else None
+    if partial:
+        terms.extend(_jamo_terms(normalized[max(partial.start() - 1, 0) :]))
+    return terms
+
+
+class BM25FRanker:
+    """BM25F over precomputed, array-backed term statistics.
+
+    Per-field term frequencies are folded into one saturated weight per
+    posting at build time, so a query is a handful of slices plus one
+    ``np.bincount`` over the matching postings. Postings are stored CSR-style:
+    the rows of term ``t`` are ``offsets[t]:offsets[t + 1]``.
+
+    ``replace`` re-scores a single document into a small overlay that
+    shadows its base postings; idf and average lengths stay as built until
+    the next full rebuild.
+    """
+
+    def __init__(
+        self,
+        doc_ids: List[str],
+        terms: Dict[str, int],
+        offsets: np.ndarray,
+        post_docs: np.ndarray,
+        post_weights: np.ndarray,
+        idf: np.ndarray,
+        *,
+        field_params: np.ndarray,
+        signature: Any = None,
+    ) -> None:
+        self.doc_ids = doc_ids
+        self.terms = terms
+        self.offsets = offsets
+        self.post_docs = post_docs
+        self.post_weights = post_weights
+        self.idf = idf
+        # Rows: field weight, b, average length
+        self.field_params = field_params
+        self.signature = signature
+        self._overlay: Dict[int, Dict[str, float]] = {}
+
+    @classmethod
+    def build(
+        cls,
+        fields: Sequence[str],
+        documents: Iterable[Tuple[str, Dict[str, str]]],
+        tokenize: Tokenizer,
+        *,
+        weights: Dict[str, float],
+        b: Dict[str, float],
+        signature: Any = None,
+    ) -> "BM25FRanker":
+        doc_ids: List[str] = []
+        term_freqs: List[List[Counter]] = []
+        for doc_id, texts in documents:
+            doc_ids.append(doc_id)
+            term_freqs.append([Counter(tokenize(texts.get(field) or "")) for field in fields])
+
+        n_docs, n_fields = len(doc_ids), len(fields)
+        lengths = np.zeros((n_docs, n_fields), dtype=np.float32)
+        for doc_index, per_field in enumerate(term_freqs):
+            for field_index, counts in enumerate(per_field):
+                lengths[doc_index, field_index] = sum(counts.values())
+        field_params = np.array(
+            [
+                [weights.get(field, 1.0) for field in fields],
+                [b.get(field, 0.75) for field in fields],
+                np.maximum(lengths.mean(axis=0), 1.0) if n_docs else np.ones(n_fields),
+            ],
+            dtype=np.float32,
+        )
+
+        postings: Dict[str, List[Tuple[int, float]]] = {}
+        for doc_index, per_field in enumerate(term_freqs):
+            for term, weight in _saturate(per_field, lengths[doc_index], field_params).items():
+                postings.setdefault(term, []).append((doc_index, weight))
+
+        terms: Dict[str, int] = {}
+        offsets = np.zeros(len(postings) + 1, dtype=np.int64)
+        docs_parts: List[int] = []
+        weight_parts: List[float] = []
+        idf = np.zeros(len(postings), dtype=np.float32)
+        for term_id, (term, rows) in enumerate(postings.items()):
+            terms[term] = term_id
+            offsets[term_id + 1] = offsets[term_id] + len(rows)
+            docs_parts.extend(row[0] for row in rows)
+            weight_parts.extend(row[1] for row in rows)
+            idf[term_id] = _idf(n_docs, len(rows))
+        return cls(
+            doc_ids,
+            terms,
+            offsets,
+            np.asarray(docs_parts, dtype=np.int32),
+            np.asarray(weight_parts, dtype=np.float32),
+            idf,
+            field_params=field_params,
+            signature=signature,
+        )
+
+    def replace(self, doc_index: int, fields: Sequence[str], texts: Dict[str, str], tokenize: Tokenizer) -> None:
+        """Re-score one document in place of its indexed postings."""
+        per_field = [Counter(tokenize(texts.get(field) or "")) for field in fields]
+        lengths = np.array([sum(counts.values()) for counts in per_field], dtype=np.float32)
+        self._overlay[doc_index] = _saturate(per_field, lengths, self.field_params)
+
+    def scores(self, query_terms: Iterable[str]) -> np.ndarray:
+        """BM25F score of every document (zeros where no term matched)."""
+        query_terms = set(query_terms)
+        term_ids = [self.terms[term] for term in query_terms if term in self.terms]
+        if term_ids:
+            docs = np.concatenate([self.post_docs[self.offsets[t] : self.offsets[t + 1]] for t in term_ids])
+            contrib = np.concatenate(
+                [self.post_weights[self.offsets[t] : self.offsets[t + 1]] * self.idf[t] for t in term_ids]
+            )
+            scores = np.bincount(docs, weights=contrib, minlength=len(self.doc_ids)).astype(np.float32)
+        else:
+            scores = np.zeros(len(self.doc_ids), dtype=np.float32)
+        for doc_index, weights in self._overlay.items():
+            scores[doc_index] = sum(weights[term] * self._term_idf(term) for term in query_terms if term in weights)
+        return scores
+
+    def _term_idf(self, term: str) -> float:
+        term_id = self.terms.get(term)
+        if term_id is None:
+            return _idf(len(self.doc_ids), 1)
+        return float(self.idf[term_id])
+
+    def rank(self, query_terms: Iterable[str], *, mask: Optional[np.ndarray] = None, limit: Optional[int] = None) -> List[Tuple[int, float]]:
+        """``(doc_index, score)`` for matching documents, best first; ties keep index order."""
+        scores = self.scores(query_terms)
+        if mask is not None:
+            scores = np.where(mask, scores, 0.0)
+        matched = np.flatnonzero(scores > 0)
+        if matched.size == 0:
+            return []
+        order = matched[np.argsort(-scores[matched], kind="stable")]
+        if limit is not None:
+            order = order[:limit]
+        return [(int(index), float(scores[index])) for index in order]
+
+    # -- persistence ----------------------------------------------------
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp.npz")
+        if self._overlay:
+            raise ValueError("ranker has unmerged overlay updates; rebuild before saving")
+        meta = {"version": FORMAT_VERSION, "signature": self.signature, "docs": self.doc_ids, "terms": list(self.terms)}
+        np.savez(
+            tmp_path,
+            meta=np.array(json.dumps(meta, ensure_ascii=False)),
+            offsets=self.offsets,
+            post_docs=self.post_docs,
+            post_weights=self.post_weights,
+            idf=self.idf,
+            field_params=self.field_params,
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path, signature: Any) -> Optional["BM25FRanker"]:
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                meta = json.loads(str(data["meta"]))
+                if meta.get("version") != FORMAT_VERSION or meta.get("signature") != signature:
+                    return None
+                return cls(
+                    meta["docs"],
+                    {term: index for index, term in enumerate(meta["terms"])},
+                    data["offsets"],
+                    data["post_docs"],
+                    data["post_weights"],
+                    data["idf"],
+                    field_params=data["field_params"],
+                    signature=signature,
+                )
+        except (OSError, ValueError, KeyError):
+            return None
+
+
+def _idf(n_docs: int, df: int) -> float:
+    return math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+
+
+def _saturate(per_field: Sequence[Counter], lengths: np.ndarray, field_params: np.ndarray) -> Dict[str, float]:
+    """Length-normalised, weighted term frequency per term, saturated by ``K1``."""
+    weight, b, avg = field_params
+    norms = weight / (1.0 - b + b * lengths / avg)
+    combined: Dict[str, float] = {}
+    for field_index, counts in enumerate(per_field):
+        norm = float(norms[field_index])
+        for term, count in counts.items():
+            combined[term] = combined.get(term, 0.0) + count * norm
+    return {term: tf / (K1 + tf) for term, tf in combined.items()}
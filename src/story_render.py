@@ -20,7 +20,8 @@ ENCODED_PATTERN = re.compile(
 )
 
 
-def _normalise_placeholders(content: str) -> str:
+def normalise_placeholders(content: str) -> str:
+    """Entity-encoded chart placeholders rewritten to ``{{chart}}`` / ``{{chart:id}}``, then HTML-unescaped."""
     def _replace_encoded(match: re.Match[str]) -> str:
         chart_id = match.group(3)
         if chart_id:
@@ -62,7 +63,7 @@ def render_story_content(
     if not content.strip() and not chart_renderer:
         return
 
-    normalised = _normalise_placeholders(content)
+    normalised = normalise_placeholders(content)
     segments = _split_segments(normalised)
 
     for kind, payload in segments:
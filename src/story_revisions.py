@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import base64
+import bisect
+import difflib
+import json
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .story_store import append_lines
+
+# Every KEYFRAME_INTERVAL-th revision stores the full body, so loading any
+# revision replays at most KEYFRAME_INTERVAL - 1 deltas.
+KEYFRAME_INTERVAL = 16
+BODY_FIELD = "markdown"
+
+
+def _compress(value: Any) -> bytes:
+    return zlib.compress(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), 6)
+
+
+def _decompress(blob: bytes) -> Any:
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+def encode_delta(previous: str, current: str) -> List[Any]:
+    """Line-level delta: ``[start, end]`` copies previous lines, a string inserts text."""
+    old_lines = previous.splitlines(keepends=True)
+    new_lines = current.splitlines(keepends=True)
+    ops: List[Any] = []
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append([i1, i2])
+        elif j2 > j1:
+            ops.append("".join(new_lines[j1:j2]))
+    return ops
+
+
+def apply_delta(previous: str, ops: Iterable[Any]) -> str:
+    old_lines = previous.splitlines(keepends=True)
+    parts: List[str] = []
+    for op in ops:
+        if isinstance(op, str):
+            parts.append(op)
+        else:
+            start, end = op
+            parts.extend(old_lines[start:end])
+    return "".join(parts)
+
+
+def build_record(rev: int, payload: Dict[str, Any], previous_body: Optional[str]) -> Dict[str, Any]:
+    body = payload.get(BODY_FIELD) or ""
+    meta = {key: value for key, value in payload.items() if key != BODY_FIELD}
+    if previous_body is None or rev % KEYFRAME_INTERVAL == 0:
+        kind, data = "key", _compress(body)
+    else:
+        kind, data = "delta", _compress(encode_delta(previous_body, body))
+    return {
+        "rev": rev,
+        "kind": kind,
+        "updated_at": payload.get("updated_at"),
+        "title": payload.get("title"),
+        "size": len(body),
+        "stored_bytes": len(data),
+        "meta": meta,
+        "data": data,
+    }
+
+
+def reconstruct(records: Sequence[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Rebuild the payload of the last record; ``records`` must start at a keyframe."""
+    if not records:
+        return None
+    body = ""
+    for record in records:
+        decoded = _decompress(record["data"])
+        body = decoded if record["kind"] == "key" else apply_delta(body, decoded)
+    payload = dict(records[-1].get("meta") or {})
+    payload[BODY_FIELD] = body
+    return payload
+
+
+def summarize(record: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "rev": record["rev"],
+        "kind": record["kind"],
+        "updated_at": record.get("updated_at"),
+        "title": record.get("title"),
+        "size": record.get("size", 0),
+        "stored_bytes": record.get("stored_bytes", 0),
+    }
+
+
+def unified_diff(old: Dict[str, Any], new: Dict[str, Any], *, old_label: str, new_label: str) -> str:
+    lines = difflib.unified_diff(
+        (old.get(BODY_FIELD) or "").splitlines(keepends=True),
+        (new.get(BODY_FIELD) or "").splitlines(keepends=True),
+        fromfile=old_label,
+        tofile=new_label,
+    )
+    return "".join(lines)
+
+
+class _KeyframeIndex:
+    """Byte offsets of one revision file's keyframes, tailed as the file grows."""
+
+    __slots__ = ("inode", "end", "last_rev", "revs", "offsets")
+
+    def __init__(self, inode: Optional[Tuple[int, int]]) -> None:
+        self.inode = inode
+        self.end = 0
+        self.last_rev = 0
+        self.revs: List[int] = []
+        self.offsets: List[int] = []
+
+
+class JsonlRevisionLog:
+    """One append-only ``<slug>.jsonl`` file of revision records per story.
+
+    ``chain`` seeks straight to the keyframe it needs through an in-memory
+    offset index, so loading a revision reads at most ``KEYFRAME_INTERVAL``
+    records however long the history is. The index is built on first use
+    and afterwards only parses lines appended since the previous read.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+        self._index_lock = threading.Lock()
+        self._indexes: Dict[str, _KeyframeIndex] = {}
+
+    def _path(self, slug: str) -> Path:
+        return self.directory / f"{slug}.jsonl"
+
+    def records(self, slug: str) -> List[Dict[str, Any]]:
+        """Revision records with ``data`` still base64-encoded."""
+        path = self._path(slug)
+        if not path.exists():
+            return []
+        records: List[Dict[str, Any]] = []
+        with path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                if not line.endswith("\n"):
+                    break  # torn write
+                record = _decode(line)
+                if record is not None:
+                    records.append(record)
+        return records
+
+    def _keyframes(self, slug: str) -> Optional[_KeyframeIndex]:
+        """Up-to-date keyframe index of ``slug``; callers hold ``_index_lock``."""
+        path = self._path(slug)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self._indexes.pop(slug, None)
+            return None
+        inode = (stat.st_dev, stat.st_ino)
+        index = self._indexes.get(slug)
+        if index is None or index.inode != inode or stat.st_size < index.end:
+            index = self._indexes[slug] = _KeyframeIndex(inode)
+        if stat.st_size > index.end:
+            with path.open("rb") as handle:
+                handle.seek(index.end)
+                offset = index.end
+                for line in handle:
+                    if not line.endswith(b"\n"):
+                        break  # torn write
+                    record = _decode(line)
+                    if record is not None:
+                        if record["kind"] == "key":
+                            index.revs.append(record["rev"])
+                            index.offsets.append(offset)
+                        index.last_rev = record["rev"]
+                    offset += len(line)
+                index.end = offset
+        return index
+
+    def chain(self, slug: str, rev: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Records from the nearest keyframe at or before ``rev`` (default: latest) up to ``rev``."""
+        with self._index_lock:
+            index = self._keyframes(slug)
+            if index is None:
+                return []
+            target = index.last_rev if rev is None else rev
+            position = bisect.bisect_right(index.revs, target) - 1
+            if position < 0 or target > index.last_rev:
+                return []
+            start, end = index.offsets[position], index.end
+        chain: List[Dict[str, Any]] = []
+        with self._path(slug).open("rb") as handle:
+            handle.seek(start)
+            for line in handle:
+                start += len(line)
+                if start > end:
+                    break
+                record = _decode(line)
+                if record is None:
+                    continue
+                if record["rev"] > target:
+                    break
+                chain.append(record)
+                if record["rev"] == target:
+                    break
+        if not chain or chain[-1]["rev"] != target:
+            return []
+        for record in chain:
+            record["data"] = base64.b64decode(record["data"])
+        return chain
+
+    def append(self, slug: str, record: Dict[str, Any]) -> None:
+        entry = dict(record)
+        entry["data"] = base64.b64encode(record["data"]).decode("ascii")
+        line = (json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+        with self._lock:
+            append_lines(self._path(slug), line)
+
+
+def _decode(line) -> Optional[Dict[str, Any]]:
+    # Lines mangled by an older torn write are skipped, as the story journal does.
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    return record if isinstance(record, dict) and "rev" in record and "kind" in record else None
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import html
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from .generated_content import all_story_items, load_story, story_manifest
+from .search_index import query_pattern
+from .search_rank import BM25FRanker, query_rank_terms, rank_terms
+from .story_render import PLACEHOLDER_PATTERN, normalise_placeholders
+
+STORY_FIELDS = ("title", "body")
+STORY_FIELD_WEIGHTS = {"title": 3.0, "body": 1.0}
+STORY_FIELD_B = {"title": 0.5, "body": 0.75}
+SNIPPET_WIDTH = 160
+
+_TAG = re.compile(r"<[^>]+>")
+_MARKDOWN_LINK = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+_MARKDOWN_MARKUP = re.compile(r"(^|\s)(#{1,6}|>|[-*+]|\d+\.)\s+|[*_`|]+|~~", re.MULTILINE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def story_plain_text(markdown_text: str) -> str:
+    """Readable text of a story body: no HTML, chart placeholders or markdown markup."""
+    if not markdown_text:
+        return ""
+    text = PLACEHOLDER_PATTERN.sub(" ", normalise_placeholders(markdown_text))
+    text = html.unescape(_TAG.sub(" ", text))
+    text = _MARKDOWN_LINK.sub(r"\1", text)
+    text = _MARKDOWN_MARKUP.sub(" ", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+@dataclass(frozen=True)
+class StoryHit:
+    slug: str
+    score: float
+    snippet: str  # HTML-escaped, matches wrapped in <mark>
+
+
+class _StoryIndex:
+    def __init__(self, versions: Dict[str, Any], slugs: List[str], texts: Dict[str, Dict[str, str]]) -> None:
+        self.versions = versions
+        self.slugs = slugs
+        self.texts = texts
+        self.ranker = BM25FRanker.build(
+            STORY_FIELDS,
+            ((slug, texts[slug]) for slug in slugs),
+            rank_terms,
+            weights=STORY_FIELD_WEIGHTS,
+            b=STORY_FIELD_B,
+        )
+
+
+_lock = threading.Lock()
+_index: Optional[_StoryIndex] = None
+
+
+def _story_texts(payload: Dict[str, Any]) -> Dict[str, str]:
+    return {"title": payload.get("title") or "", "body": story_plain_text(payload.get("markdown") or "")}
+
+
+def _current_index(manifest: Dict[str, Dict[str, Any]]) -> _StoryIndex:
+    """Story index in step with ``manifest``; edited stories are re-scored in place."""
+    global _index
+    versions = {slug: entry.get("updated_at") for slug, entry in manifest.items()}
+    with _lock:
+        index = _index
+        if index is not None and index.versions == versions:
+            return index
+        if index is None or set(index.slugs) != set(versions):
+            texts = {slug: _story_texts(payload) for slug, payload in all_story_items()}
+            slugs = [slug for slug in versions if slug in texts]
+            _index = _StoryIndex(versions, slugs, texts)
+            return _index
+        positions = {slug: position for position, slug in enumerate(index.slugs)}
+        for slug, version in versions.items():
+            if index.versions.get(slug) == version:
+                continue
+            texts = _story_texts(load_story(slug) or {})
+            index.texts[slug] = texts
+            index.ranker.replace(positions[slug], STORY_FIELDS, texts, rank_terms)
+        index.versions = versions
+        return index
+
+
+def search_stories(
+    query: str,
+    manifest: Optional[Dict[str, Dict[str, Any]]] = None,
+    *,
+    limit: Optional[int] = None,
+) -> List[StoryHit]:
+    """Full-text search over generated story titles and bodies, best match first."""
+    terms = query_rank_terms(query or "")
+    if not terms:
+        return []
+    index = _current_index(story_manifest() if manifest is None else manifest)
+    hits: List[StoryHit] = []
+    for position, score in index.ranker.rank(terms, limit=limit):
+        slug = index.slugs[position]
+        hits.append(StoryHit(slug, score, highlight_snippet(index.texts[slug]["body"], query)))
+    return hits
+
+
+def highlight_snippet(text: str, query: str, *, width: int = SNIPPET_WIDTH) -> str:
+    """Window of ``text`` around the first query match, HTML-escaped with ``<mark>`` hits."""
+    pattern = query_pattern(text, query)
+    first = pattern.search(text) if pattern else None
+    start = max(first.start() - width // 3, 0) if first else 0
+    if start:
+        space = text.find(" ", start, first.start())
+        start = space + 1 if space != -1 else start
+    end = min(start + width, len(text))
+    window = text[start:end]
+
+    parts: List[str] = ["…"] if start else []
+    last = 0
+    for match in pattern.finditer(window) if pattern else ():
+        parts.append(html.escape(window[last : match.start()]))
+        parts.append(f"<mark>{html.escape(match.group(0))}</mark>")
+        last = match.end()
+    parts.append(html.escape(window[last:]))
+    if end < len(text):
+        parts.append("…")
+    return "".join(parts)
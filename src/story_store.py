@@ -0,0 +1,460 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS stories (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    slug TEXT NOT NULL,
+    title TEXT,
+    updated_at TEXT,
+    excerpt TEXT,
+    topic TEXT,
+    payload TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_stories_slug ON stories (slug);
+CREATE TABLE IF NOT EXISTS story_revisions (
+    slug TEXT NOT NULL,
+    rev INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    updated_at TEXT,
+    title TEXT,
+    size INTEGER,
+    meta TEXT,
+    data BLOB NOT NULL,
+    PRIMARY KEY (slug, rev)
+);
+CREATE TABLE IF NOT EXISTS store_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+MIGRATION_KEY = "migrated_from_json"
+MANIFEST_COLUMNS = ("title", "updated_at", "excerpt", "topic")
+
+Summarizer = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+class SqliteStoryStore:
+    """Per-story rows in SQLite, one connection per thread (WAL mode)."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with self._schema_lock:
+            if not self._schema_ready:
+                conn.executescript(SCHEMA)
+                # Stores created before the manifest columns existed
+                existing = {row[1] for row in conn.execute("PRAGMA table_info(stories)")}
+                for column in ("excerpt", "topic"):
+                    if column not in existing:
+                        conn.execute(f"ALTER TABLE stories ADD COLUMN {column} TEXT")
+                self._schema_ready = True
+        self._local.conn = conn
+        return conn
+
+    def _write(self) -> "_WriteTransaction":
+        return _WriteTransaction(self._connect())
+
+    # -- metadata -------------------------------------------------------
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self._connect().execute("SELECT value FROM store_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, conn: sqlite3.Connection, key: str, value: Optional[str]) -> None:
+        conn.execute(
+            "INSERT INTO store_meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    # -- migration ------------------------------------------------------
+    def needs_migration(self) -> bool:
+        return self.get_meta(MIGRATION_KEY) is None
+
+    def import_archive(self, raw: Dict[str, Any], *, source: str, summarize: Summarizer) -> int:
+        """Copy a parsed JSON archive into the store exactly once.
+
+        Rows that already exist are kept, so a concurrent process that
+        finished the migration first is never overwritten.
+        """
+        stories = raw.get("stories", {}) or {}
+        with self._write() as conn:
+            if self.get_meta(MIGRATION_KEY) is not None:
+                return 0
+            imported = 0
+            for slug, payload in stories.items():
+                if not isinstance(payload, dict):
+                    continue
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO stories (slug, title, updated_at, excerpt, topic, payload) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (slug, *_manifest_values(summarize(payload)), _dumps(payload)),
+                )
+                imported += cursor.rowcount
+            if raw.get("updated_at"):
+                self._set_meta(conn, "updated_at", raw["updated_at"])
+            self._set_meta(conn, MIGRATION_KEY, source)
+        return imported
+
+    def backfill_manifest(self, summarize: Summarizer) -> None:
+        """Fill manifest columns for rows written before they existed."""
+        rows = self._connect().execute("SELECT slug, payload FROM stories WHERE excerpt IS NULL").fetchall()
+        if not rows:
+            return
+        with self._write() as conn:
+            for slug, payload in rows:
+                values = _manifest_values(summarize(json.loads(payload)))
+                conn.execute(
+                    "UPDATE stories SET title = ?, updated_at = ?, excerpt = ?, topic = ? WHERE slug = ?",
+                    (*values, slug),
+                )
+
+    # -- reads ----------------------------------------------------------
+    def manifest(self) -> Dict[str, Dict[str, Any]]:
+        rows = self._connect().execute(
+            "SELECT slug, title, updated_at, excerpt, topic FROM stories ORDER BY id"
+        )
+        return {row[0]: dict(zip(MANIFEST_COLUMNS, row[1:])) for row in rows}
+
+    def load(self, slug: str) -> Optional[Dict[str, Any]]:
+        row = self._connect().execute("SELECT payload FROM stories WHERE slug = ?", (slug,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def exists(self, slug: str) -> bool:
+        row = self._connect().execute("SELECT 1 FROM stories WHERE slug = ?", (slug,)).fetchone()
+        return row is not None
+
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        rows = self._connect().execute("SELECT slug, payload FROM stories ORDER BY id").fetchall()
+        for slug, payload in rows:
+            yield slug, json.loads(payload)
+
+    # -- writes ---------------------------------------------------------
+    def save(self, slug: str, payload: Dict[str, Any], summary: Dict[str, Any]) -> None:
+        with self._write() as conn:
+            _upsert_story(conn, slug, payload, summary)
+            self._set_meta(conn, "updated_at", payload.get("updated_at"))
+
+    def save_many(self, rows: Iterable[Tuple[str, Dict[str, Any], Dict[str, Any], Dict[str, Any]]]) -> int:
+        """Write ``(slug, payload, summary, revision)`` rows in one transaction."""
+        saved = 0
+        updated_at = None
+        with self._write() as conn:
+            for slug, payload, summary, revision in rows:
+                _upsert_story(conn, slug, payload, summary)
+                _insert_revision(conn, slug, revision)
+                updated_at = payload.get("updated_at") or updated_at
+                saved += 1
+            if saved:
+                self._set_meta(conn, "updated_at", updated_at)
+        return saved
+
+    # -- revisions ------------------------------------------------------
+    def revision_records(self, slug: str) -> List[Dict[str, Any]]:
+        rows = self._connect().execute(
+            "SELECT rev, kind, updated_at, title, size, length(data) FROM story_revisions "
+            "WHERE slug = ? ORDER BY rev",
+            (slug,),
+        )
+        return [
+            {"rev": rev, "kind": kind, "updated_at": updated_at, "title": title, "size": size, "stored_bytes": stored}
+            for rev, kind, updated_at, title, size, stored in rows
+        ]
+
+    def revision_chain(self, slug: str, rev: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Records from the nearest keyframe at or before ``rev`` (default: latest) up to ``rev``."""
+        conn = self._connect()
+        if rev is None:
+            row = conn.execute("SELECT max(rev) FROM story_revisions WHERE slug = ?", (slug,)).fetchone()
+            rev = row[0] if row else None
+            if rev is None:
+                return []
+        rows = conn.execute(
+            "SELECT rev, kind, updated_at, title, size, meta, data FROM story_revisions "
+            "WHERE slug = ? AND rev <= ? AND rev >= ("
+            "  SELECT max(rev) FROM story_revisions WHERE slug = ? AND rev <= ? AND kind = 'key'"
+            ") ORDER BY rev",
+            (slug, rev, slug, rev),
+        ).fetchall()
+        if not rows or rows[-1][0] != rev:
+            return []
+        return [
+            {
+                "rev": r,
+                "kind": kind,
+                "updated_at": updated_at,
+                "title": title,
+                "size": size,
+                "meta": json.loads(meta) if meta else {},
+                "data": bytes(data),
+            }
+            for r, kind, updated_at, title, size, meta, data in rows
+        ]
+
+    def append_revision(self, slug: str, record: Dict[str, Any]) -> None:
+        with self._write() as conn:
+            _insert_revision(conn, slug, record)
+
+
+def _upsert_story(conn: sqlite3.Connection, slug: str, payload: Dict[str, Any], summary: Dict[str, Any]) -> None:
+    conn.execute(
+        "INSERT INTO stories (slug, title, updated_at, excerpt, topic, payload) VALUES (?, ?, ?, ?, ?, ?) "
+        "ON CONFLICT(slug) DO UPDATE SET title = excluded.title, updated_at = excluded.updated_at, "
+        "excerpt = excluded.excerpt, topic = excluded.topic, payload = excluded.payload",
+        (slug, *_manifest_values(summary), _dumps(payload)),
+    )
+
+
+def _insert_revision(conn: sqlite3.Connection, slug: str, record: Dict[str, Any]) -> None:
+    conn.execute(
+        "INSERT OR REPLACE INTO story_revisions (slug, rev, kind, updated_at, title, size, meta, data) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            slug,
+            record["rev"],
+            record["kind"],
+            record.get("updated_at"),
+            record.get("title"),
+            record.get("size"),
+            _dumps(record.get("meta") or {}),
+            sqlite3.Binary(record["data"]),
+        ),
+    )
+
+
+class _WriteTransaction:
+    # BEGIN IMMEDIATE takes the write lock up front so two admin sessions
+    # serialise instead of failing halfway through an upgrade from a read lock.
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.conn.execute("COMMIT")
+        else:
+            self.conn.execute("ROLLBACK")
+
+
+class JournaledArchive:
+    """JSON snapshot plus an append-only journal of per-story saves.
+
+    Each save appends one fsynced JSON line, so its cost depends on the size
+    of the story rather than the archive. Readers replay the journal over the
+    snapshot and keep the result in memory, tailing only bytes appended since
+    the previous read. Once the journal grows past ``compact_bytes`` a
+    background thread folds it into a new snapshot (atomic rename).
+    """
+
+    def __init__(
+        self,
+        snapshot_path: Path,
+        journal_path: Path,
+        *,
+        read_snapshot: Callable[[], Dict[str, Any]],
+        write_snapshot: Callable[[Dict[str, Any]], None],
+        compact_bytes: int,
+    ) -> None:
+        self.snapshot_path = Path(snapshot_path)
+        self.journal_path = Path(journal_path)
+        self.compacting_path = self.journal_path.with_name(self.journal_path.name + ".compacting")
+        self._read_snapshot = read_snapshot
+        self._write_snapshot = write_snapshot
+        self.compact_bytes = compact_bytes
+        self._lock = threading.RLock()
+        self._append_lock = threading.Lock()
+        self._compact_lock = threading.Lock()
+        self._compactor: Optional[threading.Thread] = None
+        self._state: Optional[Dict[str, Any]] = None
+        self._signature: Optional[Tuple[Any, ...]] = None
+        self._journal_offset = 0
+
+    # -- reads ----------------------------------------------------------
+    def state(self) -> Dict[str, Any]:
+        """Merged archive. Callers must treat the result as read-only."""
+        with self._lock:
+            signature = (_stat_key(self.snapshot_path), _stat_key(self.compacting_path), _inode(self.journal_path))
+            if self._state is None or signature != self._signature:
+                state = self._read_snapshot()
+                state.setdefault("stories", {})
+                _replay(state, _read_complete_lines(self.compacting_path, 0)[0])
+                self._state = state
+                self._signature = signature
+                self._journal_offset = 0
+            entries, self._journal_offset = _read_complete_lines(self.journal_path, self._journal_offset)
+            _replay(self._state, entries)
+            return self._state
+
+    # -- writes ---------------------------------------------------------
+    def append(self, slug: str, payload: Dict[str, Any]) -> None:
+        self.append_many([(slug, payload)])
+
+    def append_many(self, stories: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Journal several saves with a single write and fsync."""
+        data = b"".join(
+            (_dumps({"op": "put", "slug": slug, "story": payload}) + "\n").encode("utf-8") for slug, payload in stories
+        )
+        if not data:
+            return
+        with self._append_lock:
+            size = append_lines(self.journal_path, data)
+        if size >= self.compact_bytes:
+            self.compact_in_background()
+
+    def compact_in_background(self) -> None:
+        with self._lock:
+            if self._compactor is not None and self._compactor.is_alive():
+                return
+            self._compactor = threading.Thread(target=self.compact, name="story-journal-compactor", daemon=True)
+            self._compactor.start()
+
+    def compact(self) -> None:
+        with self._compact_lock:
+            with self._lock:
+                # Saves made from here on land in a fresh journal; a leftover
+                # .compacting file from an interrupted run is folded in first.
+                if not self.compacting_path.exists():
+                    if not self.journal_path.exists():
+                        return
+                    with self._append_lock:
+                        os.replace(self.journal_path, self.compacting_path)
+            merged = self._read_snapshot()
+            merged.setdefault("stories", {})
+            _replay(merged, _read_complete_lines(self.compacting_path, 0)[0])
+            # Replaying .compacting over the new snapshot is idempotent, so
+            # readers stay correct between the rename and the unlink below.
+            self._write_snapshot(merged)
+            with self._lock:
+                self.compacting_path.unlink()
+                _fsync_directory(self.snapshot_path.parent)
+
+
+def _replay(state: Dict[str, Any], entries: List[Dict[str, Any]]) -> None:
+    stories = state.setdefault("stories", {})
+    for entry in entries:
+        if entry.get("op") != "put" or not isinstance(entry.get("story"), dict):
+            continue
+        stories[entry["slug"]] = entry["story"]
+        if entry["story"].get("updated_at"):
+            state["updated_at"] = entry["story"]["updated_at"]
+
+
+def append_lines(path: Path, data: bytes) -> int:
+    """Append whole lines with one write and fsync; returns the new file size.
+
+    A torn last line left by a crash mid-write is truncated first, so ``data``
+    is not glued onto the fragment (which would make both unreadable).
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(str(path), os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        _truncate_torn_tail(fd)
+        os.write(fd, data)
+        os.fsync(fd)
+        return os.fstat(fd).st_size
+    finally:
+        os.close(fd)
+
+
+def _truncate_torn_tail(fd: int) -> None:
+    size = os.fstat(fd).st_size
+    if size == 0 or os.pread(fd, 1, size - 1) == b"\n":
+        return
+    end = size
+    keep = 0
+    while end > 0:
+        start = max(0, end - (1 << 16))
+        newline = os.pread(fd, end - start, start).rfind(b"\n")
+        if newline >= 0:
+            keep = start + newline + 1
+            break
+        end = start
+    os.ftruncate(fd, keep)
+
+
+def _read_complete_lines(path: Path, offset: int) -> Tuple[List[Dict[str, Any]], int]:
+    """Parse journal lines after ``offset``; a torn trailing line is left unread."""
+    try:
+        with path.open("rb") as handle:
+            handle.seek(offset)
+            chunk = handle.read()
+    except FileNotFoundError:
+        return [], 0
+    end = chunk.rfind(b"\n") + 1
+    entries: List[Dict[str, Any]] = []
+    for raw_line in chunk[:end].splitlines():
+        if not raw_line.strip():
+            continue
+        try:
+            entries.append(json.loads(raw_line))
+        except ValueError:
+            continue
+    return entries, offset + end
+
+
+def _stat_key(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _inode(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_ino
+    except FileNotFoundError:
+        return None
+
+
+def _fsync_directory(path: Path) -> None:
+    try:
+        fd = os.open(str(path), os.O_RDONLY)
+    except OSError:  # pragma: no cover - platforms without directory fds
+        return
+    try:
+        os.fsync(fd)
+    except OSError:  # pragma: no cover
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_json_atomic(path: Path, payload: Any, *, indent: Optional[int] = 2) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with tmp_path.open("w", encoding="utf-8") as handle:
+        json.dump(payload, handle, ensure_ascii=False, indent=indent)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, path)
+    _fsync_directory(path.parent)
+
+
+def _manifest_values(summary: Dict[str, Any]) -> Tuple[Any, ...]:
+    return tuple(summary.get(column) for column in MANIFEST_COLUMNS)
+
+
+def _dumps(payload: Dict[str, Any]) -> str:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
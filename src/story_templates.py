@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import unicodedata
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -17,21 +18,22 @@ class StoryTemplate:
     default_title: str
 
     def matches(self, pdfs: List[Path], workbooks: List[Path]) -> bool:
-        pdf_match = any(path.name == self.pdf_filename for path in pdfs)
-        workbook_match = any(path.name == self.workbook_filename for path in workbooks)
-        return pdf_match and workbook_match
+        return self.find_pdf_path(pdfs) is not None and self.find_workbook_path(workbooks) is not None
 
     def find_pdf_path(self, pdfs: List[Path]) -> Optional[Path]:
-        for path in pdfs:
-            if path.name == self.pdf_filename:
-                return path
-        return None
+        return _find_by_name(pdfs, self.pdf_filename)
 
     def find_workbook_path(self, workbooks: List[Path]) -> Optional[Path]:
-        for path in workbooks:
-            if path.name == self.workbook_filename:
-                return path
-        return None
+        return _find_by_name(workbooks, self.workbook_filename)
+
+
+def _find_by_name(paths: List[Path], filename: str) -> Optional[Path]:
+    # Filenames copied from macOS are NFD; compare in one normal form.
+    target = unicodedata.normalize("NFC", filename)
+    for path in paths:
+        if unicodedata.normalize("NFC", path.name) == target:
+            return path
+    return None
 
 
 POPULATION_MARKDOWN = """
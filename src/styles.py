@@ -349,6 +349,13 @@ main,
     color: rgba(15, 23, 42, 0.72);
 }
 
+.archive-card mark {
+    background: rgba(250, 204, 21, 0.35);
+    color: inherit;
+    border-radius: 3px;
+    padding: 0 0.1rem;
+}
+
 .archive-card__meta {
     margin-top: 0.75rem;
     font-size: 0.75rem;
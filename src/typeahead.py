@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import bisect
+import re
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Tuple
+
+# Weight per suggestion kind; body terms also scale with their frequency.
+KIND_WEIGHTS = {"title": 100.0, "tag": 50.0, "term": 1.0}
+MAX_BODY_TERMS = 400
+PREFIX_CACHE_SIZE = 256
+
+_WORD = re.compile(r"[0-9A-Za-z가-힣]{2,}")
+
+
+@dataclass(frozen=True)
+class Suggestion:
+    text: str
+    kind: str  # "title" | "tag" | "term"
+    item_ids: Tuple[str, ...]
+    weight: float
+
+
+def _key(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+class PrefixIndex:
+    """Sorted array of lower-cased keys searched with ``bisect``.
+
+    Every word start of a phrase is a key, so "갈등" completes "사회 차별과
+    갈등 문제". Each prefix remembers its ``[lo, hi)`` slice of the array,
+    and a longer prefix only bisects inside its parent's slice, so typing one
+    more character costs a search over the previous matches, not the whole
+    vocabulary.
+    """
+
+    def __init__(self, suggestions: Iterable[Suggestion]) -> None:
+        self.suggestions: List[Suggestion] = list(suggestions)
+        pairs = sorted(
+            (key, position)
+            for position, suggestion in enumerate(self.suggestions)
+            for key in _word_starts(suggestion.text)
+        )
+        self.keys = [key for key, _ in pairs]
+        self.targets = [position for _, position in pairs]
+        self._ranges: "OrderedDict[str, Tuple[int, int]]" = OrderedDict()
+        self._results: "OrderedDict[Tuple[str, int], List[Suggestion]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def build(
+        cls,
+        items: Iterable[Dict[str, Any]],
+        bodies: Dict[str, str],
+        tag_labels: Dict[str, str],
+    ) -> "PrefixIndex":
+        titles: Dict[str, List[str]] = {}
+        tags: Dict[str, List[str]] = {}
+        term_docs: Dict[str, set] = {}
+        term_counts: Counter = Counter()
+        for item in items:
+            item_id = item.get("id", "")
+            if item.get("title"):
+                titles.setdefault(item["title"], []).append(item_id)
+            labels = [tag_labels.get(item.get("category", ""), "")] + list(item.get("tags") or [])
+            for label in filter(None, labels):
+                tags.setdefault(label, []).append(item_id)
+            words = _WORD.findall(bodies.get(item_id, "").lower())
+            term_counts.update(words)
+            for word in set(words):
+                term_docs.setdefault(word, set()).add(item_id)
+
+        suggestions = [
+            Suggestion(text, "title", tuple(ids), KIND_WEIGHTS["title"]) for text, ids in titles.items()
+        ]
+        suggestions.extend(Suggestion(text, "tag", tuple(ids), KIND_WEIGHTS["tag"]) for text, ids in tags.items())
+        for word, count in term_counts.most_common(MAX_BODY_TERMS):
+            if count < 2:
+                break
+            suggestions.append(
+                Suggestion(word, "term", tuple(sorted(term_docs[word])), KIND_WEIGHTS["term"] * count)
+            )
+        return cls(suggestions)
+
+    def _range(self, prefix: str) -> Tuple[int, int]:
+        cached = self._ranges.get(prefix)
+        if cached is not None:
+            self._ranges.move_to_end(prefix)
+            return cached
+        lo, hi = 0, len(self.keys)
+        parent = self._ranges.get(prefix[:-1]) if len(prefix) > 1 else None
+        if parent is not None:
+            lo, hi = parent
+        start = bisect.bisect_left(self.keys, prefix, lo, hi)
+        # Every key with this prefix sorts before prefix + U+10FFFF.
+        end = bisect.bisect_left(self.keys, prefix + "\U0010ffff", start, hi)
+        self._ranges[prefix] = (start, end)
+        if len(self._ranges) > PREFIX_CACHE_SIZE:
+            self._ranges.popitem(last=False)
+        return start, end
+
+    def complete(self, prefix: str, k: int = 8) -> List[Suggestion]:
+        """Top ``k`` suggestions whose text has a word starting with ``prefix``."""
+        prefix = _key(prefix)
+        if not prefix:
+            return []
+        with self._lock:
+            cached = self._results.get((prefix, k))
+            if cached is not None:
+                self._results.move_to_end((prefix, k))
+                return list(cached)
+            start, end = self._range(prefix)
+            seen = set()
+            matches: List[Suggestion] = []
+            for position in self.targets[start:end]:
+                if position not in seen:
+                    seen.add(position)
+                    matches.append(self.suggestions[position])
+            matches.sort(key=lambda suggestion: (-suggestion.weight, suggestion.text))
+            result = matches[:k]
+            self._results[(prefix, k)] = result
+            if len(self._results) > PREFIX_CACHE_SIZE:
+                self._results.popitem(last=False)
+            return list(result)
+
+    def matching_items(self, prefix: str, k: int = 8) -> List[str]:
+        """Item ids behind the top completions, best suggestion first."""
+        ordered: Dict[str, None] = {}
+        for suggestion in self.complete(prefix, k):
+            ordered.update(dict.fromkeys(suggestion.item_ids))
+        return list(ordered)
+
+
+def _word_starts(text: str) -> List[str]:
+    words = _key(text).split(" ")
+    return [" ".join(words[index:]) for index in range(len(words))] if words != [""] else []
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-import random
 import re
+import threading
 from datetime import datetime
 from pathlib import Path
-from textwrap import shorten
 from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
@@ -12,8 +11,10 @@ import plotly.express as px
 import streamlit as st
 
 from .chart_builder import build_chart
-from .generated_content import list_stories, load_story
+from .generated_content import load_story, story_manifest
+from .indicator_store import get_indicator_store
 from .story_render import render_story_content
+from .story_search import search_stories
 from .visual_runtime import render_interactive_panel, render_visual_from_registry
 from .workspace_data import DATA_DIR, resolve_excel_path
 
@@ -42,39 +43,6 @@ TOPICS: List[Dict[str, Any]] = [
     },
 ]
 
-YEARS = list(range(2012, 2026))
-REGIONS = [
-    "전국",
-    "서울",
-    "부산",
-    "대구",
-    "인천",
-    "광주",
-    "대전",
-    "울산",
-    "세종",
-    "경기",
-    "강원",
-    "충북",
-    "충남",
-    "전북",
-    "전남",
-    "경북",
-    "경남",
-    "제주",
-]
-
-INDICATORS: Dict[str, List[Dict[str, Any]]] = {
-    "welfare": [
-        {"id": "learning", "label": "교육 접근성", "unit": "지수", "seed": 21},
-        {"id": "care", "label": "돌봄 인프라", "unit": "지수", "seed": 22},
-    ],
-    "politics": [
-        {"id": "turnout", "label": "참여율", "unit": "%", "seed": 61},
-        {"id": "trust", "label": "사회 신뢰", "unit": "%", "seed": 62},
-    ],
-}
-
 TIMELINE_EVENTS = [
     {"year": 2015, "label": "정책 A 시행"},
     {"year": 2019, "label": "지표 기준 개정"},
@@ -85,56 +53,51 @@ STORY_CHART_WIDTH = 880
 STORY_CHART_HEIGHT = 420
 
 
-def _series(seed: int, scale: int = 100) -> List[Dict[str, float]]:
-    rng = random.Random(seed)
-    return [{"year": year, "value": round(rng.random() * scale, 2)} for year in YEARS]
-
-
-def _build_mock_db() -> Dict[str, Dict[str, Dict[str, List[Dict[str, float]]]]]:
-    payload: Dict[str, Dict[str, Dict[str, List[Dict[str, float]]]]] = {}
-    for topic_id, indicators in INDICATORS.items():
-        topic_payload: Dict[str, Dict[str, List[Dict[str, float]]]] = {}
-        for idx, ind in enumerate(indicators):
-            indicator_payload: Dict[str, List[Dict[str, float]]] = {}
-            for region_index, region in enumerate(REGIONS):
-                indicator_payload[region] = _series(ind["seed"] + region_index + idx, 100)
-            topic_payload[ind["id"]] = indicator_payload
-        payload[topic_id] = topic_payload
-    return payload
-
-
-MOCK_DB = _build_mock_db()
+OECD_REFERENCE = "OECD 평균"
 
 LAB_DATASETS: Dict[str, Dict[str, Dict[str, Any]]] = {
     "welfare": {
         "education-care-v1": {
             "title": "교육·돌봄 데이터 v1.0",
-            "path": resolve_excel_path(
-                "(0204)교육돌봄 데이터_v1.0.xlsx"
-            )
-            or DATA_DIR / "excel_data" / "(0204)교육돌봄 데이터_v1.0.xlsx",
+            "filename": "(0204)교육돌봄 데이터_v1.0.xlsx",
         },
     },
     "politics": {
         "politics-civic-v1": {
             "title": "정치·시민사회 데이터 v1.0",
-            "path": resolve_excel_path(
-                "(0204)정치사회 데이터_v1.0.xlsx"
-            )
-            or DATA_DIR / "excel_data" / "(0204)정치사회 데이터_v1.0.xlsx",
+            "filename": "(0204)정치사회 데이터_v1.0.xlsx",
         }
     },
 }
 
+_lab_dataset_paths: Optional[Dict[str, Path]] = None
+_lab_dataset_paths_lock = threading.Lock()
+
+
+def _get_lab_dataset_paths() -> Dict[str, Path]:
+    # resolve_excel_path globs the data directories, so only do it once a page asks.
+    global _lab_dataset_paths
+    if _lab_dataset_paths is None:
+        with _lab_dataset_paths_lock:
+            if _lab_dataset_paths is None:
+                _lab_dataset_paths = {
+                    slug: resolve_excel_path(meta["filename"]) or DATA_DIR / "excel_data" / meta["filename"]
+                    for datasets in LAB_DATASETS.values()
+                    for slug, meta in datasets.items()
+                }
+    return _lab_dataset_paths
+
 
 def _lab_datasets(topic_id: str) -> Dict[str, Dict[str, Any]]:
     datasets: Dict[str, Dict[str, Any]] = {}
+    manifest = story_manifest()
+    paths = _get_lab_dataset_paths()
     for slug, meta in (LAB_DATASETS.get(topic_id) or {}).items():
-        path = meta.get("path")
+        path = paths.get(slug)
         if not isinstance(path, Path) or not path.exists():
             continue
-        payload = load_story(slug) or {}
-        title = payload.get("title") or meta.get("title") or slug
+        entry = manifest.get(slug) or {}
+        title = entry.get("title") or meta.get("title") or slug
         datasets[slug] = {"slug": slug, "title": title, "path": path}
     return datasets
 
@@ -214,13 +177,20 @@ def _queue_navigation(page: str, *, slug: Optional[str] = None, topic_id: Option
     }
 
 
-def _suggest_topic_story_map(stories: Dict[str, str]) -> Dict[str, Optional[str]]:
+def _suggest_topic_story_map(manifest: Dict[str, Dict[str, Any]]) -> Dict[str, Optional[str]]:
     mapping: Dict[str, Optional[str]] = {topic["id"]: None for topic in TOPICS}
-    available = list(stories.keys())
+    available = list(manifest.keys())
+
+    # 0) 스토리에 저장된 주제가 있으면 그대로 연결
+    for slug, entry in manifest.items():
+        topic_id = entry.get("topic")
+        if topic_id in mapping and mapping[topic_id] is None:
+            mapping[topic_id] = slug
+            available.remove(slug)
 
     # 1) 직접 아이디가 매칭되는 경우 우선 연결
     for topic in TOPICS:
-        if topic["id"] in stories:
+        if mapping[topic["id"]] is None and topic["id"] in manifest:
             mapping[topic["id"]] = topic["id"]
             if topic["id"] in available:
                 available.remove(topic["id"])
@@ -245,13 +215,8 @@ def _topic_label(slug: str, story_to_topic: Dict[str, str]) -> str:
     return topic_meta["label"] if topic_meta else "데이터 스토리"
 
 
-def _extract_excerpt(story: Dict[str, Any], default: str = "") -> str:
-    text = story.get("markdown") or ""
-    if not text:
-        return default
-    text = re.sub(r"<[^>]+>", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
-    return shorten(text, width=120, placeholder="…") if text else default
+def _manifest_excerpt(entry: Dict[str, Any], default: str = "") -> str:
+    return entry.get("excerpt") or default
 
 
 def _format_updated_at(value: Optional[str]) -> str:
@@ -432,7 +397,7 @@ def _chunk(items: List[Any], size: int) -> List[List[Any]]:
 
 def _render_home_page(
     stories: Dict[str, str],
-    story_payloads: Dict[str, Dict[str, Any]],
+    manifest: Dict[str, Dict[str, Any]],
     topic_story_map: Dict[str, Optional[str]],
     story_to_topic: Dict[str, str],
 ) -> None:
@@ -452,22 +417,10 @@ def _render_home_page(
 
     st.markdown("#### 오늘의 하이라이트")
     highlight_topics = TOPICS[:4]
+    store = get_indicator_store()
     columns = st.columns(len(highlight_topics))
     for column, topic in zip(columns, highlight_topics):
         with column:
-            seed = sum(ord(ch) for ch in topic["id"])
-            trend_data = _series(seed & 0xFFFF)
-            trend_df = pd.DataFrame(trend_data)
-            fig = px.area(trend_df, x="year", y="value", title=None)
-            fig.update_layout(
-                height=180,
-                showlegend=False,
-                margin=dict(l=10, r=10, t=10, b=10),
-                xaxis_title=None,
-                yaxis_title=None,
-            )
-            fig.update_traces(line=dict(color=topic["color"]), fillcolor=topic["color"])
-
             st.markdown(
                 f"""
                 <div class="mini-card">
@@ -477,11 +430,25 @@ def _render_home_page(
                 """,
                 unsafe_allow_html=True,
             )
+            headline = next((ind for ind in store.indicators(topic["id"]) if ind.headline), None)
+            if headline is None:
+                continue
+            trend_df = store.series(headline.id, headline.headline)
+            fig = px.area(trend_df, x="year", y="value", title=None)
+            fig.update_layout(
+                height=180,
+                showlegend=False,
+                margin=dict(l=10, r=10, t=10, b=10),
+                xaxis_title=None,
+                yaxis_title=None,
+            )
+            fig.update_traces(line=dict(color=topic["color"]), fillcolor=topic["color"])
             st.plotly_chart(
                 fig,
                 use_container_width=True,
                 key=f"home_trend_{topic['id']}",
             )
+            st.caption(f"{headline.label} · {headline.headline} ({headline.unit})")
 
     st.markdown("#### 최신 데이터 스토리")
     story_slugs = list(stories.keys())[:3]
@@ -492,10 +459,10 @@ def _render_home_page(
     cols = st.columns(len(story_slugs))
     for col, slug in zip(cols, story_slugs):
         with col:
-            payload = story_payloads.get(slug, {})
-            title = payload.get("title") or stories[slug]
-            excerpt = _extract_excerpt(payload, "스토리 내용을 준비 중입니다.")
-            updated = _format_updated_at(payload.get("updated_at"))
+            entry = manifest.get(slug, {})
+            title = entry.get("title") or stories[slug]
+            excerpt = _manifest_excerpt(entry, "스토리 내용을 준비 중입니다.")
+            updated = _format_updated_at(entry.get("updated_at"))
             st.markdown(
                 f"""
                 <div class="story-card">
@@ -518,7 +485,7 @@ def _render_home_page(
 
 def _render_topic_grid(
     stories: Dict[str, str],
-    story_payloads: Dict[str, Dict[str, Any]],
+    manifest: Dict[str, Dict[str, Any]],
     topic_story_map: Dict[str, Optional[str]],
 ) -> None:
     st.markdown("### 주제별 리포트")
@@ -529,9 +496,9 @@ def _render_topic_grid(
         for topic, col in zip(row, cols):
             with col:
                 slug = topic_story_map.get(topic["id"])
-                payload = story_payloads.get(slug or "", {})
-                title = payload.get("title") if payload else None
-                excerpt = _extract_excerpt(payload, "데이터 스토리가 연결되면 자동으로 미리보기로 표시됩니다.")
+                entry = manifest.get(slug or "", {})
+                title = entry.get("title") if entry else None
+                excerpt = _manifest_excerpt(entry, "데이터 스토리가 연결되면 자동으로 미리보기로 표시됩니다.")
                 st.markdown(
                     f"""
                     <div class="topic-card">
@@ -560,9 +527,8 @@ def _render_topic_grid(
 def _render_topic_detail(
     topic_id: str,
     stories: Dict[str, str],
-    story_payloads: Dict[str, Dict[str, Any]],
+    manifest: Dict[str, Dict[str, Any]],
     topic_story_map: Dict[str, Optional[str]],
-    story_visual_map: Dict[str, Dict[str, Dict[str, Any]]],
 ) -> None:
     topic_meta = next((item for item in TOPICS if item["id"] == topic_id), None)
     if topic_meta is None:
@@ -578,110 +544,95 @@ def _render_topic_detail(
     st.caption(topic_meta["description"])
 
     indicator_key = f"{topic_id}_indicator"
-    region_a_key = f"{topic_id}_region_a"
-    region_b_key = f"{topic_id}_region_b"
-
-    indicators = INDICATORS[topic_id]
-    if indicator_key not in st.session_state:
-        st.session_state[indicator_key] = indicators[0]["id"]
-    if region_a_key not in st.session_state:
-        st.session_state[region_a_key] = "전국"
-    if region_b_key not in st.session_state:
-        st.session_state[region_b_key] = "서울"
-
-    cols = st.columns([1.2, 1, 1, 1])
-    with cols[0]:
-        st.selectbox(
-            "지표",
-            options=[indicator["id"] for indicator in indicators],
-            key=indicator_key,
-            format_func=lambda value: next(ind["label"] for ind in indicators if ind["id"] == value),
-        )
-    with cols[1]:
-        st.selectbox("지역 A", options=REGIONS, key=region_a_key)
-    with cols[2]:
-        st.selectbox("지역 B", options=REGIONS, key=region_b_key)
-    with cols[3]:
-        selected_indicator = st.session_state[indicator_key]
-        region_a = st.session_state[region_a_key]
-        region_b = st.session_state[region_b_key]
-
-        df_a = pd.DataFrame(MOCK_DB[topic_id][selected_indicator][region_a])
-        df_b = pd.DataFrame(MOCK_DB[topic_id][selected_indicator][region_b])
-        combined = pd.DataFrame(
-            {
-                "year": YEARS,
-                region_a: df_a["value"].values,
-                region_b: df_b["value"].values,
-            }
+    entity_a_key = f"{topic_id}_entity_a"
+    entity_b_key = f"{topic_id}_entity_b"
+
+    store = get_indicator_store()
+    indicators = {indicator.id: indicator for indicator in store.indicators(topic_id)}
+    indicator_meta = None
+    summary_fig = mini_fig = compare_fig = None
+    if indicators:
+        if st.session_state.get(indicator_key) not in indicators:
+            st.session_state[indicator_key] = next(iter(indicators))
+        indicator_meta = indicators[st.session_state[indicator_key]]
+        entities = store.entities(indicator_meta.id)
+        headline = indicator_meta.headline if indicator_meta.headline in entities else entities[0]
+        # Entities differ per indicator, so reset selections the new indicator lacks.
+        if st.session_state.get(entity_a_key) not in entities:
+            st.session_state[entity_a_key] = headline
+        if st.session_state.get(entity_b_key) not in entities:
+            st.session_state[entity_b_key] = next((entity for entity in entities if entity != headline), headline)
+
+        cols = st.columns([1.2, 1, 1, 1])
+        with cols[0]:
+            st.selectbox(
+                "지표",
+                options=list(indicators),
+                key=indicator_key,
+                format_func=lambda value: indicators[value].label,
+            )
+        with cols[1]:
+            st.selectbox("비교 대상 A", options=entities, key=entity_a_key)
+        with cols[2]:
+            st.selectbox("비교 대상 B", options=entities, key=entity_b_key)
+        entity_a = st.session_state[entity_a_key]
+        entity_b = st.session_state[entity_b_key]
+        cube = store.cube((indicator_meta.id,))
+        combined = cube.compare_frame(indicator_meta.id, [entity_a, entity_b])
+        with cols[3]:
+            st.download_button(
+                "CSV 다운로드",
+                data=combined.to_csv(index=False).encode("utf-8"),
+                file_name=f"{topic_id}_{indicator_meta.id}.csv",
+                mime="text/csv",
+            )
+
+        summary_fig = px.line(
+            combined,
+            x="year",
+            y=[entity_a, entity_b],
+            markers=True,
+            color_discrete_sequence=[topic_meta["color"], "#1f2937"],
         )
-        csv_bytes = combined.to_csv(index=False).encode("utf-8")
-        st.download_button(
-            "CSV 다운로드",
-            data=csv_bytes,
-            file_name=f"{topic_id}_{selected_indicator}.csv",
-            mime="text/csv",
+        summary_fig.update_layout(
+            height=480,
+            legend_title=None,
+            margin=dict(l=16, r=16, t=32, b=16),
+            xaxis_title="연도",
+            yaxis_title=f"{indicator_meta.label} ({indicator_meta.unit})",
         )
 
-    selected_indicator = st.session_state[indicator_key]
-    region_a = st.session_state[region_a_key]
-    region_b = st.session_state[region_b_key]
-    indicator_meta = next(ind for ind in indicators if ind["id"] == selected_indicator)
-    df_a = pd.DataFrame(MOCK_DB[topic_id][selected_indicator][region_a])
-    df_b = pd.DataFrame(MOCK_DB[topic_id][selected_indicator][region_b])
-    combined = pd.DataFrame(
-        {
-            "year": YEARS,
-            region_a: df_a["value"].values,
-            region_b: df_b["value"].values,
-        }
-    )
-
-    summary_fig = px.line(
-        combined,
-        x="year",
-        y=[region_a, region_b],
-        markers=True,
-        color_discrete_sequence=[topic_meta["color"], "#1f2937"],
-    )
-    summary_fig.update_layout(
-        height=480,
-        legend_title=None,
-        margin=dict(l=16, r=16, t=32, b=16),
-        xaxis_title="연도",
-        yaxis_title=f"{indicator_meta['label']} ({indicator_meta['unit']})",
-    )
-
-    mini = pd.DataFrame(_series(indicator_meta["seed"], 100))
-    mini_fig = px.area(mini, x="year", y="value", color_discrete_sequence=[topic_meta["color"]])
-    mini_fig.update_layout(
-        height=220,
-        showlegend=False,
-        margin=dict(l=16, r=16, t=10, b=10),
-        xaxis_title=None,
-        yaxis_title=None,
-    )
+        mini_fig = px.area(
+            store.series(indicator_meta.id, headline),
+            x="year",
+            y="value",
+            color_discrete_sequence=[topic_meta["color"]],
+        )
+        mini_fig.update_layout(
+            height=220,
+            showlegend=False,
+            margin=dict(l=16, r=16, t=10, b=10),
+            xaxis_title=None,
+            yaxis_title=None,
+        )
 
-    compare_df = pd.DataFrame(
-        {
-            "year": YEARS,
-            "한국": df_a["value"],
-            "OECD 평균": df_b["value"] * 0.9 + 5,
-        }
-    )
-    compare_fig = px.line(compare_df, x="year", y=["한국", "OECD 평균"], markers=True)
-    compare_fig.update_layout(
-        height=420,
-        margin=dict(l=16, r=16, t=32, b=16),
-        legend_title=None,
-    )
+        if "한국" in entities and OECD_REFERENCE in entities:
+            compare_df = cube.overlay(indicator_meta.id, "한국", OECD_REFERENCE)
+            compare_fig = px.line(compare_df, x="year", y=["한국", "OECD 평균"], markers=True)
+            compare_fig.update_layout(
+                height=420,
+                margin=dict(l=16, r=16, t=32, b=16),
+                legend_title=None,
+            )
+    else:
+        st.info("이 주제의 지표 데이터를 찾을 수 없습니다.")
 
     story_options: List[Tuple[str, str]] = []
     unique_slugs = set()
     for slug in topic_story_map.values():
-        if slug and slug in story_payloads and slug not in unique_slugs:
-            payload = story_payloads[slug]
-            story_options.append((slug, payload.get("title") or stories.get(slug, slug)))
+        if slug and slug in manifest and slug not in unique_slugs:
+            entry = manifest[slug]
+            story_options.append((slug, entry.get("title") or stories.get(slug, slug)))
             unique_slugs.add(slug)
 
     if story_options:
@@ -708,20 +659,32 @@ def _render_topic_detail(
 
     with story_tab:
         slug = st.session_state.get("selected_story")
-        if slug and slug in story_payloads:
-            visual_entries = story_visual_map.get(slug, {})
-            _render_story_block(story_payloads[slug], slug, visual_entries)
+        story = load_story(slug) if slug and slug in manifest else None
+        if story is not None:
+            visual_entries = _build_visual_entries(slug, story)
+            _render_story_block(story, slug, visual_entries)
         else:
             st.info("연결된 데이터 스토리를 선택하면 내용이 표시됩니다.")
 
     with summary_tab:
-        _render_centered_chart(summary_fig, key=f"summary_chart_{topic_id}", default_height=480)
-        _render_centered_markdown("##### 키 인사이트 (데모)")
-        _render_centered_chart(mini_fig, key=f"mini_chart_{topic_id}", default_height=220)
+        if summary_fig is None:
+            st.info("표시할 지표가 없습니다.")
+        else:
+            _render_centered_chart(summary_fig, key=f"summary_chart_{topic_id}", default_height=480)
+            _render_centered_markdown(f"##### {indicator_meta.label} · {headline} 추이")
+            _render_centered_chart(mini_fig, key=f"mini_chart_{topic_id}", default_height=220)
+            _render_centered_markdown(
+                f"<p class='chart-note'>※ 자료: {indicator_meta.workbook} · {indicator_meta.sheet}</p>"
+            )
 
     with compare_tab:
-        _render_centered_chart(compare_fig, key=f"compare_chart_{topic_id}", default_height=420)
-        _render_centered_markdown("<p class='chart-note'>※ 실제 서비스에서는 OWID/OECD API 또는 정적 CSV를 연결합니다.</p>")
+        if compare_fig is None:
+            st.info("선택한 지표에는 한국과 OECD 평균을 비교할 자료가 없습니다.")
+        else:
+            _render_centered_chart(compare_fig, key=f"compare_chart_{topic_id}", default_height=420)
+            _render_centered_markdown(
+                f"<p class='chart-note'>※ 자료: {indicator_meta.workbook} · {indicator_meta.sheet}</p>"
+            )
 
     with timeline_tab:
         for item in TIMELINE_EVENTS:
@@ -739,6 +702,62 @@ def _render_topic_detail(
             )
 
 
+def _render_lab_indicators(topic: str) -> None:
+    store = get_indicator_store()
+    indicators = {indicator.id: indicator for indicator in store.indicators(topic)}
+    if not indicators:
+        st.warning("선택한 주제의 지표 데이터를 찾을 수 없습니다.")
+        return
+
+    indicator_id = st.selectbox(
+        "지표",
+        options=list(indicators),
+        format_func=lambda value: indicators[value].label,
+        key="lab_indicator",
+    )
+    indicator_meta = indicators[indicator_id]
+    entities = store.entities(indicator_id)
+    # Keyed per indicator: entities and year spans differ between indicators.
+    selected = st.multiselect("대상", options=entities, default=entities[:3], key=f"lab_entities_{indicator_id}")
+    bounds = store.year_bounds(indicator_id)
+    if bounds is None:
+        st.info("선택한 지표의 관측값이 없습니다.")
+        return
+    start, end = bounds
+    if start < end:
+        start, end = st.slider("기간", min_value=start, max_value=end, value=(start, end), key=f"lab_years_{indicator_id}")
+    if not selected:
+        st.info("대상을 최소 1개 선택해 주세요.")
+        return
+
+    long = store.frame(indicator_id, selected, start, end)
+    fig = px.line(
+        long,
+        x="year",
+        y="value",
+        color="entity",
+        markers=True,
+        labels={"year": "연도", "value": f"{indicator_meta.label} ({indicator_meta.unit})", "entity": "대상"},
+    )
+    fig.update_layout(
+        height=480,
+        margin=dict(l=16, r=16, t=32, b=16),
+        hovermode="closest",
+    )
+    _render_centered_chart(fig, key=f"lab_indicator_chart_{indicator_id}", default_height=480)
+
+    with st.expander("데이터", expanded=False):
+        st.dataframe(long, use_container_width=True)
+        st.download_button(
+            "CSV 다운로드",
+            data=long.to_csv(index=False).encode("utf-8"),
+            file_name=f"{indicator_id}_{start}_{end}.csv",
+            mime="text/csv",
+            key="lab_indicator_csv",
+        )
+    st.caption(f"자료: {indicator_meta.workbook} · {indicator_meta.sheet}")
+
+
 def _render_lab_page() -> None:
     st.markdown("### 데이터 랩")
     st.caption("원데이터 기반 시각화 실험실 (데모 데이터)")
@@ -749,6 +768,17 @@ def _render_lab_page() -> None:
         format_func=lambda value: next(t["label"] for t in TOPICS if t["id"] == value),
         key="lab_topic",
     )
+    view = st.radio(
+        "보기",
+        options=["indicators", "sheets"],
+        format_func=lambda value: {"indicators": "지표 시계열", "sheets": "원본 시트"}[value],
+        horizontal=True,
+        key="lab_view",
+    )
+    if view == "indicators":
+        _render_lab_indicators(topic)
+        return
+
     datasets = _lab_datasets(topic)
     if not datasets:
         st.warning("선택한 주제의 데이터 세트를 찾을 수 없습니다.")
@@ -839,26 +869,23 @@ def _render_lab_page() -> None:
 
 def _render_archive_page(
     stories: Dict[str, str],
-    story_payloads: Dict[str, Dict[str, Any]],
+    manifest: Dict[str, Dict[str, Any]],
     story_to_topic: Dict[str, str],
 ) -> None:
     st.markdown("### 인사이트 아카이브")
     st.caption("과거 리포트/블로그 모음 · 태그 검색")
 
-    query = st.text_input("검색 (제목/본문)", key="archive_query")
+    query = st.text_input("검색 (제목/본문)", key="archive_query").strip()
+    snippets: Dict[str, str] = {}
+    entries: List[Tuple[str, Dict[str, Any]]] = []
     if query:
-        query_lower = query.lower()
+        for hit in search_stories(query, manifest):
+            entry = manifest.get(hit.slug)
+            if entry is not None:
+                entries.append((hit.slug, entry))
+                snippets[hit.slug] = hit.snippet
     else:
-        query_lower = ""
-
-    entries: List[Tuple[str, Dict[str, Any]]] = []
-    for slug, payload in story_payloads.items():
-        title = payload.get("title") or stories.get(slug, slug)
-        summary = _extract_excerpt(payload, "")
-        haystack = f"{title} {summary}".lower()
-        if query_lower and query_lower not in haystack:
-            continue
-        entries.append((slug, payload))
+        entries = list(manifest.items())
 
     if not entries:
         st.info("조건에 맞는 스토리가 없습니다.")
@@ -866,11 +893,11 @@ def _render_archive_page(
 
     for row in _chunk(entries, 3):
         cols = st.columns(3, gap="large")
-        for (slug, payload), col in zip(row, cols):
+        for (slug, entry), col in zip(row, cols):
             with col:
-                title = payload.get("title") or stories.get(slug, slug)
-                updated = _format_updated_at(payload.get("updated_at"))
-                excerpt = _extract_excerpt(payload, "내용을 확인하려면 스토리를 엽니다.")
+                title = entry.get("title") or stories.get(slug, slug)
+                updated = _format_updated_at(entry.get("updated_at"))
+                excerpt = snippets.get(slug) or _manifest_excerpt(entry, "내용을 확인하려면 스토리를 엽니다.")
                 tag_label = _topic_label(slug, story_to_topic)
                 st.markdown(
                     f"""
@@ -919,14 +946,13 @@ def _render_about_page() -> None:
 
 
 def render_public_view() -> None:
-    stories = list_stories()
-    if not stories:
+    manifest = story_manifest()
+    if not manifest:
         st.warning("아직 게시된 데이터 스토리가 없습니다. 관리자가 먼저 저장해야 합니다.")
         return
 
-    story_payloads = {slug: load_story(slug) or {} for slug in stories}
-    story_visual_map = {slug: _build_visual_entries(slug, payload) for slug, payload in story_payloads.items()}
-    topic_story_map = _suggest_topic_story_map(stories)
+    stories = {slug: entry.get("title") or slug for slug, entry in manifest.items()}
+    topic_story_map = _suggest_topic_story_map(manifest)
     story_to_topic = _reverse_topic_story_map(topic_story_map)
     requested_slug = _get_query_param("story")
 
@@ -934,16 +960,16 @@ def render_public_view() -> None:
 
     if "nav_radio" not in st.session_state:
         st.session_state["nav_radio"] = (
-            "topics" if requested_slug and requested_slug in story_payloads else "home"
+            "topics" if requested_slug and requested_slug in manifest else "home"
         )
     if "opened_topic" not in st.session_state:
         st.session_state["opened_topic"] = None
     if "selected_story" not in st.session_state:
         st.session_state["selected_story"] = (
-            requested_slug if requested_slug in story_payloads else next(iter(story_payloads))
+            requested_slug if requested_slug in manifest else next(iter(manifest))
         )
 
-    if requested_slug and requested_slug in story_payloads:
+    if requested_slug and requested_slug in manifest:
         st.session_state["selected_story"] = requested_slug
         st.session_state["opened_topic"] = story_to_topic.get(
             requested_slug, st.session_state.get("opened_topic")
@@ -960,7 +986,7 @@ def render_public_view() -> None:
 
         if target_topic:
             st.session_state["opened_topic"] = target_topic
-        if target_slug and target_slug in story_payloads:
+        if target_slug and target_slug in manifest:
             st.session_state["selected_story"] = target_slug
             _set_query_param(story=target_slug)
         else:
@@ -1003,16 +1029,16 @@ def render_public_view() -> None:
         _set_query_param(story=None)
 
     if page == "home":
-        _render_home_page(stories, story_payloads, topic_story_map, story_to_topic)
+        _render_home_page(stories, manifest, topic_story_map, story_to_topic)
     elif page == "topics":
         opened_topic = st.session_state.get("opened_topic")
         if opened_topic:
-            _render_topic_detail(opened_topic, stories, story_payloads, topic_story_map, story_visual_map)
+            _render_topic_detail(opened_topic, stories, manifest, topic_story_map)
         else:
-            _render_topic_grid(stories, story_payloads, topic_story_map)
+            _render_topic_grid(stories, manifest, topic_story_map)
     elif page == "lab":
         _render_lab_page()
     elif page == "archive":
-        _render_archive_page(stories, story_payloads, story_to_topic)
+        _render_archive_page(stories, manifest, story_to_topic)
     elif page == "about":
         _render_about_page()
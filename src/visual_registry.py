@@ -0,0 +1,78 @@
+"""Story figure renderers by name, imported on first use.
+
+Each entry maps a renderer name to ``"module:function"`` inside ``src``, or
+to ``"spec:<name>"`` for figures declared in ``figure_specs.json`` and drawn
+by ``figure_spec``. Listing names or checking membership imports nothing
+(spec names come from the JSON file); ``get_renderer`` imports only the
+module that draws the requested renderer.
+"""
+from __future__ import annotations
+
+import importlib
+import json
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+SPECS_PATH = Path(__file__).with_name("figure_specs.json")
+
+
+@lru_cache(maxsize=1)
+def figure_specs() -> Dict[str, Dict[str, Any]]:
+    with SPECS_PATH.open("r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+# Figures whose data does not fit the spec steps (merged headers, block
+# layouts, embedded images) stay hand-written.
+_HANDWRITTEN: Dict[str, str] = {
+    "covid_section2_chart": "visuals_covid:covid_section2_chart",
+    "covid_section3_chart": "visuals_covid:covid_section3_chart",
+    **{f"education_care_fig{index:02d}": f"visuals_education:education_care_fig{index:02d}" for index in (4, 6, 9, 15)},
+    "politics_civic_fig10": "visuals_politics:politics_civic_fig10",
+}
+
+VISUAL_RENDERERS: Dict[str, str] = dict(
+    sorted({**{name: f"spec:{name}" for name in figure_specs()}, **_HANDWRITTEN}.items())
+)
+
+INTERACTIVE_PANELS: Dict[str, str] = {
+    "covid19": "visuals_covid:covid_interactive_panel",
+}
+
+_lock = threading.Lock()
+_resolved: Dict[str, Callable[..., Any]] = {}
+
+
+def renderer_names() -> List[str]:
+    return list(VISUAL_RENDERERS)
+
+
+def _resolve(target: str) -> Callable[..., Any]:
+    func = _resolved.get(target)
+    if func is not None:
+        return func
+    with _lock:
+        func = _resolved.get(target)
+        if func is None:
+            module_name, _, attribute = target.partition(":")
+            if module_name == "spec":
+                from .figure_spec import spec_renderer
+
+                func = spec_renderer(attribute)
+            else:
+                module = importlib.import_module(f".{module_name}", __package__)
+                func = getattr(module, attribute)
+            _resolved[target] = func
+    return func
+
+
+def get_renderer(name: str) -> Optional[Callable[..., Any]]:
+    target = VISUAL_RENDERERS.get(name)
+    return _resolve(target) if target else None
+
+
+def get_panel(story_slug: str) -> Optional[Callable[..., Any]]:
+    target = INTERACTIVE_PANELS.get(story_slug)
+    return _resolve(target) if target else None
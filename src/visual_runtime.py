@@ -1,30 +1,84 @@
 from __future__ import annotations
 
-from typing import Callable, Dict, Optional, Tuple
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import plotly.graph_objects as go
 
+from .render_metrics import METRICS, RenderProbe
+from .render_pool import get_render_pool
+from .visual_registry import get_panel, get_renderer
+from .visuals_common import sheet_fingerprint, workbook_fingerprint
 
 Renderer = Callable[[str, str], go.Figure]
 InteractiveRenderer = Callable[[str], None]
 
+# Figures of renderers that declare their data (``reads_sheets`` /
+# ``reads_workbooks``), keyed on renderer, story, slot, the content hash of
+# every declared sheet and the file signature of every declared workbook.
+RENDER_CACHE_SIZE = 128
+
+_cache_lock = threading.Lock()
+_render_cache: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+
+
+def _cache_key(renderer_name: str, story_slug: str, slot_id: str, func: Renderer) -> Optional[Tuple[Any, ...]]:
+    sheets = getattr(func, "data_sheets", None)
+    files = getattr(func, "data_files", None)
+    if sheets is None and files is None:
+        return None
+    fingerprints = tuple(sheet_fingerprint(filename, sheet) for filename, sheet in sheets or ())
+    versions = tuple(workbook_fingerprint(filename) for filename in files or ())
+    return renderer_name, story_slug, slot_id, fingerprints, versions
 
-def _get_registry() -> Tuple[Dict[str, Renderer], Dict[str, InteractiveRenderer]]:
-    try:
-        from . import custom_visuals
-    except ImportError:  # pragma: no cover
-        return {}, {}
 
-    renderers = getattr(custom_visuals, "VISUAL_RENDERERS", {}) or {}
-    panels = getattr(custom_visuals, "INTERACTIVE_PANELS", {}) or {}
-    return renderers, panels
+def clear_render_cache() -> None:
+    with _cache_lock:
+        _render_cache.clear()
 
 
 def render_visual_from_registry(renderer_name: str, story_slug: str, slot_id: str) -> Tuple[Optional[go.Figure], Optional[str]]:
-    renderers, _ = _get_registry()
-    func = renderers.get(renderer_name)
+    try:
+        func = get_renderer(renderer_name)
+    except ImportError as exc:  # pragma: no cover
+        return None, str(exc)
     if func is None:
         return None, f"렌더러 '{renderer_name}'를 찾을 수 없습니다."
+    with METRICS.track(renderer_name) as probe:
+        fig, error = _render_visual(func, renderer_name, story_slug, slot_id, probe)
+        probe.figure = fig
+        probe.error = probe.error or error is not None
+    return fig, error
+
+
+def _render_visual(
+    func: Renderer, renderer_name: str, story_slug: str, slot_id: str, probe: RenderProbe
+) -> Tuple[Optional[go.Figure], Optional[str]]:
+    try:
+        key = _cache_key(renderer_name, story_slug, slot_id, func)
+    except Exception:  # pragma: no cover - fall back to an uncached render
+        key = None
+    if key is not None:
+        with _cache_lock:
+            cached = _render_cache.get(key)
+            if cached is not None:
+                _render_cache.move_to_end(key)
+        if cached is not None:
+            probe.cached = True
+            # Callers restyle the figure, so each gets its own; the cached
+            # dict is already valid and skips plotly's validation pass.
+            return go.Figure(cached, _validate=False), None
+    pool = get_render_pool()
+    if pool is not None:
+        figure, error, stale = pool.render(renderer_name, story_slug, slot_id)
+        # A stale figure is the last good one, served after a timeout or crash.
+        probe.error = stale
+        if figure is None:
+            return None, error
+        if key is not None and not stale:
+            _store(key, figure)
+        return go.Figure(figure, _validate=False), None
     try:
         fig = func(story_slug, slot_id)
     except Exception as exc:  # pragma: no cover
@@ -36,19 +90,32 @@ def render_visual_from_registry(renderer_name: str, story_slug: str, slot_id: st
             fig = go.Figure(fig)
         except Exception:  # pragma: no cover
             return None, "반환값이 Plotly Figure가 아닙니다."
+    if key is not None:
+        _store(key, fig.to_dict())
     return fig, None
 
 
+def _store(key: Tuple[Any, ...], figure: Dict[str, Any]) -> None:
+    with _cache_lock:
+        _render_cache[key] = figure
+        if len(_render_cache) > RENDER_CACHE_SIZE:
+            _render_cache.popitem(last=False)
+
+
 def render_interactive_panel(story_slug: str) -> bool:
-    _, panels = _get_registry()
-    func = panels.get(story_slug)
+    try:
+        func = get_panel(story_slug)
+    except ImportError:  # pragma: no cover
+        return False
     if func is None:
         return False
-    try:
-        func(story_slug)
-    except Exception as exc:  # pragma: no cover
-        import streamlit as st
+    with METRICS.track(f"panel:{story_slug}") as probe:
+        try:
+            func(story_slug)
+        except Exception as exc:  # pragma: no cover
+            import streamlit as st
 
-        st.error(f"인터랙티브 패널을 표시하는 중 오류가 발생했습니다: {exc}")
-        return False
+            probe.error = True
+            st.error(f"인터랙티브 패널을 표시하는 중 오류가 발생했습니다: {exc}")
+            return False
     return True
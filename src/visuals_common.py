@@ -0,0 +1,148 @@
+"""Helpers shared by the story figure modules (``visuals_*``).
+
+Renderers are looked up by name through ``visual_registry``, which imports
+only the module a renderer lives in. Renderers declare the workbook sheets
+they read with ``reads_sheets`` so ``visual_runtime`` can cache their
+figures until one of those sheets changes. Renderers that read more than
+cell values (embedded images) declare the whole file with
+``reads_workbooks`` instead.
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple, TypeVar
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from .workspace_data import DATA_DIR, resolve_excel_path
+
+
+@lru_cache(maxsize=8)
+def excel_data_path(filename: str) -> Path:
+    """Workbook under ``Data/excel_data``, resolved on first use (NFC/NFD tolerant)."""
+    return resolve_excel_path(filename) or (DATA_DIR / "excel_data" / filename)
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def reads_sheets(filename: str, *sheets: str) -> Callable[[F], F]:
+    """Declare the ``Data/excel_data`` sheets a renderer's figure depends on."""
+
+    def decorate(func: F) -> F:
+        declared = getattr(func, "data_sheets", ())
+        func.data_sheets = declared + tuple((filename, sheet) for sheet in sheets)
+        return func
+
+    return decorate
+
+
+def reads_workbooks(*filenames: str) -> Callable[[F], F]:
+    """Declare ``Data/excel_data`` workbooks a figure depends on as files, not sheet values."""
+
+    def decorate(func: F) -> F:
+        func.data_files = getattr(func, "data_files", ()) + filenames
+        return func
+
+    return decorate
+
+
+def _file_version(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=4)
+def _excel_file(path: Path, version: Tuple[int, int]) -> pd.ExcelFile:
+    return pd.ExcelFile(path)
+
+
+@lru_cache(maxsize=64)
+def _parsed_sheet(path: Path, version: Tuple[int, int], sheet: str) -> pd.DataFrame:
+    excel = _excel_file(path, version)
+    if sheet not in excel.sheet_names:
+        raise KeyError(f"시트 `{sheet}`을(를) 찾을 수 없습니다.")
+    return excel.parse(sheet)
+
+
+def workbook_sheet(path: Path, sheet: str) -> pd.DataFrame:
+    """Parsed sheet, re-read only when the workbook file changes on disk."""
+    version = _file_version(path)
+    if version is None:
+        raise FileNotFoundError(path)
+    return _parsed_sheet(path, version, sheet)
+
+
+@lru_cache(maxsize=256)
+def _sheet_digest(path: Path, version: Tuple[int, int], sheet: str) -> str:
+    try:
+        frame = _parsed_sheet(path, version, sheet)
+    except KeyError:
+        return "missing"
+    return hashlib.sha1(frame.to_csv().encode("utf-8")).hexdigest()
+
+
+def sheet_fingerprint(filename: str, sheet: str) -> str:
+    """Content hash of one sheet, so editing another sheet of the same workbook leaves it unchanged."""
+    path = excel_data_path(filename)
+    version = _file_version(path)
+    if version is None:
+        return "missing"
+    return _sheet_digest(path, version, sheet)
+
+
+def workbook_fingerprint(filename: str) -> Any:
+    """File signature of a workbook; any save of it changes the value."""
+    return _file_version(excel_data_path(filename)) or "missing"
+
+
+def parse_year(value) -> float:
+    """Four-digit year in a header or cell ("2019년", 2019.0), NaN when there is none."""
+    if pd.isna(value):
+        return np.nan
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, (float, np.floating)) and float(value).is_integer():
+        return int(value)
+    match = re.search(r"(\d{4})", str(value).strip())
+    return int(match.group(1)) if match else np.nan
+
+
+def year_columns(columns) -> list:
+    """Labels of ``columns`` that name a year, in order."""
+    return [col for col in columns if not pd.isna(parse_year(col))]
+
+
+def _clean_unnamed_first_col(df: pd.DataFrame, column_name: str = "category") -> pd.DataFrame:
+    df = df.copy()
+    if "Unnamed: 0" in df.columns:
+        return df.rename(columns={"Unnamed: 0": column_name})
+    return df.rename(columns={df.columns[0]: column_name})
+
+
+def _to_long_wide_years(df_wide: pd.DataFrame, id_col: str, value_name: str = "value") -> pd.DataFrame:
+    df = df_wide.copy()
+    year_cols = year_columns(df.columns)
+    long_df = df.melt(id_vars=[id_col], value_vars=year_cols, var_name="year", value_name=value_name)
+    long_df["year"] = long_df["year"].apply(parse_year)
+    long_df = long_df.dropna(subset=["year"])
+    long_df["year"] = long_df["year"].astype(int)
+    return long_df
+
+
+def _apply_common_layout(fig: go.Figure, title: str) -> go.Figure:
+    fig.update_layout(
+        title=title,
+        hovermode="closest",
+        legend_title_text="",
+        margin=dict(l=40, r=20, t=70, b=40),
+    )
+    return fig
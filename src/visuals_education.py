@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import io
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from .visuals_common import (
+    _apply_common_layout,
+    excel_data_path,
+    reads_sheets,
+    reads_workbooks,
+    workbook_sheet,
+)
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+EDUCATION_CARE_FILENAME = "(0204)교육돌봄 데이터_v1.0.xlsx"
+
+EDUCATION_CARE_SHEETS = {
+    1: "그림1",
+    2: "그림2",
+    3: "그림3",
+    4: "그림4",
+    5: "그림5",
+    6: "그림6",
+    7: "그림7",
+    8: "그림8",
+    9: "그림9",
+    10: "그림10",
+    11: "그림11",
+    12: "그림12",
+    13: "그림13",
+    14: "그림14",
+    15: "그림 15",
+}
+
+EDUCATION_CARE_TITLES = {
+    1: "그림 1. 학교급별 학령인구 수, 2015-2035",
+    2: "그림 2. 한국과 OECD 국가의 초·중·고 교사 1인당 학생 수, 2021-2023",
+    3: "그림 3. 한국과 OECD 국가의 초·중학교 학급당 학생 수, 2019-2023",
+    4: "그림 4. 한국과 OECD 국가의 교육단계별 GDP 대비 공교육비 비율, 2022",
+    5: "그림 5. 한국과 OECD 국가의 국제 학업성취도(PISA) 결과, 2015-2022",
+    6: "그림 6. 한국과 OECD 국가의 수학 점수 분산 비율, 2012-2022",
+    7: "그림 7. 학교급별 학생 1인당 월평균 사교육비, 2010-2024",
+    8: "그림 8. OECD 국가의 사교육 참여 수준, 2022",
+    9: "그림 9. 초·중·고 학교에 대한 평가, 2024",
+    10: "그림 10. OECD 주요국 학생의 학업 관련 불안감, 2015",
+    11: "그림 11. OECD 주요국 학부모의 학교교육 만족도, 2009-2022",
+    12: "그림 12. 교육수준별 전공-직업 일치도, 2000-2024",
+    13: "그림 13. 보육 및 유아교육 기관 만족도, 2015-2024",
+    14: "그림 14. 주요국 학생의 학교 밖 신체활동 미참여율, 2015",
+    15: "그림 15. OECD 주요국의 GDP 대비 보육·유아교육 공공지출 비율",
+}
+
+
+def education_care_path() -> Path:
+    return excel_data_path(EDUCATION_CARE_FILENAME)
+
+
+def _education_care_sheet(sheet: str) -> pd.DataFrame:
+    path = education_care_path()
+    if not path.exists():
+        raise FileNotFoundError(f"교육·돌봄 데이터 파일을 찾을 수 없습니다: {path}")
+    return workbook_sheet(path, sheet)
+
+
+def _education_care_sheet_image(sheet: str) -> Image.Image | None:
+    path = education_care_path()
+    if not path.exists():
+        return None
+    stat = path.stat()
+    return _sheet_image(path, (stat.st_mtime_ns, stat.st_size), sheet)
+
+
+@lru_cache(maxsize=1)
+def _sheet_image(path: Path, version: tuple, sheet: str) -> Image.Image | None:
+    # openpyxl and PIL are only needed for this one figure.
+    from openpyxl import load_workbook
+    from PIL import Image
+
+    wb = load_workbook(path, data_only=True)
+    if sheet not in wb.sheetnames:
+        return None
+    ws = wb[sheet]
+    images = getattr(ws, "_images", [])
+    if not images:
+        return None
+    img = images[0]
+    data_attr = getattr(img, "_data", None)
+    image_data = data_attr() if callable(data_attr) else data_attr
+    if not image_data:
+        return None
+    return Image.open(io.BytesIO(image_data)).convert("RGBA")
+
+
+@reads_sheets(EDUCATION_CARE_FILENAME, EDUCATION_CARE_SHEETS[4])
+def education_care_fig04(story_slug: str, slot_id: str) -> go.Figure:
+    df = _education_care_sheet(EDUCATION_CARE_SHEETS[4])
+
+    df2 = df.iloc[1:].copy()
+    df2 = df2.rename(columns={"구분": "국가"})
+    df2.columns = ["국가"] + df2.columns[1:].tolist()
+
+    stage_map = [
+        ("초·중등교육", "정부"),
+        ("초·중등교육", "민간"),
+        ("초·중등교육", "합계"),
+        ("고등교육", "정부"),
+        ("고등교육", "민간"),
+        ("고등교육", "합계"),
+        ("초등~고등교육", "정부"),
+        ("초등~고등교육", "민간"),
+        ("초등~고등교육", "합계"),
+    ]
+
+    value_cols = df2.columns[1:]
+    if len(value_cols) != 9:
+        raise ValueError(f"그림4: 예상 컬럼(9개)과 다릅니다. 현재={len(value_cols)}")
+
+    records = []
+    for (stage, fund), col in zip(stage_map, value_cols):
+        tmp = df2[["국가", col]].copy()
+        tmp["교육단계"] = stage
+        tmp["재원"] = fund
+        tmp = tmp.rename(columns={col: "GDP대비비율(%)"})
+        records.append(tmp)
+    long = pd.concat(records, ignore_index=True)
+
+    fig = px.bar(
+        long,
+        x="교육단계",
+        y="GDP대비비율(%)",
+        color="재원",
+        barmode="group",
+        facet_col="국가",
+    )
+    fig.update_layout(height=520)
+    return _apply_common_layout(fig, EDUCATION_CARE_TITLES[4])
+
+
+@reads_sheets(EDUCATION_CARE_FILENAME, EDUCATION_CARE_SHEETS[6])
+def education_care_fig06(story_slug: str, slot_id: str) -> go.Figure:
+    df = _education_care_sheet(EDUCATION_CARE_SHEETS[6])
+    df2 = df.copy()
+    df2 = df2.rename(columns={"Unnamed: 0": "지표"})
+
+    colmap = {
+        2012: ("2012", "한국"),
+        "Unnamed: 2": ("2012", "OECD 평균"),
+        2022: ("2022", "한국"),
+        "Unnamed: 4": ("2022", "OECD 평균"),
+    }
+
+    records = []
+    for col, (year, group) in colmap.items():
+        tmp = df2[["지표", col]].copy()
+        tmp["연도"] = year
+        tmp["구분"] = group
+        tmp = tmp.rename(columns={col: "값"})
+        records.append(tmp)
+    long = pd.concat(records, ignore_index=True)
+
+    fig = px.bar(
+        long,
+        x="지표",
+        y="값",
+        color="구분",
+        barmode="group",
+        facet_col="연도",
+    )
+    fig.update_layout(height=520)
+    return _apply_common_layout(fig, EDUCATION_CARE_TITLES[6])
+
+
+@reads_sheets(EDUCATION_CARE_FILENAME, EDUCATION_CARE_SHEETS[9])
+def education_care_fig09(story_slug: str, slot_id: str) -> go.Figure:
+    df = _education_care_sheet(EDUCATION_CARE_SHEETS[9]).copy()
+    df["평가대상"] = df["평가대상"].ffill()
+
+    dist_cols = ["매우 잘하고 있다", "잘하고 있다", "보통이다", "못하고 있다", "전혀 못하고 있다"]
+
+    dist_long = df.melt(
+        id_vars=["평가대상", "구분", "2023년 평균점수", "2024년 평균점수"],
+        value_vars=dist_cols,
+        var_name="응답",
+        value_name="비율",
+    )
+
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    dist_long["대상"] = dist_long["평가대상"].astype(str) + " / " + dist_long["구분"].astype(str)
+
+    for resp in dist_cols:
+        tmp = dist_long[dist_long["응답"] == resp]
+        fig.add_trace(go.Bar(x=tmp["대상"], y=tmp["비율"], name=resp), secondary_y=False)
+
+    base = df.copy()
+    base["대상"] = base["평가대상"].astype(str) + " / " + base["구분"].astype(str)
+
+    fig.add_trace(
+        go.Scatter(x=base["대상"], y=base["2023년 평균점수"], mode="lines+markers", name="2023 평균점수"),
+        secondary_y=True,
+    )
+    fig.add_trace(
+        go.Scatter(x=base["대상"], y=base["2024년 평균점수"], mode="lines+markers", name="2024 평균점수"),
+        secondary_y=True,
+    )
+
+    fig.update_layout(barmode="stack", xaxis_title="평가대상 / 구분", legend_title="항목")
+    fig.update_yaxes(title_text="응답 비율(%)", secondary_y=False)
+    fig.update_yaxes(title_text="평균점수", secondary_y=True, showgrid=False)
+
+    return _apply_common_layout(fig, EDUCATION_CARE_TITLES[9])
+
+
+# Drawn from the sheet's embedded image, which sheet_fingerprint (cell values) does not see.
+@reads_workbooks(EDUCATION_CARE_FILENAME)
+def education_care_fig15(story_slug: str, slot_id: str) -> go.Figure:
+    img = _education_care_sheet_image(EDUCATION_CARE_SHEETS[15])
+    if img is None:
+        fig = go.Figure()
+        fig.add_annotation(
+            text="이미지를 찾을 수 없습니다.",
+            x=0.5,
+            y=0.5,
+            showarrow=False,
+            xref="paper",
+            yref="paper",
+        )
+        return _apply_common_layout(fig, EDUCATION_CARE_TITLES[15])
+
+    fig = go.Figure(go.Image(z=np.array(img)))
+    fig.update_xaxes(showticklabels=False, showgrid=False, zeroline=False)
+    fig.update_yaxes(showticklabels=False, showgrid=False, zeroline=False)
+    return _apply_common_layout(fig, EDUCATION_CARE_TITLES[15])
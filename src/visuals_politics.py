@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from .visuals_common import (
+    _apply_common_layout,
+    excel_data_path,
+    reads_sheets,
+    workbook_sheet,
+)
+
+POLITICS_CIVIC_FILENAME = "(0204)정치사회 데이터_v1.0.xlsx"
+POLITICS_CIVIC_SHEETS = {idx: f"그림{idx}" for idx in range(1, 15)}
+
+POLITICS_CIVIC_TITLES = {
+    1: "그림 1. 일반 신뢰, 2003-2025",
+    2: "그림 2. 이타주의와 이기주의에 대한 인식, 2003-2025",
+    3: "그림 3. 공정성에 대한 인식, 2003-2025",
+    4: "그림 4. 중앙정부에 대한 신뢰, 2003-2025",
+    5: "그림 5. 대통령실에 대한 신뢰, 2003-2025",
+    6: "그림 6. 국회에 대한 신뢰, 2003-2025",
+    7: "그림 7. 대법원에 대한 신뢰, 2003-2025",
+    8: "그림 8. 이념 성향별 정치 효능감, 2013-2024",
+    9: "그림 9. 선거 투표율, 1987-2025",
+    10: "그림 10. 비선거적 정치 참여율, 2013-2024",
+    11: "그림 11. 무당파의 이념 성향, 2003-2025",
+    12: "그림 12. 진보 정당 지지자의 이념 성향, 2003-2025",
+    13: "그림 13. 보수 정당 지지자의 이념 성향, 2003-2025",
+    14: "그림 14. 주요국의 정치 양극화 수준, 2000-2025",
+}
+
+
+def politics_civic_path() -> Path:
+    return excel_data_path(POLITICS_CIVIC_FILENAME)
+
+
+def _politics_civic_sheet(sheet: str) -> pd.DataFrame:
+    path = politics_civic_path()
+    if not path.exists():
+        raise FileNotFoundError(f"정치·시민사회 데이터 파일을 찾을 수 없습니다: {path}")
+    return workbook_sheet(path, sheet)
+
+
+def _parse_politics_fig10_blocks() -> pd.DataFrame:
+    raw = _politics_civic_sheet(POLITICS_CIVIC_SHEETS[10])
+    raw = raw.replace({np.nan: None})
+    records = []
+
+    def collect_block(activity, year_col, rate_col, start_row):
+        r = start_row
+        while r < len(raw):
+            y = raw.iloc[r, year_col]
+            v = raw.iloc[r, rate_col]
+            if (raw.iloc[r, 0] is not None) or (raw.iloc[r, 4] is not None):
+                if r != start_row:
+                    break
+            if y is None and v is None:
+                r += 1
+                continue
+            try:
+                year = int(float(y))
+                rate = float(v)
+                records.append({"activity": activity, "year": year, "rate": rate})
+            except Exception:
+                pass
+            r += 1
+        return r
+
+    r = 0
+    while r < len(raw):
+        left_name = raw.iloc[r, 0]
+        right_name = raw.iloc[r, 4]
+        if left_name is not None and isinstance(left_name, str) and left_name.strip():
+            r = collect_block(left_name.strip(), 1, 2, r + 1)
+            continue
+        if right_name is not None and isinstance(right_name, str) and right_name.strip():
+            r = collect_block(right_name.strip(), 5, 6, r + 1)
+            continue
+        r += 1
+
+    return pd.DataFrame.from_records(records)
+
+
+@reads_sheets(POLITICS_CIVIC_FILENAME, POLITICS_CIVIC_SHEETS[10])
+def politics_civic_fig10(story_slug: str, slot_id: str) -> go.Figure:
+    long = _parse_politics_fig10_blocks()
+    long = long.sort_values(["activity", "year"]).reset_index(drop=True)
+
+    activities = long["activity"].unique().tolist()
+    default_act = activities[0] if activities else None
+
+    fig = go.Figure()
+    for act in activities:
+        d = long[long["activity"] == act]
+        fig.add_trace(
+            go.Scatter(
+                x=d["year"],
+                y=d["rate"],
+                mode="lines+markers",
+                name=act,
+                visible=(act == default_act),
+            )
+        )
+
+    buttons = []
+    for i, act in enumerate(activities):
+        vis = [False] * len(activities)
+        vis[i] = True
+        buttons.append(
+            dict(
+                label=act,
+                method="update",
+                args=[{"visible": vis}, {"title": f"{POLITICS_CIVIC_TITLES[10]} - {act}"}],
+            )
+        )
+
+    fig.update_layout(
+        title=f"{POLITICS_CIVIC_TITLES[10]} - {default_act}" if default_act else POLITICS_CIVIC_TITLES[10],
+        xaxis_title="연도",
+        yaxis_title="참여율(%)",
+        updatemenus=[dict(buttons=buttons, direction="down", x=1.02, y=1.0, xanchor="left")],
+    )
+    if not long.empty:
+        fig.update_yaxes(range=[0, max(10, float(long["rate"].max()))])
+    return _apply_common_layout(fig, POLITICS_CIVIC_TITLES[10])
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import time
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import streamlit as st
@@ -12,9 +14,22 @@ try:
 except ImportError:  # pragma: no cover - optional dependency
     HAS_QUILL = False
 
-from .generated_content import ensure_unique_slug, list_stories, load_story, save_story
-from .markdown_utils import auto_format_text
+from .generated_content import (
+    diff_revisions,
+    ensure_unique_slug,
+    list_revisions,
+    list_stories,
+    load_revision,
+    load_story,
+    save_story,
+)
+from .markdown_utils import assemble_markdown, auto_format_text, iter_formatted_blocks
+from .render_metrics import METRICS, SAMPLE_RATE, WALL_BUCKETS_MS
 from .visual_runtime import render_visual_from_registry
+from .workspace_data import available_papers, display_name, iter_pdf_pages
+
+# Seconds between live preview refreshes while a PDF is being formatted.
+PDF_PREVIEW_INTERVAL = 0.3
 
 
 def _state_key(slug: str, suffix: str) -> str:
@@ -99,6 +114,44 @@ def _remove_visual_slot(slug: str, slot_id: str) -> None:
         st.session_state.pop(_state_key(slug, f"{slot_id}_{suffix}"), None)
 
 
+def _stream_pdf_markdown(slug: str, pdf_path: str) -> None:
+    """Format a PDF page by page, refreshing a live preview as blocks arrive."""
+    preview = st.empty()
+    blocks = []
+    shown_at = 0.0
+    for block in iter_formatted_blocks(iter_pdf_pages(pdf_path)):
+        blocks.append(block)
+        now = time.monotonic()
+        if now - shown_at >= PDF_PREVIEW_INTERVAL:
+            preview.markdown(assemble_markdown(blocks))
+            shown_at = now
+    markdown = assemble_markdown(blocks)
+    preview.markdown(markdown)
+    # Widget-bound keys can only change before their widgets are created,
+    # so the result is applied at the top of the next run.
+    st.session_state[_state_key(slug, "pending_markdown")] = markdown
+    st.session_state[_state_key(slug, "pending_source")] = display_name(Path(pdf_path))
+
+
+def _render_pdf_import(slug: str) -> None:
+    try:
+        papers = available_papers()
+    except FileNotFoundError:
+        papers = []
+    if not papers:
+        st.caption("Data/paper 폴더에 PDF가 없습니다.")
+        return
+    selected = st.selectbox(
+        "PDF 선택",
+        options=[str(path) for path in papers],
+        format_func=lambda value: display_name(Path(value)),
+        key=_state_key(slug, "pdf_import_path"),
+    )
+    if st.button("PDF에서 본문 가져오기", key=_state_key(slug, "pdf_import_btn")):
+        _stream_pdf_markdown(slug, selected)
+        st.rerun()
+
+
 def _render_story_editor(slug: str) -> None:
     _ensure_story_state(slug)
 
@@ -109,11 +162,17 @@ def _render_story_editor(slug: str) -> None:
     slots_key = _state_key(slug, "visual_slots")
     slot_data_key = _state_key(slug, "visual_slot_data")
 
+    pending_markdown = st.session_state.pop(_state_key(slug, "pending_markdown"), None)
+    if pending_markdown is not None:
+        st.session_state[markdown_key] = pending_markdown
+        st.session_state[format_key] = "markdown"
+        st.session_state[source_key] = st.session_state.pop(_state_key(slug, "pending_source"), "")
+
     st.subheader("기본 정보")
     st.text_input("스토리 제목", key=title_key, placeholder="제목을 입력하세요.")
     st.text_input("데이터/출처(선택)", key=source_key, placeholder="예) 통계청, 연구 보고서 등")
 
-    tabs = st.tabs(["본문 작성", "시각화 슬롯", "미리보기"])
+    tabs = st.tabs(["본문 작성", "시각화 슬롯", "미리보기", "버전 기록"])
 
     # 본문 작성
     with tabs[0]:
@@ -182,6 +241,8 @@ def _render_story_editor(slug: str) -> None:
                     st.info("본문을 정리했습니다.")
                 else:
                     st.info("정리할 내용이 없습니다.")
+            st.divider()
+            _render_pdf_import(slug)
 
     # 시각화 슬롯 관리
     with tabs[1]:
@@ -193,7 +254,7 @@ def _render_story_editor(slug: str) -> None:
         if not slots:
             st.info("아직 등록된 시각화 슬롯이 없습니다. 버튼을 눌러 공란을 추가하세요.")
         else:
-            st.info("렌더러 함수는 `src/custom_visuals.py`에 정의해야 합니다. 스토리와 슬롯 ID를 기반으로 Plotly Figure를 반환하도록 구현하세요.")
+            st.info("엑셀 시트를 그대로 그리는 그림은 `src/figure_specs.json`에 사양으로 추가하면 자동으로 등록됩니다. 그 밖의 렌더러 함수는 `src/visuals_*.py` 모듈에 정의하고 `src/visual_registry.py`에 이름을 등록해야 합니다. 스토리와 슬롯 ID를 기반으로 Plotly Figure를 반환하도록 구현하세요.")
             for slot_id in slots:
                 title_key = _state_key(slug, f"{slot_id}_title")
                 caption_key = _state_key(slug, f"{slot_id}_caption")
@@ -295,6 +356,59 @@ def _render_story_editor(slug: str) -> None:
                 save_story(slug, payload)
                 st.success("스토리를 저장했습니다. 사용자 페이지에서 확인해 주세요.")
 
+    # 버전 기록
+    with tabs[3]:
+        _render_revision_history(slug)
+
+
+def _render_revision_history(slug: str) -> None:
+    revisions = list_revisions(slug)
+    if not revisions:
+        st.info("저장된 버전이 없습니다. 스토리를 저장하면 버전이 기록됩니다.")
+        return
+
+    labels = {
+        item["rev"]: f"r{item['rev']} · {item.get('updated_at') or '-'} · {item.get('title') or ''}"
+        for item in revisions
+    }
+    rev_options = list(reversed(list(labels.keys())))
+    col_old, col_new = st.columns(2)
+    old_rev = col_old.selectbox(
+        "이전 버전",
+        options=rev_options,
+        index=min(1, len(rev_options) - 1),
+        format_func=labels.get,
+        key=_state_key(slug, "revision_old"),
+    )
+    new_rev = col_new.selectbox(
+        "비교 버전",
+        options=rev_options,
+        index=0,
+        format_func=labels.get,
+        key=_state_key(slug, "revision_new"),
+    )
+    diff_text = diff_revisions(slug, old_rev, new_rev)
+    if diff_text:
+        st.code(diff_text, language="diff")
+    else:
+        st.caption("두 버전의 본문이 같습니다.")
+
+    if st.button(
+        "선택한 이전 버전을 편집기로 불러오기",
+        key=_state_key(slug, "revision_restore"),
+        on_click=_restore_revision,
+        args=(slug, old_rev),
+    ):
+        st.info(f"r{old_rev} 버전을 불러왔습니다. 저장하면 새 버전으로 기록됩니다.")
+
+
+def _restore_revision(slug: str, rev: int) -> None:
+    # Runs as a button callback so widget-bound keys can still be assigned.
+    revision = load_revision(slug, rev) or {}
+    st.session_state[_state_key(slug, "title")] = revision.get("title", "")
+    st.session_state[_state_key(slug, "markdown")] = revision.get("markdown", "")
+    st.session_state[_state_key(slug, "format")] = revision.get("format", "markdown")
+
 
 def render_workspace(*, admin_mode: bool = False) -> None:
     if not admin_mode:
@@ -344,3 +458,53 @@ def render_workspace(*, admin_mode: bool = False) -> None:
     st.markdown(f"### 현재 편집 중: `{selected_slug}`")
 
     _render_story_editor(selected_slug)
+
+    st.divider()
+    with st.expander("렌더러 성능 지표"):
+        _render_renderer_metrics()
+
+
+def _render_renderer_metrics() -> None:
+    snapshot = METRICS.snapshot()
+    sampling = f"{SAMPLE_RATE:.0%} 호출 샘플링" if SAMPLE_RATE else "꺼짐 (EDA_RENDER_PROFILE_SAMPLE)"
+    st.caption(f"최근 {METRICS.window}회 호출 기준 · 메모리/크기 측정: {sampling}")
+    if not snapshot:
+        st.info("아직 기록된 렌더러 호출이 없습니다.")
+        return
+
+    def _p(stats: Optional[Dict[str, float]], key: str) -> Optional[float]:
+        return stats.get(key) if stats else None
+
+    rows = [
+        {
+            "렌더러": name,
+            "호출": entry["calls"],
+            "캐시 적중": entry["cache_hits"],
+            "오류": entry["errors"],
+            "p50 (ms)": entry["wall_ms"]["p50"],
+            "p95 (ms)": entry["wall_ms"]["p95"],
+            "렌더 p95 (ms)": entry["render_wall_ms"]["p95"],
+            "CPU p50 (ms)": entry["cpu_ms"]["p50"],
+            "피크 메모리 p95 (KiB)": _p(entry["peak_kib"], "p95"),
+            "JSON 크기 (KiB)": _p(entry["json_kib"], "p50"),
+            "트레이스": entry["traces"],
+        }
+        for name, entry in snapshot.items()
+    ]
+    st.dataframe(rows, use_container_width=True, hide_index=True)
+
+    selected = st.selectbox("응답 시간 분포", options=list(snapshot), key="workspace_metrics_renderer")
+    labels = [f"≤{edge}ms" for edge in WALL_BUCKETS_MS] + [f">{WALL_BUCKETS_MS[-1]}ms"]
+    st.bar_chart({"호출 수": dict(zip(labels, snapshot[selected]["wall_ms"]["histogram"]))})
+
+    col_download, col_reset = st.columns(2)
+    col_download.download_button(
+        "JSON 내려받기",
+        data=METRICS.to_json(),
+        file_name="render_metrics.json",
+        mime="application/json",
+        key="workspace_metrics_download",
+    )
+    if col_reset.button("지표 초기화", key="workspace_metrics_reset"):
+        METRICS.reset()
+        st.rerun()
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import os
 import unicodedata
+from concurrent.futures import ProcessPoolExecutor
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 import pandas as pd
 
@@ -22,6 +25,11 @@ if not DATA_DIR.exists():
     DATA_DIR = BASE_DIR / "legacy_app" / "Data"
 PAPER_DIR = DATA_DIR / "paper"
 EXCEL_DIR = DATA_DIR / "excel_data"
+# Extracted page texts survive restarts here, keyed by page content hash.
+PDF_CACHE_DIR = Path(os.environ.get("EDA_PDF_CACHE_DIR", BASE_DIR / ".cache" / "pdf_text"))
+PDF_WORKERS = int(os.environ.get("EDA_PDF_WORKERS", 0)) or min(os.cpu_count() or 1, 8)
+# Below this many uncached pages, extraction stays in-process.
+PDF_PARALLEL_MIN_PAGES = 8
 
 
 def _ensure_directory(path: Path) -> Path:
@@ -45,28 +53,180 @@ def display_name(path: Path) -> str:
 
 
 def workbook_path_by_name(filename: str) -> Optional[Path]:
+    target = unicodedata.normalize("NFC", filename)
     for workbook in available_workbooks():
-        if workbook.name == filename:
+        if unicodedata.normalize("NFC", workbook.name) == target:
             return workbook
     return None
 
 
-@lru_cache(maxsize=16)
-def extract_pdf_text(path: str) -> str:
-    pdf_path = Path(path)
-    if not pdf_path.exists():
-        raise FileNotFoundError(pdf_path)
+def _require_pdf_reader() -> None:
     if PdfReader is None:
         raise RuntimeError(
             "pypdf가 설치되어 있지 않습니다. requirements.txt에 추가한 뒤 pip install을 실행해주세요."
         )
-    with pdf_path.open("rb") as handle:
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# Bump when _page_hash changes what it covers, so old manifests are not reused.
+_PAGE_HASH_VERSION = 2
+
+
+def _hash_resources(digest, resources, seen: set) -> None:
+    """Fonts and Form XObjects (recursively) reachable from ``resources``."""
+    resources = resources.get_object() if resources is not None else {}
+    fonts = resources.get("/Font") or {}
+    fonts = fonts.get_object() if hasattr(fonts, "get_object") else fonts
+    for name in sorted(fonts):
+        font = fonts[name].get_object()
+        digest.update(f"{name}:{font.get('/BaseFont')}:{font.get('/Subtype')}".encode("utf-8"))
+        to_unicode = font.get("/ToUnicode")
+        if to_unicode is not None:
+            digest.update(to_unicode.get_object().get_data())
+    xobjects = resources.get("/XObject") or {}
+    xobjects = xobjects.get_object() if hasattr(xobjects, "get_object") else xobjects
+    for name in sorted(xobjects):
+        reference = xobjects[name]
+        xobject = reference.get_object()
+        if xobject.get("/Subtype") != "/Form":
+            continue
+        digest.update(f"{name}:form".encode("utf-8"))
+        # A form drawn from several places is hashed once; its name above still records each use.
+        key = getattr(reference, "idnum", None) or id(xobject)
+        if key in seen:
+            continue
+        seen.add(key)
+        digest.update(xobject.get_data())
+        _hash_resources(digest, xobject.get("/Resources"), seen)
+
+
+def _page_hash(page) -> str:
+    """Hash of what text extraction depends on: content stream, fonts and Form XObjects."""
+    digest = hashlib.sha256(f"v{_PAGE_HASH_VERSION}".encode("utf-8"))
+    contents = page.get_contents()
+    if contents is not None:
+        digest.update(contents.get_data())
+    _hash_resources(digest, page.get("/Resources"), set())
+    return digest.hexdigest()
+
+
+def _clean_page_text(text: str) -> str:
+    return (text or "").replace("\u0000", "").strip()
+
+
+def _extract_page_chunk(path: str, indices: Sequence[int]) -> List[Tuple[int, str]]:
+    """Worker entry point: extract ``indices`` from a fresh reader."""
+    with open(path, "rb") as handle:
         reader = PdfReader(handle)
-        fragments: List[str] = []
-        for page in reader.pages:
-            text = page.extract_text() or ""
-            fragments.append(text.replace("\u0000", ""))
-    return "\n".join(fragment.strip() for fragment in fragments if fragment).strip()
+        return [(index, _clean_page_text(reader.pages[index].extract_text())) for index in indices]
+
+
+def _write_text_atomic(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def _page_cache_path(page_hash: str) -> Path:
+    return PDF_CACHE_DIR / "pages" / page_hash[:2] / f"{page_hash}.txt"
+
+
+def _pdf_page_hashes(pdf_path: Path) -> List[str]:
+    """Per-page content hashes, memoised on disk per PDF file hash."""
+    manifest_path = PDF_CACHE_DIR / "manifests" / f"{_file_sha256(pdf_path)}.v{_PAGE_HASH_VERSION}.json"
+    try:
+        return json.loads(manifest_path.read_text(encoding="utf-8"))["pages"]
+    except (OSError, ValueError, KeyError):
+        pass
+    with pdf_path.open("rb") as handle:
+        hashes = [_page_hash(page) for page in PdfReader(handle).pages]
+    try:
+        _write_text_atomic(manifest_path, json.dumps({"source": pdf_path.name, "pages": hashes}))
+    except OSError:  # pragma: no cover - read-only deployments
+        pass
+    return hashes
+
+
+def extract_pdf_pages(path: str, pages: Optional[Iterable[int]] = None) -> List[str]:
+    """Text of the requested pages (0-based, default all), in order.
+
+    Pages are cached on disk by content hash, so an edited PDF only
+    re-extracts the pages that changed. Uncached pages are split across a
+    process pool when there are enough of them.
+    """
+    pdf_path = Path(path)
+    if not pdf_path.exists():
+        raise FileNotFoundError(pdf_path)
+    _require_pdf_reader()
+    hashes = _pdf_page_hashes(pdf_path)
+    wanted = list(range(len(hashes))) if pages is None else [index for index in pages if 0 <= index < len(hashes)]
+
+    texts: Dict[int, str] = {}
+    missing: List[int] = []
+    for index in wanted:
+        try:
+            texts[index] = _page_cache_path(hashes[index]).read_text(encoding="utf-8")
+        except OSError:
+            missing.append(index)
+
+    if missing:
+        workers = min(PDF_WORKERS, len(missing))
+        if workers > 1 and len(missing) >= PDF_PARALLEL_MIN_PAGES:
+            chunks = [missing[offset::workers] for offset in range(workers)]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = [item for chunk in pool.map(_extract_page_chunk, [str(pdf_path)] * workers, chunks) for item in chunk]
+        else:
+            results = _extract_page_chunk(str(pdf_path), missing)
+        for index, text in results:
+            texts[index] = text
+            try:
+                _write_text_atomic(_page_cache_path(hashes[index]), text)
+            except OSError:  # pragma: no cover - read-only deployments
+                pass
+    return [texts[index] for index in wanted]
+
+
+def iter_pdf_pages(path: str) -> Iterator[str]:
+    """Yield page texts in order, one page in memory at a time.
+
+    Cached pages are read from disk; the rest are extracted in-process as the
+    consumer asks for them, so the first page is available immediately.
+    """
+    pdf_path = Path(path)
+    if not pdf_path.exists():
+        raise FileNotFoundError(pdf_path)
+    _require_pdf_reader()
+    hashes = _pdf_page_hashes(pdf_path)
+    reader = None
+    with pdf_path.open("rb") as handle:
+        for index, page_hash in enumerate(hashes):
+            cache_path = _page_cache_path(page_hash)
+            try:
+                yield cache_path.read_text(encoding="utf-8")
+                continue
+            except OSError:
+                pass
+            if reader is None:
+                reader = PdfReader(handle)
+            text = _clean_page_text(reader.pages[index].extract_text())
+            try:
+                _write_text_atomic(cache_path, text)
+            except OSError:  # pragma: no cover - read-only deployments
+                pass
+            yield text
+
+
+def extract_pdf_text(path: str, pages: Optional[Iterable[int]] = None) -> str:
+    """Full text (or the given 0-based page range) of a PDF, pages joined by newlines."""
+    return "\n".join(text for text in extract_pdf_pages(path, pages) if text).strip()
 
 
 @lru_cache(maxsize=16)
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import copy
+from pathlib import Path
+
+import pytest
+
+from src import content_loader
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(autouse=True)
+def repo_cwd(monkeypatch):
+    # content_loader resolves content/ relative to the working directory.
+    monkeypatch.chdir(ROOT)
+
+
+def test_search_reports_applied_correction():
+    exact = content_loader.search_contents("교육")
+    assert len(exact) >= content_loader.FUZZY_MIN_HITS
+    assert exact.corrected is None
+
+    typo = content_loader.search_contents("교욱")
+    assert typo.corrected == "교육"
+    assert {item["id"] for item in exact} <= {item["id"] for item in typo}
+
+
+def test_search_without_fuzzy_reports_no_correction():
+    assert content_loader.search_contents("교욱", fuzzy=False).corrected is None
+
+
+def test_typeahead_contents_follow_matching_items():
+    ids = content_loader.get_typeahead_index().matching_items("교", 8)
+    assert [item["id"] for item in content_loader.typeahead_contents("교")] == ids
+    assert all(item["category"] == "welfare" for item in content_loader.typeahead_contents("교", "welfare"))
+
+
+def test_typeahead_index_survives_equal_signature(monkeypatch):
+    index = content_loader.get_search_index()
+    typeahead = content_loader.get_typeahead_index()
+    # An equal signature held in a new object (e.g. after reindex_content) is not a change.
+    monkeypatch.setattr(index, "signature", copy.deepcopy(index.signature))
+    assert content_loader.get_typeahead_index() is typeahead
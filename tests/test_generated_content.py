@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+
+import pytest
+
+from src import generated_content, story_store
+from src.story_revisions import JsonlRevisionLog
+from src.story_store import JournaledArchive, SqliteStoryStore
+
+
+@pytest.fixture
+def story_tree(tmp_path, monkeypatch):
+    """JSON backend rooted in an empty directory: no snapshot, journal or manifest."""
+    output = tmp_path / "generated_content.json"
+    monkeypatch.setattr(generated_content, "STORY_BACKEND", "json")
+    monkeypatch.setattr(generated_content, "OUTPUT_PATH", output)
+    monkeypatch.setattr(generated_content, "MANIFEST_PATH", tmp_path / "generated_content.manifest.json")
+    monkeypatch.setattr(generated_content, "_manifest_cache", None)
+    monkeypatch.setattr(generated_content, "_revision_log", JsonlRevisionLog(tmp_path / "revisions"))
+    monkeypatch.setattr(
+        generated_content,
+        "_archive",
+        JournaledArchive(
+            output,
+            tmp_path / "generated_content.journal.jsonl",
+            read_snapshot=generated_content._read_snapshot,
+            write_snapshot=generated_content._write_raw,
+            compact_bytes=generated_content.JOURNAL_COMPACT_BYTES,
+        ),
+    )
+    return tmp_path
+
+
+def _within(seconds, func, *args):
+    worker = threading.Thread(target=func, args=args, daemon=True)
+    worker.start()
+    worker.join(seconds)
+    assert not worker.is_alive(), f"{func.__name__} did not return within {seconds}s"
+
+
+def test_save_story_without_manifest(story_tree):
+    assert not generated_content.MANIFEST_PATH.exists()
+
+    _within(10, generated_content.save_story, "first", {"title": "첫 이야기", "markdown": "본문"})
+
+    assert generated_content.MANIFEST_PATH.exists()
+    assert generated_content.story_manifest()["first"]["title"] == "첫 이야기"
+    assert generated_content.load_story("first")["markdown"] == "본문"
+    assert [entry["rev"] for entry in generated_content.list_revisions("first")] == [1]
+
+
+def test_save_stories_without_manifest(story_tree):
+    stories = {f"story-{i}": {"title": f"이야기 {i}", "markdown": f"본문 {i}"} for i in range(3)}
+
+    _within(10, generated_content.save_stories, stories)
+
+    assert sorted(generated_content.story_manifest()) == sorted(stories)
+    # The revision lock was released: a later single save goes through too.
+    _within(10, generated_content.save_story, "story-0", {"title": "이야기 0", "markdown": "고친 본문"})
+    assert [entry["rev"] for entry in generated_content.list_revisions("story-0")] == [1, 2]
+
+
+def test_manifest_follows_archive_replaced_outside_the_app(story_tree):
+    generated_content.save_story("a", {"title": "A", "markdown": "a"})
+    assert generated_content.list_stories() == {"a": "A"}
+
+    # e.g. a pull or restore replacing the snapshot and dropping the journal
+    generated_content._archive.journal_path.unlink()
+    generated_content._write_raw(
+        {"stories": {"a": {"title": "A", "markdown": "a"}, "b": {"title": "B", "markdown": "b"}}}
+    )
+
+    assert generated_content.list_stories() == {"a": "A", "b": "B"}
+    assert generated_content.ensure_unique_slug("b") == "b-2"
+    assert generated_content.load_story("b")["title"] == "B"
+
+
+def test_legacy_manifest_file_is_rebuilt(story_tree):
+    generated_content.save_story("a", {"title": "A", "markdown": "a"})
+    # Manifests written before the source signature were a bare slug mapping.
+    generated_content.MANIFEST_PATH.write_text(json.dumps({"old": {"title": "Old"}}), encoding="utf-8")
+
+    assert generated_content.list_stories() == {"a": "A"}
+
+
+@pytest.fixture
+def sqlite_tree(story_tree, monkeypatch):
+    monkeypatch.setattr(generated_content, "STORY_BACKEND", "sqlite")
+    monkeypatch.setattr(generated_content, "_sqlite_store", SqliteStoryStore(story_tree / "stories.sqlite3"))
+    return story_tree
+
+
+def test_sqlite_save_story_records_revisions(sqlite_tree):
+    generated_content.save_story("a", {"title": "A", "markdown": "첫 줄\n"})
+    generated_content.save_story("a", {"title": "A", "markdown": "첫 줄\n둘째 줄\n"})
+
+    assert [entry["rev"] for entry in generated_content.list_revisions("a")] == [1, 2]
+    assert generated_content.load_revision("a", 1)["markdown"] == "첫 줄\n"
+    assert generated_content.load_story("a")["markdown"] == "첫 줄\n둘째 줄\n"
+
+
+def test_sqlite_save_story_is_atomic_with_its_revision(sqlite_tree, monkeypatch):
+    generated_content.save_story("a", {"title": "A", "markdown": "v1\n"})
+
+    def fail(*args, **kwargs):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(story_store, "_insert_revision", fail)
+    with pytest.raises(sqlite3.OperationalError):
+        generated_content.save_story("a", {"title": "A", "markdown": "v2\n"})
+
+    assert generated_content.load_story("a")["markdown"] == "v1\n"
+    assert [entry["rev"] for entry in generated_content.list_revisions("a")] == [1]
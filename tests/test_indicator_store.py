@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src import indicator_store
+from src.indicator_store import IndicatorDef, IndicatorStore
+
+SHEETS = {
+    "rates": pd.DataFrame(
+        {"구분": ["전체", "OECD\xa0평균", "한국"], "2019년": [1.0, 2.0, 3.0], "2020년": [4.0, None, 6.0], "2021년": [7.0, 8.0, 9.0]}
+    ),
+    "turnout": pd.DataFrame({"연도": [2017, 2022], "대통령선거": [77.2, 77.1], "Unnamed: 2": [None, None]}),
+    "notes": pd.DataFrame({"구분": ["출처"], "2020년": ["통계청"]}),
+}
+CATALOG = (
+    IndicatorDef("rates", "welfare", "비율", "%", "book.xlsx", "rates", headline="전체"),
+    IndicatorDef("turnout", "politics", "투표율", "%", "book.xlsx", "turnout", layout="year_rows"),
+    IndicatorDef("notes", "politics", "주석", "", "book.xlsx", "notes"),
+    IndicatorDef("absent", "politics", "없는 시트", "", "book.xlsx", "absent"),
+)
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    workbook = tmp_path / "book.xlsx"
+    workbook.touch()
+    monkeypatch.setattr(indicator_store, "excel_data_path", lambda name: tmp_path / name)
+    monkeypatch.setattr(indicator_store, "workbook_sheet", lambda path, sheet: SHEETS[sheet].copy())
+    return IndicatorStore.from_workbooks(CATALOG)
+
+
+def test_sheets_without_observations_are_left_out(store):
+    assert [definition.id for definition in store.indicators()] == ["rates", "turnout"]
+    assert store.entities("notes") == []
+    assert store.year_bounds("notes") is None
+
+
+def test_entities_keep_sheet_order_and_clean_labels(store):
+    assert store.entities("rates") == ["전체", "OECD 평균", "한국"]
+    assert store.entities("turnout") == ["대통령선거"]
+    assert store.year_bounds("rates") == (2019, 2021)
+
+
+def test_range_and_frame(store):
+    years, values = store.range("rates", "OECD 평균")
+    assert years.tolist() == [2019, 2021]
+    assert values.tolist() == [2.0, 8.0]
+    years, values = store.range("rates", "한국", start=2020, end=2020)
+    assert years.tolist() == [2020] and values.tolist() == [6.0]
+    assert store.range("rates", "없음")[0].size == 0
+
+    frame = store.frame("rates", ["한국", "전체"], start=2020)
+    assert frame.to_dict("list") == {"entity": ["한국", "한국", "전체", "전체"], "year": [2020, 2021, 2020, 2021], "value": [6.0, 9.0, 4.0, 7.0]}
+
+
+def test_cube_compare(store):
+    cube = store.cube(("rates",))
+    assert cube is store.cube(("rates",))
+    block = cube.compare("rates", ["한국", "OECD 평균"])
+    np.testing.assert_array_equal(block, [[3.0, 6.0, 9.0], [2.0, np.nan, 8.0]])
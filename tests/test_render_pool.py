@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src import render_pool
+from src.visual_registry import figure_specs
+
+
+@pytest.fixture
+def pool():
+    pool = render_pool.RenderPool(2, timeout=60)
+    yield pool
+    pool.close()
+
+
+def test_concurrent_renders_share_last_good(pool, monkeypatch):
+    # A one-entry cache makes every success evict another thread's entry.
+    monkeypatch.setattr(render_pool, "LAST_GOOD_SIZE", 1)
+    names = sorted(figure_specs())[:4]
+    calls = [(name, "story", f"slot-{i}") for i in range(6) for name in names]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda call: pool.render(*call), calls))
+
+    assert all(error is None and figure is not None and not stale for figure, error, stale in results)
+    assert len(pool._last_good) == 1
+    assert pool.timeouts == 0
+
+
+def test_unknown_renderer_reports_error(pool):
+    figure, error, stale = pool.render("no-such-renderer", "story", "slot")
+    assert figure is None and not stale
+    assert "no-such-renderer" in error
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from src.search_index import SentenceIndex, bigram_terms, sentence_spans
+
+TEXTS = [
+    "교육 격차가 커졌다. 지역별 사교육비 차이도 컸다. 교육 격차 해소가 과제다.",
+    "이주민 인구가 늘었다. 다문화 가정의 교육 지원이 필요하다.",
+    "정치 효능감은 낮아졌다.",
+]
+
+
+def _brute_force(texts, grams, docs):
+    grams = set(grams)
+    best = {}
+    for doc_index in docs:
+        text = texts[doc_index]
+        for sentence, (start, end) in enumerate(sentence_spans(text)):
+            count = len(grams & set(bigram_terms(text[start:end])))
+            current = best.get(doc_index)
+            if count and (current is None or count > current[1]):
+                best[doc_index] = (sentence, count)
+    return best
+
+
+def test_best_sentences_matches_brute_force():
+    index = SentenceIndex.build(TEXTS, bigram_terms)
+    for query in ("교육 격차", "이주민 교육", "사교육비", "없는말"):
+        grams = bigram_terms(query)
+        assert index.best_sentences(grams, [0, 1, 2]) == _brute_force(TEXTS, grams, [0, 1, 2])
+    # Only the requested documents are looked at.
+    assert set(index.best_sentences(bigram_terms("교육"), [1])) == {1}
+    assert index.best_sentences(bigram_terms("교육"), [7]) == {}
+
+
+def test_replace_only_changes_the_edited_document(tmp_path):
+    index = SentenceIndex.build(TEXTS, bigram_terms, signature="v1")
+    untouched = index.postings[0]
+    edited = list(TEXTS)
+    edited[1] = "정치 참여가 늘었다. 이주민 정치 참여도 늘었다."
+
+    index.replace(1, edited[1], bigram_terms)
+
+    assert index.postings[0] is untouched
+    grams = bigram_terms("이주민 정치")
+    assert index.best_sentences(grams, [0, 1, 2]) == _brute_force(edited, grams, [0, 1, 2])
+    assert index.span(1, 1) == next(span for i, span in enumerate(sentence_spans(edited[1])) if i == 1)
+
+    index.save(tmp_path / "sentences.json")
+    loaded = SentenceIndex.load(tmp_path / "sentences.json", "v1")
+    assert loaded.postings == index.postings and loaded.offsets == index.offsets
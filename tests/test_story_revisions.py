@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from src.story_revisions import KEYFRAME_INTERVAL, JsonlRevisionLog, build_record, reconstruct
+
+
+def _write_history(log: JsonlRevisionLog, slug: str, count: int) -> list:
+    bodies = []
+    previous = None
+    for rev in range(1, count + 1):
+        body = "".join(f"line {line} of rev {rev if line % 3 == 0 else 0}\n" for line in range(rev % 7 + 3))
+        log.append(slug, build_record(rev, {"title": f"rev {rev}", "markdown": body}, previous))
+        bodies.append(body)
+        previous = body
+    return bodies
+
+
+def test_chain_reconstructs_every_revision(tmp_path):
+    log = JsonlRevisionLog(tmp_path)
+    bodies = _write_history(log, "story", 3 * KEYFRAME_INTERVAL + 5)
+
+    for rev, body in enumerate(bodies, start=1):
+        chain = log.chain("story", rev)
+        assert chain[0]["kind"] == "key"
+        assert len(chain) <= KEYFRAME_INTERVAL
+        assert reconstruct(chain)["markdown"] == body
+    assert reconstruct(log.chain("story"))["markdown"] == bodies[-1]
+    assert log.chain("story", len(bodies) + 1) == []
+    assert log.chain("missing") == []
+
+
+def test_chain_sees_appends_and_skips_torn_lines(tmp_path):
+    log = JsonlRevisionLog(tmp_path)
+    bodies = _write_history(log, "story", 5)
+    assert log.chain("story")[-1]["rev"] == 5
+
+    log.append("story", build_record(6, {"markdown": "new body\n"}, bodies[-1]))
+    with (tmp_path / "story.jsonl").open("a", encoding="utf-8") as handle:
+        handle.write('{"rev":7,"kind":"del')
+
+    assert reconstruct(log.chain("story"))["markdown"] == "new body\n"
+    assert log.chain("story", 7) == []
+
+
+def test_append_after_torn_line(tmp_path):
+    log = JsonlRevisionLog(tmp_path)
+    bodies = _write_history(log, "story", 3)
+    log.chain("story")  # index built before the crash
+    with (tmp_path / "story.jsonl").open("a", encoding="utf-8") as handle:
+        handle.write('{"rev":4,"kind":"del')  # crash mid-append
+
+    log.append("story", build_record(4, {"markdown": "after crash\n"}, bodies[-1]))
+
+    for reader in (log, JsonlRevisionLog(tmp_path)):
+        assert [record["rev"] for record in reader.records("story")] == [1, 2, 3, 4]
+        assert reconstruct(reader.chain("story"))["markdown"] == "after crash\n"
+        assert reconstruct(reader.chain("story", 3))["markdown"] == bodies[-1]
+
+
+def test_undecodable_lines_are_skipped(tmp_path):
+    log = JsonlRevisionLog(tmp_path)
+    bodies = _write_history(log, "story", 2)
+    # A line glued together by a torn write before appends repaired the tail.
+    with (tmp_path / "story.jsonl").open("a", encoding="utf-8") as handle:
+        handle.write('{"rev":3,"kind":"del{"rev":3,"kind":"key"}\n')
+    log.append("story", build_record(3, {"markdown": "three\n"}, None))
+
+    assert [record["rev"] for record in log.records("story")] == [1, 2, 3]
+    assert reconstruct(log.chain("story"))["markdown"] == "three\n"
+    assert reconstruct(log.chain("story", 2))["markdown"] == bodies[-1]
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from src.story_render import normalise_placeholders
+from src.story_search import story_plain_text
+
+
+def test_normalise_placeholders():
+    assert normalise_placeholders("앞 &#123;&#123;chart&#125;&#125; 뒤") == "앞 {{chart}} 뒤"
+    assert normalise_placeholders("&lbrace;&lbrace;chart:fig-1&rbrace;&rbrace; &amp;") == "{{chart:fig-1}} &"
+
+
+def test_story_plain_text_drops_placeholders_and_markup():
+    markdown = "## 제목\n\n**굵은** [링크](https://example.com) &#123;&#123;chart:fig-1&#125;&#125; <b>끝</b>"
+    assert story_plain_text(markdown) == "제목 굵은 링크 끝"
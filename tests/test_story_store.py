@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from src.story_store import JournaledArchive, write_json_atomic
+
+
+def _archive(tmp_path, *, compact_bytes: int = 1 << 20) -> JournaledArchive:
+    snapshot = tmp_path / "stories.json"
+
+    def read_snapshot():
+        if not snapshot.exists():
+            return {"stories": {}}
+        return json.loads(snapshot.read_text(encoding="utf-8"))
+
+    return JournaledArchive(
+        snapshot,
+        tmp_path / "stories.journal.jsonl",
+        read_snapshot=read_snapshot,
+        write_snapshot=lambda payload: write_json_atomic(snapshot, payload, indent=None),
+        compact_bytes=compact_bytes,
+    )
+
+
+def _story(title: str) -> dict:
+    return {"title": title, "markdown": f"{title} 본문", "updated_at": "2025-01-01T00:00:00"}
+
+
+@pytest.mark.parametrize("warm", [False, True], ids=["cold-reader", "warm-reader"])
+def test_append_after_torn_tail(tmp_path, warm):
+    archive = _archive(tmp_path)
+    archive.append("x", _story("x"))
+    if warm:
+        archive.state()
+    with archive.journal_path.open("ab") as handle:
+        handle.write(b'{"op":"put","slug":"lost","story":{"ti')  # crash mid-write
+
+    archive.append("y", _story("y"))
+
+    assert sorted(archive.state()["stories"]) == ["x", "y"]
+    assert sorted(_archive(tmp_path).state()["stories"]) == ["x", "y"]
+    assert archive.journal_path.read_bytes().endswith(b"\n")
+
+
+def test_torn_line_is_not_read_until_repaired(tmp_path):
+    archive = _archive(tmp_path)
+    archive.append("x", _story("x"))
+    with archive.journal_path.open("ab") as handle:
+        handle.write(b'{"op":"put"')
+    assert sorted(_archive(tmp_path).state()["stories"]) == ["x"]
+
+
+def test_compaction_folds_journal_into_snapshot(tmp_path):
+    archive = _archive(tmp_path)
+    for index in range(5):
+        archive.append(f"s{index}", _story(f"v{index}"))
+    archive.append_many([("s0", _story("v0 수정")), ("s5", _story("v5"))])
+    before = archive.state()["stories"]
+
+    archive.compact()
+
+    assert not archive.journal_path.exists()
+    assert not archive.compacting_path.exists()
+    snapshot = json.loads(archive.snapshot_path.read_text(encoding="utf-8"))
+    assert snapshot["stories"] == before
+    assert archive.state()["stories"] == before
+
+    archive.append("s6", _story("v6"))
+    assert sorted(_archive(tmp_path).state()["stories"]) == [f"s{index}" for index in range(7)]
+    assert archive.state()["stories"]["s0"]["title"] == "v0 수정"
+
+
+def test_interrupted_compaction_is_resumed(tmp_path):
+    archive = _archive(tmp_path)
+    archive.append("a", _story("a"))
+    archive.journal_path.rename(archive.compacting_path)  # crash after the rename
+    archive.append("b", _story("b"))
+    assert sorted(_archive(tmp_path).state()["stories"]) == ["a", "b"]
+
+    archive.compact()
+
+    assert not archive.compacting_path.exists()
+    assert sorted(_archive(tmp_path).state()["stories"]) == ["a", "b"]
+
+
+def test_background_compaction_past_threshold(tmp_path):
+    archive = _archive(tmp_path, compact_bytes=256)
+    for index in range(10):
+        archive.append(f"s{index}", _story(f"v{index}"))
+    if archive._compactor is not None:
+        archive._compactor.join(10)
+    assert archive.snapshot_path.exists()
+    assert sorted(_archive(tmp_path).state()["stories"]) == sorted(f"s{index}" for index in range(10))
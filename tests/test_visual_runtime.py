@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import os
+
+from src import visual_runtime, visuals_common
+from src.visuals_education import education_care_fig15
+
+
+def test_image_figure_is_keyed_on_the_workbook_file(tmp_path, monkeypatch):
+    workbook = tmp_path / "book.xlsx"
+    workbook.write_bytes(b"image v1")
+    monkeypatch.setattr(visuals_common, "excel_data_path", lambda filename: workbook)
+
+    key = visual_runtime._cache_key("education_care_fig15", "story", "slot", education_care_fig15)
+    assert key is not None
+
+    # Replacing the embedded image rewrites the file but may leave every cell value alone.
+    workbook.write_bytes(b"image v2 with a new picture")
+    os.utime(workbook, ns=(1, 1))
+    assert visual_runtime._cache_key("education_care_fig15", "story", "slot", education_care_fig15) != key
+
+
+def test_undeclared_renderer_is_not_cached():
+    assert visual_runtime._cache_key("plain", "story", "slot", lambda slug, slot: None) is None
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import pytest
+
+pypdf = pytest.importorskip("pypdf")
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject  # noqa: E402
+
+from src.workspace_data import _page_hash  # noqa: E402
+
+
+def _stream(writer, data: bytes, **entries):
+    stream = DecodedStreamObject()
+    stream.set_data(data)
+    stream.update({NameObject(key): value for key, value in entries.items()})
+    return writer._add_object(stream)
+
+
+def _form_page(writer, text: bytes):
+    """A page whose only content draws the Form XObject ``/Fx``, which shows ``text``."""
+    form = _stream(writer, b"BT /F1 12 Tf (" + text + b") Tj ET", **{"/Type": NameObject("/XObject"), "/Subtype": NameObject("/Form")})
+    page = writer.add_blank_page(100, 100)
+    page[NameObject("/Contents")] = _stream(writer, b"/Fx Do")
+    page[NameObject("/Resources")] = DictionaryObject(
+        {NameObject("/XObject"): DictionaryObject({NameObject("/Fx"): form})}
+    )
+    return page
+
+
+def test_page_hash_covers_form_xobjects():
+    writer = pypdf.PdfWriter()
+    first = _form_page(writer, b"alpha")
+    second = _form_page(writer, b"beta")
+    same = _form_page(writer, b"alpha")
+
+    assert _page_hash(first) != _page_hash(second)
+    assert _page_hash(first) == _page_hash(same)